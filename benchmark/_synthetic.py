@@ -0,0 +1,124 @@
+"""
+_synthetic provides the generation of synthetic plugin trees used by the benchmarks.
+Every generated plugin is a python package containing an `extension.py` which defines
+a default `Description`.
+"""
+
+import random
+
+from pathlib import Path
+from typing import List, Sequence
+
+
+EXTENSION_TEMPLATE = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return object()
+
+
+description = Description(__name__, ctor)
+"""
+
+
+DAG_EXTENSION_TEMPLATE = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return object()
+
+
+description = Description(
+    __name__, ctor, {dependencies!r}, extension_id={extension_id!r}
+)
+"""
+
+DAG_SHAPES = ("chain", "fan", "sparse", "dense")
+
+
+def plugin_name(index: int) -> str:
+    """The name of the plugin package with the given index."""
+    return f"plugin_{index:06d}"
+
+
+def create_plugin_tree(
+    root: Path, count: int, template: str = EXTENSION_TEMPLATE
+) -> List[Path]:
+    """
+    Create count plugin packages directly within root.
+
+    Args:
+        root (Path): The directory in which the plugins are created.
+        count (int): The number of plugins to create.
+        template (str): The source of the `extension.py` of every plugin.
+
+    Returns:
+        List[Path]: The directories of the created plugins.
+    """
+    plugin_paths = []
+
+    for index in range(count):
+        plugin_path = root / plugin_name(index)
+        plugin_path.mkdir(parents=True)
+        (plugin_path / "__init__.py").touch()
+        (plugin_path / "extension.py").write_text(template)
+        plugin_paths.append(plugin_path)
+
+    return plugin_paths
+
+
+def create_dag(shape: str, count: int, seed: int = 0) -> List[List[int]]:
+    """
+    Create the dependencies of count plugins forming a DAG of the given shape. Plugins
+    only depend on plugins with a lower index, thus the graph never contains a cycle.
+
+    * "chain": every plugin depends on its predecessor.
+    * "fan": every plugin depends on the first plugin.
+    * "sparse": every plugin depends on up to 2 random predecessors.
+    * "dense": every plugin depends on up to 32 random predecessors.
+
+    Args:
+        shape (str): The shape of the DAG, one of DAG_SHAPES.
+        count (int): The number of plugins.
+        seed (int): The seed of the random shapes.
+
+    Returns:
+        List[List[int]]: The indices of the dependencies of each plugin.
+    """
+    generator = random.Random(seed)
+    random_degree = {"sparse": 2, "dense": 32}
+
+    if shape == "chain":
+        return [[index - 1] if index else [] for index in range(count)]
+    if shape == "fan":
+        return [[0] if index else [] for index in range(count)]
+    if shape in random_degree:
+        return [
+            sorted(generator.sample(range(index), min(index, random_degree[shape])))
+            for index in range(count)
+        ]
+    raise ValueError(f"Unknown DAG shape '{shape}'.")
+
+
+def create_dag_plugin_tree(root: Path, dependencies: Sequence[Sequence[int]]) -> None:
+    """
+    Create a plugin package directly within root for every entry of dependencies, with
+    explicit extension ids and literal dependencies.
+
+    Args:
+        root (Path): The directory in which the plugins are created.
+        dependencies (Sequence[Sequence[int]]):
+            The indices of the dependencies of each plugin, see create_dag.
+    """
+    for index, plugin_dependencies in enumerate(dependencies):
+        plugin_path = root / plugin_name(index)
+        plugin_path.mkdir(parents=True)
+        (plugin_path / "__init__.py").touch()
+        (plugin_path / "extension.py").write_text(
+            DAG_EXTENSION_TEMPLATE.format(
+                extension_id=plugin_name(index),
+                dependencies=[plugin_name(d) for d in plugin_dependencies],
+            )
+        )
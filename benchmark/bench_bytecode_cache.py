@@ -0,0 +1,131 @@
+"""
+bench_bytecode_cache compares cold starts loading a read-only synthetic plugin tree
+without a bytecode cache, which compiles every extension from source, with cold starts
+using the dedicated bytecode cache of the DefaultDescriptionResolver.
+
+Every start runs in a fresh interpreter, thus nothing is reused in between starts
+besides the files within the bytecode cache. The default `__pycache__` directories are
+disabled with PYTHONDONTWRITEBYTECODE, emulating a plugin tree which is not writable.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+from ._synthetic import EXTENSION_TEMPLATE, create_plugin_tree
+
+
+FUNCTION_TEMPLATE = """
+
+def helper_{index}(values):
+    result = {{}}
+    for key, value in enumerate(values):
+        if key % 3 == 0 and isinstance(value, (int, float)):
+            result[key] = [value * {index}, str(value), {{"index": {index}}}]
+        elif key % 3 == 1:
+            result[key] = tuple(v for v in values if v != value)
+        else:
+            result[key] = f"{{key}}-{{value}}-{index}"
+    return result
+"""
+
+
+def create_extension_source(functions: int) -> str:
+    return EXTENSION_TEMPLATE + "".join(
+        FUNCTION_TEMPLATE.format(index=index) for index in range(functions)
+    )
+
+
+def load(plugins_path: Path, cache_path: str, validation: str) -> None:
+    loader = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver(
+                bytecode_cache=Path(cache_path) if cache_path else None,
+                bytecode_validation=validation,
+            )
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(*plugins_path.iterdir())
+        .build()
+    )
+
+    start = time.perf_counter()
+    descriptions = loader.load_extension_descriptions()
+    duration = time.perf_counter() - start
+
+    print(f"{duration} {len(descriptions)}")
+
+
+def time_cold_start(plugins_path: Path, cache_path: str, validation: str) -> float:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmark.bench_bytecode_cache",
+            "--child",
+            str(plugins_path),
+            cache_path,
+            validation,
+        ],
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.split()[0])
+
+
+def main() -> None:
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        load(Path(sys.argv[2]), sys.argv[3], sys.argv[4])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=500)
+    parser.add_argument("--functions", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plugins_path = Path(directory) / "plugins"
+        create_plugin_tree(
+            plugins_path, args.plugins, create_extension_source(args.functions)
+        )
+
+        print(
+            f"plugins: {args.plugins}, functions per extension: {args.functions}, "
+            f"best of {args.repeat} cold starts"
+        )
+
+        baseline = min(
+            time_cold_start(plugins_path, "", "timestamp") for _ in range(args.repeat)
+        )
+        print(f"{'no bytecode cache':>26}: {baseline * 1000:9.1f}ms")
+
+        for validation in ("timestamp", "checked-hash"):
+            cache_path = str(Path(directory) / f"bytecode-{validation}")
+            populate = time_cold_start(plugins_path, cache_path, validation)
+            duration = min(
+                time_cold_start(plugins_path, cache_path, validation)
+                for _ in range(args.repeat)
+            )
+            print(
+                f"{validation + ' (populate)':>26}: {populate * 1000:9.1f}ms\n"
+                f"{validation + ' (cached)':>26}: {duration * 1000:9.1f}ms "
+                f"(speedup {baseline / duration:5.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
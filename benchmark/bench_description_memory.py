@@ -0,0 +1,89 @@
+"""
+bench_description_memory compares the memory of large numbers of DefaultDescriptions
+with CompactDescriptions, including their resolved dependencies, and the peak memory
+of ordering them.
+
+Every identifier is created as a separate string, as happens when the descriptions are
+defined in separate extension modules.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from typing import Any, Callable, List
+
+from sbe.eggstensibility import defaults
+
+from ._synthetic import DAG_SHAPES, create_dag, plugin_name
+
+
+def ctor() -> object:
+    return object()
+
+
+def create_descriptions(
+    description_type: Callable[..., Any], dependencies: List[List[int]]
+) -> List[Any]:
+    return [
+        description_type(
+            f"sbe.eggstensibility.external.{plugin_name(index)}.extension",
+            ctor,
+            # Identifiers are formatted anew for every description.
+            [plugin_name(dependency) for dependency in node_dependencies],
+            extension_id=plugin_name(index),
+        )
+        for index, node_dependencies in enumerate(dependencies)
+    ]
+
+
+def measure(description_type: Callable[..., Any], dependencies: List[List[int]]):
+    gc.collect()
+    tracemalloc.start()
+
+    descriptions = create_descriptions(description_type, dependencies)
+    for description in descriptions:
+        list(description.dependencies)
+    retained, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    order_operation = defaults.OrderExtensionDescriptions(
+        defaults.ResolveIdentifier(), defaults.ResolveDependency()
+    )
+    ordered = list(order_operation(descriptions))
+    _, peak = tracemalloc.get_traced_memory()
+    order_peak = peak - retained
+
+    del descriptions, ordered
+    gc.collect()
+    leaked, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return retained, order_peak, leaked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=100_000)
+    parser.add_argument("--shape", choices=DAG_SHAPES, default="sparse")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dependencies = create_dag(args.shape, args.descriptions, args.seed)
+    print(
+        f"descriptions: {args.descriptions}, shape: {args.shape}, "
+        f"edges: {sum(map(len, dependencies))}"
+    )
+
+    for description_type in (defaults.Description, defaults.CompactDescription):
+        retained, order_peak, leaked = measure(description_type, dependencies)
+        print(
+            f"{description_type.__name__:>20}: "
+            f"descriptions {retained / 2**20:7.1f}MiB, "
+            f"ordering peak {order_peak / 2**20:7.1f}MiB, "
+            f"retained after release {leaked / 2**20:7.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+bench_filesystem_cache counts the stat calls and measures the duration of resolving a
+synthetic plugin tree with several overlapping module resolvers, with and without the
+file system cache of a load, and counts the modules passed to the description resolver.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Tuple
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+from sbe.eggstensibility._internal.filesystem import filesystem_cache
+
+from ._synthetic import create_plugin_tree
+
+
+_STAT_FUNCTIONS = (os.stat, os.lstat)
+
+
+def count_stats(function: Callable[[], Any]) -> int:
+    # Profiling observes the stat calls of pathlib, which holds its own references to
+    # the stat functions.
+    calls = 0
+
+    def profile(frame: Any, event: str, arg: Any) -> None:
+        nonlocal calls
+        if event == "c_call" and arg in _STAT_FUNCTIONS:
+            calls += 1
+
+    sys.setprofile(profile)
+    try:
+        function()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def measure(function: Callable[[], Any]) -> Tuple[int, float]:
+    stats = count_stats(function)
+    start = time.perf_counter()
+    function()
+    return stats, time.perf_counter() - start
+
+
+def resolve(resolvers: List[Any], harvest_paths: List[Path]) -> None:
+    for path in harvest_paths:
+        for resolver in resolvers:
+            list(resolver(path))
+
+
+class CountingDescriptionResolver:
+    def __init__(self) -> None:
+        self.modules = 0
+
+    def __call__(self, module_paths: Iterable[Path]) -> List[Path]:
+        module_paths = list(module_paths)
+        self.modules += len(module_paths)
+        return module_paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=3000)
+    parser.add_argument("--resolvers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plugin_paths = create_plugin_tree(Path(directory), args.plugins)
+        print(f"plugins: {args.plugins}")
+
+        for count in args.resolvers:
+            resolvers = [
+                defaults.DirectoryModuleResolver("extension.py") for _ in range(count)
+            ]
+
+            uncached, uncached_duration = measure(
+                lambda: resolve(resolvers, plugin_paths)
+            )
+
+            def resolve_cached() -> None:
+                with filesystem_cache():
+                    resolve(resolvers, plugin_paths)
+
+            cached, cached_duration = measure(resolve_cached)
+
+            description_resolver = CountingDescriptionResolver()
+            builder = eggstensibility.construct_builder()
+            for resolver in resolvers:
+                builder.add_module_resolver(resolver)
+            builder.add_description_resolver(description_resolver)
+            builder.configure_identifier_resolver(lambda description: description)
+            builder.configure_dependency_resolver(lambda description: [])
+            builder.add_harvest_path(
+                *plugin_paths
+            ).build().load_extension_descriptions()
+
+            print(
+                f"resolvers {count}: "
+                f"uncached {uncached / args.plugins:5.1f} stats/plugin "
+                f"in {uncached_duration * 1000:7.1f}ms, "
+                f"cached {cached / args.plugins:5.1f} stats/plugin "
+                f"in {cached_duration * 1000:7.1f}ms, "
+                f"described modules {description_resolver.modules}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+bench_harvest compares a sequential harvest of a synthetic plugin tree with concurrent
+harvests configured through `Builder.configure_harvest_concurrency`.
+
+Local filesystems answer stat calls from memory, which hides the latency of the network
+mounted trees the concurrent harvest is meant for. The `--latency-ms` option emulates
+such a filesystem by delaying every module resolver call.
+"""
+
+import argparse
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Iterable, List
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+from ._synthetic import create_plugin_tree
+
+
+class LatentModuleResolver:
+    def __init__(self, latency: float) -> None:
+        self._resolver = defaults.DirectoryModuleResolver("extension.py")
+        self._latency = latency
+
+    def __call__(self, path: Path) -> Iterable[Path]:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._resolver(path)
+
+
+def time_harvest(plugin_paths: List[Path], latency: float, concurrency: int) -> float:
+    loader = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(LatentModuleResolver(latency))
+        .add_description_resolver(lambda module_paths: list(module_paths))
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: [])
+        .configure_harvest_concurrency(concurrency)
+        .add_harvest_path(*plugin_paths)
+        .build()
+    )
+
+    start = time.perf_counter()
+    module_paths = loader.load_extension_descriptions()
+    duration = time.perf_counter() - start
+
+    assert len(module_paths) == len(plugin_paths)
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plugin_paths = create_plugin_tree(Path(directory), args.plugins)
+        latency = args.latency_ms / 1000.0
+
+        print(f"plugins: {args.plugins}, latency per resolver call: {args.latency_ms}ms")
+
+        baseline = None
+        for concurrency in args.concurrency:
+            duration = time_harvest(plugin_paths, latency, concurrency)
+            baseline = baseline if baseline is not None else duration
+            print(
+                f"concurrency {concurrency:>3}: {duration * 1000:9.1f}ms "
+                f"(speedup {baseline / duration:5.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
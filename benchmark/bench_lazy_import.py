@@ -0,0 +1,99 @@
+"""
+bench_lazy_import compares the startup time of loading plugins with expensive imports
+eagerly with the lazy mode of the DescriptionResolver, and the time of constructing a
+fraction of their extensions afterwards.
+
+The extension module of every plugin imports an expensive submodule of its package,
+which is only used within the constructor of the extension. Note that importing the
+submodule executes the `__init__.py` of the package, thus only packages of which no
+submodule is imported at the top level have their `__init__.py` deferred as well.
+"""
+
+import argparse
+import tempfile
+import time
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+from ._synthetic import create_plugin_tree
+
+
+EXPENSIVE_SOURCE = """\
+VALUE = sum(i * i for i in range({cost}))
+"""
+
+EXTENSION_TEMPLATE = """\
+from sbe.eggstensibility.defaults import Description
+
+from . import heavy
+
+
+def ctor():
+    return heavy.VALUE
+
+
+description = Description(__name__, ctor)
+"""
+
+
+def create_plugins(root: Path, count: int, cost: int) -> None:
+    for plugin_path in create_plugin_tree(root, count, EXTENSION_TEMPLATE):
+        (plugin_path / "heavy.py").write_text(EXPENSIVE_SOURCE.format(cost=cost))
+
+
+def measure(plugins_path: Path, lazy: bool, construct: float) -> None:
+    registry = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver(
+                external_namespace=f"bench_lazy_import_{lazy}", lazy=lazy
+            )
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(*sorted(plugins_path.iterdir()))
+        .build()
+    )
+
+    start = time.perf_counter()
+    extensions = registry.load_extension_registry()
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    constructed = list(extensions)[: int(len(extensions) * construct)]
+    for extension_id in constructed:
+        extensions[extension_id]
+    construction = time.perf_counter() - start
+
+    print(
+        f"{'lazy' if lazy else 'eager':>5}: startup {startup * 1000:8.1f}ms, "
+        f"constructing {len(constructed)} extensions {construction * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=200)
+    parser.add_argument(
+        "--cost", type=int, default=20_000, help="Iterations of each expensive module"
+    )
+    parser.add_argument(
+        "--construct", type=float, default=0.1, help="Fraction of extensions to create"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plugins_path = Path(directory)
+        create_plugins(plugins_path, args.plugins, args.cost)
+
+        for lazy in (False, True):
+            measure(plugins_path, lazy, args.construct)
+
+
+if __name__ == "__main__":
+    main()
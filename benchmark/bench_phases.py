@@ -0,0 +1,164 @@
+"""
+bench_phases times the phases of loading synthetic plugin trees of configurable size
+and DAG shape: harvesting the modules, retrieving their descriptions and ordering the
+descriptions. The phases are observed through the LoaderEvents of a load, which is
+timed without tracing, and then repeated with tracemalloc to record the peak memory
+of each phase.
+
+The results are emitted as JSON, such that they can be compared in between versions,
+e.g. `python -m benchmark.bench_phases --output before.json`.
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+from ._synthetic import DAG_SHAPES, create_dag, create_dag_plugin_tree
+
+
+_namespaces = itertools.count()
+
+_PHASES = ("harvest", "retrieve", "order")
+
+
+class PhaseRecorder:
+    """
+    PhaseRecorder observes the phases of a load, recording their durations and, while
+    tracemalloc is tracing, the peak memory of each phase.
+    """
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+        self.peak_memory: Dict[str, int] = {}
+
+    def __call__(self, event: "eggstensibility.LoaderEvent") -> None:
+        self.durations[event.phase] = event.duration
+        if tracemalloc.is_tracing():
+            # The phases run sequentially, thus the peak since the preceding event is
+            # the peak of this phase.
+            _, self.peak_memory[event.phase] = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+
+def create_loader(plugin_paths: List[Path], observer: PhaseRecorder) -> Any:
+    # Every load uses a fresh namespace, such that no module is reused from a
+    # preceding load through sys.modules.
+    namespace = f"sbe.eggstensibility.bench_phases_{next(_namespaces)}"
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver(external_namespace=namespace)
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_observer(observer)
+        .add_harvest_path(*plugin_paths)
+        .build()
+    )
+
+
+def run_phases(plugin_paths: List[Path], trace_memory: bool) -> PhaseRecorder:
+    recorder = PhaseRecorder()
+    loader = create_loader(plugin_paths, recorder)
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        descriptions = loader.load_extension_descriptions()
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    assert len(descriptions) == len(plugin_paths)
+    return recorder
+
+
+def benchmark(root: Path, shape: str, size: int, seed: int) -> Dict[str, Any]:
+    dependencies = create_dag(shape, size, seed)
+    tree_path = root / f"{shape}-{size}"
+    create_dag_plugin_tree(tree_path, dependencies)
+    plugin_paths = sorted(tree_path.iterdir())
+
+    durations = run_phases(plugin_paths, trace_memory=False).durations
+    peak_memory = run_phases(plugin_paths, trace_memory=True).peak_memory
+
+    return {
+        "shape": shape,
+        "size": size,
+        "edges": sum(map(len, dependencies)),
+        "phases": {
+            phase: {
+                "seconds": durations[phase],
+                "peak_memory_bytes": peak_memory[phase],
+            }
+            for phase in _PHASES
+        },
+    }
+
+
+def revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--shapes", choices=DAG_SHAPES, nargs="+", default=DAG_SHAPES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            for shape in args.shapes:
+                result = benchmark(Path(directory), shape, size, args.seed)
+                results.append(result)
+                print(
+                    f"{shape:>6} {size:>6}: "
+                    + ", ".join(
+                        f"{phase} {measurement['seconds'] * 1000:8.1f}ms"
+                        for phase, measurement in result["phases"].items()
+                    ),
+                    file=sys.stderr,
+                )
+
+    report = json.dumps(
+        {
+            "revision": revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
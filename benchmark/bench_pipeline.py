@@ -0,0 +1,65 @@
+"""
+bench_pipeline compares the throughput of feeding messages through a chain of
+extensions one call at a time with the batched Pipeline, for extensions which only
+define `execute` and extensions which also define `execute_batch`.
+"""
+
+import argparse
+import time
+
+from typing import Any, Iterable, List
+
+from sbe import eggstensibility
+
+
+class Extension:
+    def execute(self, msg: str) -> str:
+        return msg
+
+
+class BatchExtension(Extension):
+    def execute_batch(self, messages: List[str]) -> List[str]:
+        return messages
+
+
+def per_message(extensions: List[Any], messages: Iterable[str]) -> int:
+    count = 0
+    for msg in messages:
+        for extension in extensions:
+            msg = extension.execute(msg)
+        count += 1
+    return count
+
+
+def measure(label: str, run) -> None:
+    start = time.perf_counter()
+    count = run()
+    duration = time.perf_counter() - start
+    print(f"{label:>32}: {count / duration / 1e6:6.2f}M messages/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--extensions", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    messages = ["message"] * args.messages
+
+    for extension_type in (Extension, BatchExtension):
+        extensions = [extension_type() for _ in range(args.extensions)]
+        pipeline = eggstensibility.Pipeline(extensions, args.batch_size)
+
+        measure(
+            f"{extension_type.__name__} per message",
+            lambda: per_message(extensions, messages),
+        )
+        measure(
+            f"{extension_type.__name__} pipeline",
+            lambda: sum(1 for _ in pipeline(messages)),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+bench_resolver_calls counts the identifier and dependency resolver invocations of
+ordering synthetic description graphs, and measures the duration of ordering them with
+resolvers of a configurable cost, e.g. resolvers reading attributes through a proxy.
+"""
+
+import argparse
+import time
+
+from typing import Any, List
+
+from sbe.eggstensibility import defaults
+
+from ._synthetic import DAG_SHAPES, create_dag, plugin_name
+
+
+def ctor() -> object:
+    return object()
+
+
+class CountingResolver:
+    def __init__(self, resolver: Any, cost: int) -> None:
+        self._resolver = resolver
+        self._cost = cost
+        self.calls = 0
+
+    def __call__(self, description: Any) -> Any:
+        self.calls += 1
+        # Simulate resolvers which are more expensive than an attribute access.
+        for _ in range(self._cost):
+            pass
+        return self._resolver(description)
+
+
+def create_descriptions(dependencies: List[List[int]]) -> List[Any]:
+    return [
+        defaults.Description(
+            plugin_name(index),
+            ctor,
+            [plugin_name(dependency) for dependency in node_dependencies],
+            extension_id=plugin_name(index),
+        )
+        for index, node_dependencies in enumerate(dependencies)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=10_000)
+    parser.add_argument("--shapes", nargs="+", choices=DAG_SHAPES, default=DAG_SHAPES)
+    parser.add_argument(
+        "--cost", type=int, default=100, help="Iterations spent in each resolver call"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for shape in args.shapes:
+        descriptions = create_descriptions(
+            create_dag(shape, args.descriptions, args.seed)
+        )
+        identifier_resolver = CountingResolver(defaults.ResolveIdentifier(), args.cost)
+        dependency_resolver = CountingResolver(defaults.ResolveDependency(), args.cost)
+        order_operation = defaults.OrderExtensionDescriptions(
+            identifier_resolver, dependency_resolver
+        )
+
+        start = time.perf_counter()
+        list(order_operation(descriptions))
+        duration = time.perf_counter() - start
+
+        print(
+            f"{shape:>6}: {len(descriptions)} descriptions, "
+            f"identifier calls {identifier_resolver.calls / len(descriptions):.1f}"
+            f"/description, "
+            f"dependency calls {dependency_resolver.calls / len(descriptions):.1f}"
+            f"/description, ordered in {duration * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
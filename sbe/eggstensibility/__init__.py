@@ -1,15 +1,73 @@
 """
 sbe.eggstensibility provides the tools to create arbitrary plug-in
 loading. It is designed to be configurable users as a builder pattern.
+
+The public API is imported lazily upon first access, such that importing
+sbe.eggstensibility itself does not pay for any functionality that is not used.
 """
 
-# Public API redefinitions.
-from . import exceptions as exceptions
-from . import defaults as defaults
-from . import protocols as protocols
+import importlib
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    # Public API redefinitions.
+    from . import exceptions as exceptions
+    from . import defaults as defaults
+    from . import protocols as protocols
+
+    from ._internal.builder import (
+        Builder as Builder,
+        construct_builder as construct_builder,
+    )
+    from ._internal.construct import ConstructExtensions as ConstructExtensions
+    from ._internal.graph import ExtensionGraph as ExtensionGraph
+    from ._internal.metrics import LoaderEvent as LoaderEvent
+    from ._internal.profile import ExtensionProfiler as ExtensionProfiler
+    from ._internal.order import (
+        OrderedDescriptions as OrderedDescriptions,
+        OrderExtensionDescriptions as OrderExtensionDescriptions,
+    )
+    from ._internal.registry import ExtensionRegistry as ExtensionRegistry
+    from ._internal.prefork import PreforkRegistry as PreforkRegistry
+    from ._internal.pipeline import Pipeline as Pipeline
+    from ._internal.host import (
+        ExtensionHost as ExtensionHost,
+        HostCall as HostCall,
+    )
+
+
+_LAZY_SUBMODULES = {"exceptions", "defaults", "protocols"}
+
+# Maps each public attribute onto the (relative) module defining it.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "Builder": "._internal.builder",
+    "construct_builder": "._internal.builder",
+    "OrderExtensionDescriptions": "._internal.order",
+    "OrderedDescriptions": "._internal.order",
+    "ExtensionRegistry": "._internal.registry",
+    "PreforkRegistry": "._internal.prefork",
+    "Pipeline": "._internal.pipeline",
+    "ExtensionHost": "._internal.host",
+    "HostCall": "._internal.host",
+    "ConstructExtensions": "._internal.construct",
+    "ExtensionGraph": "._internal.graph",
+    "LoaderEvent": "._internal.metrics",
+    "ExtensionProfiler": "._internal.profile",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    if (module_name := _LAZY_ATTRIBUTES.get(name)) is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-from ._internal.builder import (
-    Builder as Builder,
-    construct_builder as construct_builder,
-)
-from ._internal.order import OrderExtensionDescriptions as OrderExtensionDescriptions
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRIBUTES))
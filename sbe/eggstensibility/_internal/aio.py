@@ -0,0 +1,217 @@
+"""
+sbe.eggstensibility.aio provides the asyncio-native loader, which keeps the filesystem
+and import work of loading extensions off the event loop and constructs independent
+extensions concurrently.
+"""
+
+import asyncio
+import inspect
+
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+from sbe.eggstensibility import exceptions
+
+from .order import ResolveDependency, ResolveIdentifier, group_dependency_levels
+from .registry import ExtensionFactory
+
+
+AsyncLoaderDescriptionT = TypeVar("AsyncLoaderDescriptionT", covariant=True)
+AsyncLoaderDescriptionIdentifierT = TypeVar(
+    "AsyncLoaderDescriptionIdentifierT", contravariant=True
+)
+
+
+class AsyncLoader(
+    Protocol, Generic[AsyncLoaderDescriptionT, AsyncLoaderDescriptionIdentifierT]
+):
+    """The asyncio-native Loader created with `Builder.build_async`."""
+
+    async def load_extension_descriptions(
+        self, targets: Optional[Iterable[AsyncLoaderDescriptionIdentifierT]] = None
+    ) -> Sequence[AsyncLoaderDescriptionT]:
+        """
+        Load and return an ordered list of the descriptions describing the extensions.
+
+        The harvesting, loading and ordering of the descriptions runs on a worker
+        thread, thus the event loop is not blocked. See
+        `Loader.load_extension_descriptions`.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all.
+
+        Returns:
+            Sequence[DescriptionT]: The descriptions ordered by their dependencies.
+        """
+
+    async def construct_extensions(
+        self, descriptions: Iterable[Any], max_concurrency: int = 16
+    ) -> Dict[Any, Any]:
+        """
+        Construct the extensions of the ordered descriptions.
+
+        Each extension is constructed once all of its dependencies have been
+        constructed, independent extensions are constructed concurrently. The
+        configured ExtensionFactory is invoked on a worker thread, and if it returns
+        an awaitable, e.g. because the description has an async constructor, the
+        awaitable is awaited on the event loop.
+
+        Args:
+            descriptions (Iterable[DescriptionT]):
+                The descriptions, ordered based upon their dependencies.
+            max_concurrency (int):
+                The maximum number of extensions constructed at the same time, should
+                be at least one.
+
+        Returns:
+            Dict[DescriptionIdentifierT, Any]:
+                The constructed extensions by identifier, in the order of the
+                descriptions.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when no ExtensionFactory has been configured.
+            MissingDependencyException:
+                Thrown when a description depends on an identifier which does not
+                precede it in the descriptions, before any extension is constructed.
+            ValueError: Thrown when max_concurrency is smaller than one.
+        """
+
+    async def load_extensions(
+        self,
+        targets: Optional[Iterable[AsyncLoaderDescriptionIdentifierT]] = None,
+        max_concurrency: int = 16,
+    ) -> Dict[Any, Any]:
+        """
+        Load the descriptions and construct their extensions.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all.
+            max_concurrency (int):
+                The maximum number of extensions constructed at the same time, should
+                be at least one.
+
+        Returns:
+            Dict[DescriptionIdentifierT, Any]:
+                The constructed extensions by identifier, ordered by their dependencies.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when no ExtensionFactory has been configured.
+            ValueError: Thrown when max_concurrency is smaller than one.
+        """
+
+
+class _SyncLoader(
+    Protocol, Generic[AsyncLoaderDescriptionT, AsyncLoaderDescriptionIdentifierT]
+):
+    def load_extension_descriptions(
+        self, targets: Optional[Iterable[AsyncLoaderDescriptionIdentifierT]] = None
+    ) -> Iterable[AsyncLoaderDescriptionT]: ...
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    # A semaphore without any slots never constructs an extension.
+    if max_concurrency < 1:
+        raise ValueError(
+            f"The maximum concurrency should be at least 1, got {max_concurrency}."
+        )
+
+
+class _AsyncLoader(Generic[DescriptionT, DescriptionIdentifierT]):
+    def __init__(
+        self,
+        loader: _SyncLoader[DescriptionT, DescriptionIdentifierT],
+        identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+        dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+        extension_factory: Optional[ExtensionFactory[DescriptionT, Any]],
+    ) -> None:
+        self._loader = loader
+        self._identifier_resolver = identifier_resolver
+        self._dependency_resolver = dependency_resolver
+        self._extension_factory = extension_factory
+
+    async def load_extension_descriptions(
+        self, targets: Optional[Iterable[DescriptionIdentifierT]] = None
+    ) -> Sequence[DescriptionT]:
+        selected_targets = list(targets) if targets is not None else None
+        return await asyncio.to_thread(
+            lambda: list(self._loader.load_extension_descriptions(selected_targets))
+        )
+
+    async def _construct_extension(
+        self,
+        extension_factory: ExtensionFactory[DescriptionT, Any],
+        description: DescriptionT,
+        dependency_tasks: Sequence[asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> Any:
+        await asyncio.gather(*dependency_tasks)
+
+        async with semaphore:
+            extension = await asyncio.to_thread(extension_factory, description)
+            if inspect.isawaitable(extension):
+                extension = await extension
+            return extension
+
+    async def construct_extensions(
+        self, descriptions: Iterable[DescriptionT], max_concurrency: int = 16
+    ) -> Dict[DescriptionIdentifierT, Any]:
+        if self._extension_factory is None:
+            raise exceptions.IncompleteLoaderConfigurationException(
+                f"No '{ExtensionFactory.__name__}' provided."
+            )
+        _validate_max_concurrency(max_concurrency)
+
+        # The dependencies are validated before any task is created, such that no task
+        # is left running when a dependency does not precede its dependent.
+        descriptions = list(descriptions)
+        group_dependency_levels(
+            descriptions, self._identifier_resolver, self._dependency_resolver
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: Dict[DescriptionIdentifierT, asyncio.Task] = {}
+
+        for description in descriptions:
+            dependency_tasks = [
+                tasks[dependency_id]
+                for dependency_id in self._dependency_resolver(description)
+            ]
+            tasks[self._identifier_resolver(description)] = asyncio.create_task(
+                self._construct_extension(
+                    self._extension_factory, description, dependency_tasks, semaphore
+                )
+            )
+
+        try:
+            extensions = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return dict(zip(tasks, extensions))
+
+    async def load_extensions(
+        self,
+        targets: Optional[Iterable[DescriptionIdentifierT]] = None,
+        max_concurrency: int = 16,
+    ) -> Dict[DescriptionIdentifierT, Any]:
+        _validate_max_concurrency(max_concurrency)
+        descriptions = await self.load_extension_descriptions(targets)
+        return await self.construct_extensions(descriptions, max_concurrency)
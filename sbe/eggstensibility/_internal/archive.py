@@ -0,0 +1,238 @@
+"""
+sbe.eggstensibility.archive provides the resolvers loading extensions directly from
+zip archives, such as wheels.
+"""
+
+import fnmatch
+import posixpath
+import zipfile
+import zipimport
+
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Optional, Sequence
+
+from sbe.eggstensibility._internal.bytecode import BytecodeValidation
+from sbe.eggstensibility._internal.filesystem import resolve_path
+from sbe.eggstensibility._internal.logging import IdentityLogger, Logger
+from sbe.eggstensibility._internal.resolver import (
+    DefaultDescriptionResolver,
+    DescriptionT,
+)
+
+
+ARCHIVE_SUFFIXES = (".zip", ".whl")
+
+
+def _archive_path(module_path: Path) -> Optional[Path]:
+    for parent in module_path.parents:
+        if parent.suffix in ARCHIVE_SUFFIXES and parent.is_file():
+            return parent
+    return None
+
+
+class DefaultArchiveModuleResolver:
+    """
+    DefaultArchiveModuleResolver resolves every module matching a glob pattern, e.g.
+    "extension.py", within a zip archive, such as a wheel. Similar to the
+    DefaultDirectoryModuleResolver, a module is only resolved if the directory
+    containing it within the archive is itself a python module.
+
+    Only the central directory of the archive is read, none of the contained files are
+    extracted. The resolved module paths are the path of the archive joined with the
+    path of the module within the archive, e.g. "plugins.zip/my_plugin/extension.py",
+    which can be loaded with the DefaultArchiveDescriptionResolver.
+
+    The following archive structure is expected:
+
+    <archive>.zip
+    ├─── <plug-in name>
+    │    ├─── __init__.py
+    │    ├─── <module matching pattern>
+    │    └─── ...
+    └─── <group>
+         └─── <plug-in name>
+              ├─── __init__.py
+              ├─── <module matching pattern>
+              └─── ...
+    """
+
+    def __init__(self, pattern: str = "extension.py"):
+        """
+        Create a new DefaultArchiveModuleResolver resolving modules matching pattern.
+
+        Args:
+            pattern (str):
+                The glob pattern the file names of the resolved modules should match.
+        """
+        self._pattern = pattern
+        self._logger: Logger = IdentityLogger()
+
+    def configure_logger(self, logger: Logger) -> None:
+        """
+        Configure the logger used to report archives which cannot be read.
+
+        Args:
+            logger (Logger): The logger to use.
+        """
+        self._logger = logger
+
+    def _read_names(self, archive_path: Path) -> Sequence[str]:
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                return archive.namelist()
+        except (OSError, zipfile.BadZipFile) as e:
+            self._logger.warning(f"Unable to read archive '{archive_path}': {e}")
+            return []
+
+    def _is_resolved_name(self, name: str, names: set) -> bool:
+        directory, file_name = posixpath.split(name)
+        return (
+            bool(directory)
+            and fnmatch.fnmatch(file_name, self._pattern)
+            and posixpath.join(directory, "__init__.py") in names
+            and not any(
+                part.startswith(".") or part == "__pycache__"
+                for part in directory.split("/")
+            )
+        )
+
+    def __call__(self, archive_path: Path) -> Iterable[Path]:
+        """
+        Resolve the modules contained in the archive at archive_path.
+
+        Args:
+            archive_path (Path): The zip archive to resolve the paths from
+
+        Returns:
+            Iterable[Path]: The collection of file paths describing the modules
+            with extension points.
+        """
+        if archive_path.suffix not in ARCHIVE_SUFFIXES:
+            return
+
+        resolved_archive_path = resolve_path(archive_path)
+        names = set(self._read_names(resolved_archive_path))
+
+        for name in sorted(names):
+            if self._is_resolved_name(name, names):
+                yield resolved_archive_path.joinpath(*PurePosixPath(name).parts)
+
+
+class DefaultArchiveDescriptionResolver(DefaultDescriptionResolver[DescriptionT]):
+    """
+    DefaultArchiveDescriptionResolver retrieves the DescriptionT of modules contained
+    in zip archives, as resolved by the DefaultArchiveModuleResolver, by importing them
+    with zipimport into the same external namespace as the DefaultDescriptionResolver.
+
+    The central directory of each archive is read once and shared with every zipimport
+    of the archive. Modules which are not contained in an archive are loaded identical
+    to the DefaultDescriptionResolver. Note that zipimport does not write bytecode, any
+    configured bytecode_cache only applies to modules outside of archives.
+    """
+
+    def __init__(
+        self,
+        description_variable="description",
+        external_namespace="sbe.eggstensibility.external",
+        bytecode_cache: Optional[Path] = None,
+        bytecode_validation: BytecodeValidation = "timestamp",
+        lazy: bool = False,
+    ):
+        """
+        Create a new DefaultArchiveDescriptionResolver with the given
+        description_variable.
+
+        Args:
+            description_variable (str):
+                The name of the variable in the module containing the extension description.
+            external_namespace (str):
+                The namespace under which to place the loaded modules.
+            bytecode_cache (Optional[Path]):
+                The writable directory in which the compiled code of the loaded modules
+                outside of archives is cached, see DefaultDescriptionResolver.
+            bytecode_validation (BytecodeValidation):
+                How the cached code in the bytecode_cache is validated, either
+                "timestamp" or "checked-hash".
+            lazy (bool):
+                Whether the parent packages of the extension modules and the
+                submodules they import are executed lazily, see
+                DefaultDescriptionResolver.
+
+        Exceptions:
+            ValueError: Thrown when the bytecode_validation is unknown.
+        """
+        super().__init__(
+            description_variable,
+            external_namespace,
+            bytecode_cache,
+            bytecode_validation,
+            lazy,
+        )
+
+    @staticmethod
+    def _find_archive_spec(importer_path: Path, name: str):
+        try:
+            return zipimport.zipimporter(str(importer_path)).find_spec(name)
+        except zipimport.ZipImportError:
+            return None
+
+    def _is_package_module(self, module_path: Path) -> bool:
+        if _archive_path(module_path) is None:
+            return super()._is_package_module(module_path)
+
+        spec = self._find_archive_spec(
+            module_path.parent.parent, module_path.parent.name
+        )
+        return spec is not None and spec.submodule_search_locations is not None
+
+    def _create_spec(self, namespace: str, path: Path):
+        if _archive_path(path) is None:
+            return super()._create_spec(namespace, path)
+
+        # zipimport locates modules by the last component of their name within the
+        # directory of the importer, packages by their `__init__.py`.
+        importer_path = (
+            path.parent.parent if path.name == "__init__.py" else path.parent
+        )
+        return self._find_archive_spec(importer_path, namespace)
+
+    def module_files(self, module_path: Path) -> Sequence[Path]:
+        """
+        Retrieve the source files of the module at module_path, i.e. the archive
+        containing the module, or the source files of DefaultDescriptionResolver for
+        modules outside of archives.
+
+        Args:
+            module_path (Path): The path to the extension module.
+
+        Returns:
+            Sequence[Path]: The paths of the source files, in sorted order.
+        """
+        if (archive_path := _archive_path(module_path)) is not None:
+            return [archive_path]
+        return super().module_files(module_path)
+
+    def invalidate(self, module_paths: Iterable[Path]) -> None:
+        """
+        Invalidate the initialized modules of the provided module_paths, such that they
+        are executed again upon the next resolution, and the cached central directories
+        of their archives.
+
+        Args:
+            module_paths (Iterable[Path]):
+                The paths to the modules to invalidate.
+        """
+        module_paths = list(module_paths)
+        archive_paths = {
+            archive_path
+            for module_path in module_paths
+            if (archive_path := _archive_path(module_path)) is not None
+        }
+
+        for archive_path in archive_paths:
+            try:
+                zipimport.zipimporter(str(archive_path)).invalidate_caches()
+            except zipimport.ZipImportError:
+                continue
+
+        super().invalidate(module_paths)
@@ -0,0 +1,66 @@
+"""
+sbe.eggstensibility.atomic provides the atomic writes of the files persisted by the
+loader, such as the harvest cache, load plans and cached bytecode.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+
+from pathlib import Path
+from typing import IO, Any, Callable
+
+
+def _atomic_write(path: Path, mode: str, write: Callable[[IO], object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file = tempfile.NamedTemporaryFile(
+        mode,
+        encoding="utf-8" if "b" not in mode else None,
+        dir=path.parent,
+        prefix=f"{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with temporary_file:
+            write(temporary_file)
+        os.replace(temporary_file.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temporary_file.name)
+        raise
+
+
+def atomic_write_json(path: Path, content: Any) -> None:
+    """
+    Write content as JSON to path, replacing any existing file atomically.
+
+    The content is written to a uniquely named temporary file next to path first, such
+    that concurrent writers, in the same or other processes and threads, never observe
+    a partially written file. The temporary file is removed if the write fails.
+
+    Args:
+        path (Path): The file to write.
+        content (Any): The JSON serializable content.
+
+    Exceptions:
+        TypeError: Thrown when the content cannot be serialized to JSON.
+        OSError: Thrown when the file cannot be written.
+    """
+    _atomic_write(path, "w", lambda file: json.dump(content, file))
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """
+    Write content to path, replacing any existing file atomically, see
+    `atomic_write_json`.
+
+    Args:
+        path (Path): The file to write.
+        content (bytes): The content.
+
+    Exceptions:
+        OSError: Thrown when the file cannot be written.
+    """
+    _atomic_write(path, "wb", lambda file: file.write(content))
@@ -5,32 +5,263 @@ of the eggstensibility library.
 
 from __future__ import annotations
 
+import contextvars
+import json
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generic, Iterable, List, Optional, Protocol, Sequence, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from sbe.eggstensibility import exceptions
 
-from .logging import Logger
-from .resolver import DescriptionResolver, ModuleResolver
-from .order import OrderExtensionDescriptions, ResolveIdentifier, ResolveDependency
+from .logging import IdentityLogger, Logger
+from .order import (
+    DefaultOrderingEngine,
+    IncrementalOrderExtensionDescriptions,
+    OrderedDescriptions,
+    OrderExtensionDescriptions,
+    OrderingEngine,
+    ResolveIdentifier,
+    ResolveDependency,
+    select_dependency_closure,
+)
+
+if TYPE_CHECKING:
+    # The modules of the optional features are only imported once they are used,
+    # e.g. asyncio once an asynchronous loader is built.
+    from .aio import AsyncLoader
+    from .cache import HarvestCache
+    from .filesystem import FileSystemCache
+    from .graph import ExtensionGraph
+    from .metrics import LoaderObserver
+    from .pipeline import Pipeline
+    from .plan import PlanEntry
+    from .prefork import PreforkRegistry
+    from .profile import ExtensionProfiler
+    from .registry import ExtensionFactory, ExtensionRegistry
+    from .reload import HotReloader
+    from .resolver import DescriptionResolver, ModuleResolver
 
 
 LoaderDescriptionT = TypeVar("LoaderDescriptionT", covariant=True)
-LoaderDescriptionIdentifierT = TypeVar("LoaderDescriptionIdentifierT", covariant=True)
+LoaderDescriptionIdentifierT = TypeVar(
+    "LoaderDescriptionIdentifierT", contravariant=True
+)
 
 
-class Loader(Protocol, Generic[LoaderDescriptionT]):
+class Loader(Protocol, Generic[LoaderDescriptionT, LoaderDescriptionIdentifierT]):
     """The Loader created with a Builder used to load all the extension descriptions."""
 
-    def load_extension_descriptions(self) -> Iterable[LoaderDescriptionT]:
+    def load_extension_descriptions(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> Iterable[LoaderDescriptionT]:
         """
         Load and return an ordered list of the descriptions describing the extensions.
 
         The descriptions are ordered based upon their dependencies. If they have no
         dependencies no guarantees are given about their order.
 
+        If targets are provided, only the descriptions of the targets and their
+        transitive dependencies are returned. Combined with a description resolver
+        which does not execute the extension modules, such as the
+        StaticDescriptionResolver, modules outside of this selection are never
+        executed.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all.
+
         Returns:
             Iterable[DescriptionT]: The descriptions ordered by their dependencies.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when a target or dependency is not available.
+        """
+
+    def stream_extension_descriptions(
+        self, harvest_paths: Optional[Iterable[Path]] = None
+    ) -> Iterator[LoaderDescriptionT]:
+        """
+        Load the descriptions describing the extensions incrementally, yielding each
+        description as soon as all of its dependencies have been yielded.
+
+        The harvest paths are consumed lazily, and each harvested module is loaded
+        before the next module is harvested, such that the first extensions can be
+        constructed before all modules are loaded. Only the descriptions waiting for
+        their dependencies are held in memory. The harvest cache is not used.
+
+        Args:
+            harvest_paths (Optional[Iterable[Path]]):
+                The (lazy) iterable of paths to harvest, or None to harvest the
+                configured harvest paths.
+
+        Returns:
+            Iterator[DescriptionT]: The descriptions ordered by their dependencies.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown after all other descriptions have been yielded, when
+                descriptions depend on unavailable descriptions.
+            CircularDependencyException:
+                Thrown after all other descriptions have been yielded, when the
+                remaining descriptions depend on each other.
+        """
+
+    def load_extension_registry(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> ExtensionRegistry:
+        """
+        Load the descriptions describing the extensions into an ExtensionRegistry.
+
+        The registry constructs each extension with the configured ExtensionFactory
+        upon first access, after constructing the extensions it depends on.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all. See
+                `load_extension_descriptions`.
+
+        Returns:
+            ExtensionRegistry: The registry of the loaded descriptions.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when no ExtensionFactory has been configured.
+        """
+
+    def load_pipeline(
+        self,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+        batch_size: int = 256,
+    ) -> Pipeline:
+        """
+        Load the descriptions, construct their extensions and create a Pipeline
+        feeding messages through the extensions in the order of the descriptions.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all. See
+                `load_extension_descriptions`.
+            batch_size (int): The maximum number of messages in a batch.
+
+        Returns:
+            Pipeline: The pipeline of the constructed extensions.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when no ExtensionFactory has been configured.
+            ValueError: Thrown when the batch_size is smaller than one.
+        """
+
+    def load_prefork_registry(
+        self,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+        fork_safe: Optional[Callable[[LoaderDescriptionT], bool]] = None,
+    ) -> PreforkRegistry:
+        """
+        Load the descriptions describing the extensions into a PreforkRegistry, for
+        servers which fork their worker processes after loading the extensions.
+
+        Loading the descriptions executes the extension modules in the current
+        process, unless a description resolver which defers their execution, such as
+        the StaticDescriptionResolver, is used. Calling `prepare_fork` on the registry
+        right before forking constructs the fork-safe extensions and freezes the
+        garbage collector, such that the modules and extensions are shared with the
+        forked processes.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all. See
+                `load_extension_descriptions`.
+            fork_safe (Optional[Callable[[DescriptionT], bool]]):
+                Whether the extension of a description can be constructed before
+                forking. If None, all extensions are constructed after forking.
+
+        Returns:
+            PreforkRegistry: The registry of the loaded descriptions.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when no ExtensionFactory has been configured.
+        """
+
+    def load_extension_graph(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> ExtensionGraph:
+        """
+        Load the descriptions describing the extensions into an ExtensionGraph.
+
+        The graph provides constant time lookups of descriptions, their positions,
+        generations, dependencies and dependents by identifier, and caches the
+        transitive dependencies and dependents of each queried identifier.
+
+        Args:
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all. See
+                `load_extension_descriptions`.
+
+        Returns:
+            ExtensionGraph: The dependency graph of the loaded descriptions.
+        """
+
+    def export_plan(
+        self,
+        path: Path,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+    ) -> None:
+        """
+        Load the descriptions and write the resulting load plan to path.
+
+        The plan contains, for each of the ordered descriptions, the path and namespace
+        of its module, the index of the description resolver which retrieved it, its
+        identifier and dependencies, and a fingerprint of the content of its module.
+        A loader built with `Builder.from_plan` loads the descriptions in the order of
+        the plan, without harvesting the harvest paths or ordering the descriptions.
+
+        The identifiers of the descriptions are stored as JSON, and should therefore be
+        strings or numbers.
+
+        Args:
+            path (Path): The file to write the plan to.
+            targets (Optional[Iterable[DescriptionIdentifierT]]):
+                The identifiers of the extensions to load, or None to load all. See
+                `load_extension_descriptions`.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when a target or dependency is not available.
+        """
+
+    def create_hot_reloader(self, poll_interval: float = 1.0) -> HotReloader:
+        """
+        Load the descriptions into a HotReloader, which reloads changed extension
+        modules and the modules depending on them.
+
+        The initial generation of descriptions is loaded synchronously. Polling in the
+        background starts once `start` is called on the reloader, or once it is
+        entered as a context manager.
+
+        Args:
+            poll_interval (float):
+                The number of seconds in between polling the extension modules.
+
+        Returns:
+            HotReloader: The reloader of the loaded descriptions.
         """
 
 
@@ -59,12 +290,28 @@ class Builder(Protocol, Generic[BuilderDescriptionT, BuilderDescriptionIdentifie
             * configure_dependency_resolver
         """
 
+    def build_async(self) -> AsyncLoader:
+        """
+        Build the asyncio-native loader based upon the configuration.
+
+        Returns:
+            AsyncLoader: The asyncio-native loader constructed with the specified
+            configuration.
+
+        Exceptions:
+            IncompleteLoaderConfigurationException:
+                Thrown when the loader is considered incomplete, see `build`.
+        """
+
     def configure_logger(self, logger: Logger) -> Builder:
         """
         Define a logger used when loading the descriptions.
 
         If never called, no logging will occur. If called twice the last configured
-        logger will be used.
+        logger will be used. The logger is used by the constructed loader and its hot
+        reloaders, and is passed to every configured resolver, ordering engine and
+        extension factory which defines a `configure_logger(logger)` method, such as
+        the default description resolvers.
 
         Args:
             logger (Logger): The logger to use in the constructed loader.
@@ -73,14 +320,53 @@ class Builder(Protocol, Generic[BuilderDescriptionT, BuilderDescriptionIdentifie
             Builder: This builder.
         """
 
+    def add_observer(self, observer: LoaderObserver) -> Builder:
+        """
+        Add the specified LoaderObserver observer to the Loader.
+
+        The observer receives a LoaderEvent for every completed phase of loading the
+        descriptions, containing its duration and counts, such as the number of
+        harvested modules or cache hits. Observers are invoked in the order they are
+        added, failing observers are reported to the logger and do not fail the load.
+
+        Args:
+            observer (LoaderObserver): The observer receiving the events.
+
+        Returns:
+            Builder: This builder.
+        """
+
+    def configure_profiler(self, profiler: ExtensionProfiler) -> Builder:
+        """
+        Define an ExtensionProfiler recording the import and construction costs of
+        each extension.
+
+        The profiler is passed to every description resolver which defines a
+        `configure_profiler(profiler)` method, such as the default description
+        resolvers, and the configured ExtensionFactory is wrapped to record the
+        creation of each extension. If never called, nothing is profiled.
+
+        Args:
+            profiler (ExtensionProfiler): The profiler to use.
+
+        Returns:
+            Builder: This builder.
+        """
+
     def add_module_resolver(self, resolver: ModuleResolver) -> Builder:
         """
         Add the specified ModuleResolver resolver to the Loader.
 
         If never called, no modules will be resolved. If called multiple times the
         provided paths are handled by each module_resolver, thus a path could yield
-        multiple actual modules created by different resolvers. It is left up to the
-        user to handle these situations.
+        multiple actual modules created by different resolvers. Module paths yielded
+        more than once, by different resolvers or harvest paths, are only loaded once,
+        at their first position. Other overlapping modules are left up to the user to
+        handle.
+
+        The default module resolvers query the file system through a cache shared by
+        all resolvers for the duration of a single load, such that overlapping
+        resolvers and harvest paths stat and resolve each path only once.
 
         Args:
             resolver (ModuleResolver): The ModuleResolver to add to the loader.
@@ -98,7 +384,8 @@ class Builder(Protocol, Generic[BuilderDescriptionT, BuilderDescriptionIdentifie
         If never called, no descriptions will be retrieved by the Loader. If
         provided multiple times all of the paths created by the ModuleResolvers
         will be evaluated by each of the DescriptionResolvers. It is left up to the
-        user to handle these situations.
+        user to handle these situations. Each DescriptionResolver receives every
+        module path only once, even if it was resolved multiple times.
 
         Args:
             resolver (DescriptionResolver[DescriptionT]): The DescriptionResolver to add to the loader.
@@ -144,6 +431,101 @@ class Builder(Protocol, Generic[BuilderDescriptionT, BuilderDescriptionIdentifie
             resolver (ResolveDependency): The resolver used to obtain dependencies of descriptions.
         """
 
+    def from_plan(self, path: Path) -> Builder:
+        """
+        Load the descriptions in the order of the load plan at path, as written by
+        `Loader.export_plan`.
+
+        The modules of the plan are resolved directly in the order of the plan, such
+        that neither the harvest paths are harvested nor the descriptions are ordered.
+        If the plan cannot be read, was created with different harvest paths or
+        resolvers, or any of its modules or descriptions no longer matches the plan,
+        the descriptions are loaded as if no plan was configured. Note that modules
+        added to the harvest paths after the plan was written are not picked up until
+        the plan is exported again.
+
+        If never called, no plan is used. If called multiple times, only the path in
+        the last call will be used.
+
+        Args:
+            path (Path): The file in which the plan is stored.
+
+        Returns:
+            Builder: This builder.
+        """
+
+    def configure_harvest_cache(self, path: Path) -> Builder:
+        """
+        Configure a persistent cache of the resolved module paths, stored at path.
+
+        The module paths resolved for each harvest path are stored together with the
+        metadata (mtime and size) of the directories they were resolved from. Upon
+        subsequent loads, the module resolvers are only invoked for harvest paths of
+        which the metadata changed.
+
+        If never called, no cache is used and every harvest path is resolved upon each
+        load. If called multiple times, only the path in the last call will be used.
+
+        Args:
+            path (Path): The file in which the cache is stored.
+
+        Returns:
+            Builder: This builder.
+        """
+
+    def configure_ordering_engine(self, engine: OrderingEngine) -> Builder:
+        """
+        Configure the engine used to sort the dependency graph of the descriptions.
+
+        If never called, the built-in DefaultOrderingEngine is used. If called multiple
+        times, only the engine in the last call will be used.
+
+        Args:
+            engine (OrderingEngine): The engine used to sort the dependency graph.
+
+        Returns:
+            Builder: This builder.
+        """
+
+    def configure_harvest_concurrency(self, n: int) -> Builder:
+        """
+        Configure the number of threads used to harvest the harvest paths.
+
+        The module resolvers of different harvest paths are invoked concurrently on a
+        thread pool of n threads. The harvested module paths are returned in the same
+        order as a sequential harvest. Module resolvers are therefore required to be
+        thread-safe if n is larger than one. The threads share the file system cache
+        of the load.
+
+        If never called, the harvest paths are harvested sequentially. If called
+        multiple times, only the value in the last call will be used.
+
+        Args:
+            n (int): The number of threads, should be at least one.
+
+        Returns:
+            Builder: This builder.
+
+        Exceptions:
+            ValueError: Thrown when n is smaller than one.
+        """
+
+    def configure_extension_factory(
+        self, factory: ExtensionFactory[BuilderDescriptionT, object]
+    ) -> Builder:
+        """
+        Configure the factory used to create the extensions of the descriptions.
+
+        This function needs to be called before loading an ExtensionRegistry. If it is
+        called multiple times, only the factory in the last call will be used.
+
+        Args:
+            factory (ExtensionFactory): The factory used to create the extensions.
+
+        Returns:
+            Builder: This builder.
+        """
+
 
 class _Loader(Generic[LoaderDescriptionT, LoaderDescriptionIdentifierT]):
     def __init__(
@@ -157,17 +539,138 @@ class _Loader(Generic[LoaderDescriptionT, LoaderDescriptionIdentifierT]):
         harvest_paths: Sequence[Path],
         module_resolvers: Sequence[ModuleResolver],
         description_resolvers: Sequence[DescriptionResolver],
+        harvest_cache: Optional[HarvestCache] = None,
+        ordering_engine: Optional[OrderingEngine] = None,
+        harvest_concurrency: int = 1,
+        extension_factory: Optional[ExtensionFactory] = None,
+        logger: Optional[Logger] = None,
+        observers: Sequence[LoaderObserver] = (),
+        plan_path: Optional[Path] = None,
     ) -> None:
+        from .metrics import CountingOrderingEngine, PhaseReporter
+
         self._identifier_resolver = identifier_resolver
         self._dependency_resolver = dependency_resolver
         self._harvest_paths = harvest_paths
         self._module_resolvers = module_resolvers
         self._description_resolvers = description_resolvers
+        self._harvest_cache = harvest_cache
+        self._ordering_engine = ordering_engine
+        self._harvest_concurrency = harvest_concurrency
+        self._extension_factory = extension_factory
+        self._logger = logger if logger is not None else IdentityLogger()
+        self._report_phase = PhaseReporter(self._logger, observers)
+        self._plan_path = plan_path
+        self._counting_engine = CountingOrderingEngine(
+            ordering_engine if ordering_engine is not None else DefaultOrderingEngine()
+        )
+
+    def _resolve_modules(self, path: Path) -> List[Path]:
+        return [
+            module_path
+            for resolver in self._module_resolvers
+            for module_path in resolver(path)
+        ]
+
+    def _harvest_cached_modules(
+        self, harvest_cache: HarvestCache, key: str, path: Path, hits: List[bool]
+    ) -> List[Path]:
+        module_paths = harvest_cache.lookup(path, key)
+        hits.append(module_paths is not None)
+        if module_paths is not None:
+            return module_paths
+
+        module_paths = self._resolve_modules(path)
+        harvest_cache.store(path, key, module_paths)
+        return module_paths
+
+    def _map_harvest_paths(self, harvest: Callable[[Path], List[Path]]) -> List[Path]:
+        if self._harvest_concurrency > 1 and len(self._harvest_paths) > 1:
+            with ThreadPoolExecutor(max_workers=self._harvest_concurrency) as executor:
+                # Each task runs in a copy of this context, sharing its file system
+                # cache.
+                futures = [
+                    executor.submit(contextvars.copy_context().run, harvest, path)
+                    for path in self._harvest_paths
+                ]
+                harvested = [future.result() for future in futures]
+        else:
+            harvested = [harvest(path) for path in self._harvest_paths]
+
+        module_paths = list(
+            dict.fromkeys(
+                module_path
+                for module_paths in harvested
+                for module_path in module_paths
+            )
+        )
+        duplicates = sum(map(len, harvested)) - len(module_paths)
+        if duplicates:
+            self._logger.debug(f"Skipped {duplicates} duplicate module paths.")
+        return module_paths
 
-    def _harvest_valid_modules(self) -> Iterable[Path]:
-        for path in self._harvest_paths:
-            for resolver in self._module_resolvers:
-                yield from resolver(path)
+    def _harvest_valid_modules(self) -> List[Path]:
+        start = time.perf_counter()
+
+        if self._harvest_cache is None:
+            module_paths = self._map_harvest_paths(self._resolve_modules)
+            self._report_phase(
+                "harvest",
+                start,
+                harvest_paths=len(self._harvest_paths),
+                modules=len(module_paths),
+            )
+            return module_paths
+
+        from .cache import resolver_key
+
+        harvest_cache = self._harvest_cache
+        key = resolver_key(self._module_resolvers)
+        hits: List[bool] = []
+        module_paths = self._map_harvest_paths(
+            lambda path: self._harvest_cached_modules(harvest_cache, key, path, hits)
+        )
+        harvest_cache.flush()
+
+        self._report_phase(
+            "harvest",
+            start,
+            harvest_paths=len(self._harvest_paths),
+            modules=len(module_paths),
+            cache_hits=hits.count(True),
+            cache_misses=hits.count(False),
+        )
+        return module_paths
+
+    def _poll_valid_modules(self) -> List[Path]:
+        from .filesystem import filesystem_cache
+
+        with filesystem_cache():
+            return self._harvest_valid_modules()
+
+    def _retrieve_module_descriptions(
+        self, module_paths: Sequence[Path]
+    ) -> Dict[Path, List[LoaderDescriptionT]]:
+        return {
+            module_path: [
+                description
+                for resolver in self._description_resolvers
+                for description in resolver(iter([module_path]))
+            ]
+            for module_path in module_paths
+        }
+
+    def _module_files(self, module_path: Path) -> List[Path]:
+        module_files = dict.fromkeys([module_path])
+        for resolver in self._description_resolvers:
+            if (resolve_files := getattr(resolver, "module_files", None)) is not None:
+                module_files.update(dict.fromkeys(resolve_files(module_path)))
+        return list(module_files)
+
+    def _invalidate_modules(self, module_paths: Sequence[Path]) -> None:
+        for resolver in self._description_resolvers:
+            if (invalidate := getattr(resolver, "invalidate", None)) is not None:
+                invalidate(module_paths)
 
     def _retrieve_descriptions(
         self, module_paths: List[Path]
@@ -175,27 +678,364 @@ class _Loader(Generic[LoaderDescriptionT, LoaderDescriptionIdentifierT]):
         for resolver in self._description_resolvers:
             yield from resolver(iter(module_paths))
 
-    def load_extension_descriptions(self) -> Sequence[LoaderDescriptionT]:
-        module_paths = list(self._harvest_valid_modules())
-        descriptions = list(self._retrieve_descriptions(module_paths))
+    def _retrieve_description_sources(
+        self, module_paths: List[Path], sources: Dict[int, Tuple[Path, int]]
+    ) -> List[LoaderDescriptionT]:
+        descriptions = []
+        for index, resolver in enumerate(self._description_resolvers):
+            for module_path in module_paths:
+                for description in resolver(iter([module_path])):
+                    sources[id(description)] = (module_path, index)
+                    descriptions.append(description)
+        return descriptions
 
-        order_operation = OrderExtensionDescriptions[
-            LoaderDescriptionT, LoaderDescriptionIdentifierT
-        ](self._identifier_resolver, self._dependency_resolver)
-        return list(order_operation(iter(descriptions)))
+    def _plan_configuration(self) -> str:
+        from .cache import resolver_key
+
+        return json.dumps(
+            [
+                [str(path) for path in self._harvest_paths],
+                resolver_key(self._module_resolvers),
+                resolver_key(self._description_resolvers),
+            ]
+        )
+
+    def _plan_namespace(self, resolver_index: int, module_path: Path) -> Optional[str]:
+        module_namespace = getattr(
+            self._description_resolvers[resolver_index], "module_namespace", None
+        )
+        return module_namespace(module_path) if module_namespace is not None else None
+
+    def _is_planned_module(self, entry: PlanEntry) -> bool:
+        from .plan import fingerprint
+
+        return (
+            entry.fingerprint is not None
+            and entry.fingerprint == fingerprint(entry.module_path)
+            and entry.namespace
+            == self._plan_namespace(entry.resolver, entry.module_path)
+        )
+
+    def _retrieve_planned_description(
+        self, entry: PlanEntry
+    ) -> Optional[LoaderDescriptionT]:
+        resolver = self._description_resolvers[entry.resolver]
+        for description in resolver(iter([entry.module_path])):
+            if self._identifier_resolver(description) == entry.extension_id:
+                dependencies = set(self._dependency_resolver(description))
+                return description if dependencies == set(entry.dependencies) else None
+        return None
+
+    def _load_planned_descriptions(
+        self,
+        plan_path: Path,
+        targets: Optional[List[LoaderDescriptionIdentifierT]],
+    ) -> Optional[OrderedDescriptions]:
+        from .plan import LoadPlan
+
+        load_start = time.perf_counter()
+
+        plan = LoadPlan.load(plan_path)
+        if plan is None or plan.configuration != self._plan_configuration():
+            self._logger.info(
+                f"The load plan '{plan_path}' is unavailable or was created with a "
+                "different configuration."
+            )
+            return None
+
+        entries: Sequence[PlanEntry] = plan.entries
+        if targets is not None:
+            try:
+                entries = select_dependency_closure(
+                    entries,
+                    targets,
+                    lambda entry: entry.extension_id,
+                    lambda entry: entry.dependencies,
+                )
+            except exceptions.MissingDependencyException:
+                self._logger.info(
+                    f"The load plan '{plan_path}' does not contain the targets."
+                )
+                return None
+
+        if not all(self._is_planned_module(entry) for entry in entries):
+            self._logger.info(f"The modules of the load plan '{plan_path}' changed.")
+            return None
+
+        descriptions = []
+        for entry in entries:
+            description = self._retrieve_planned_description(entry)
+            if description is None:
+                self._logger.info(
+                    f"The description of '{entry.module_path}' no longer matches the "
+                    f"load plan '{plan_path}'."
+                )
+                return None
+            descriptions.append(description)
+
+        # The planned entries are ordered, and precede the entries depending on them.
+        positions = {entry.extension_id: i for i, entry in enumerate(entries)}
+        self._report_phase("load", load_start, descriptions=len(descriptions))
+        return OrderedDescriptions(
+            descriptions,
+            [entry.extension_id for entry in entries],
+            [tuple(positions[d] for d in entry.dependencies) for entry in entries],
+        )
+
+    def _load_ordered_descriptions(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]]
+    ) -> OrderedDescriptions:
+        from .filesystem import filesystem_cache
+
+        with filesystem_cache():
+            if self._plan_path is not None:
+                selected_targets = list(targets) if targets is not None else None
+                planned_descriptions = self._load_planned_descriptions(
+                    self._plan_path, selected_targets
+                )
+                if planned_descriptions is not None:
+                    return planned_descriptions
+                targets = selected_targets
+
+            return self._load_descriptions(self._retrieve_descriptions, targets)
+
+    def load_extension_descriptions(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> Sequence[LoaderDescriptionT]:
+        return self._load_ordered_descriptions(targets).descriptions
+
+    def _load_descriptions(
+        self,
+        retrieve: Callable[[List[Path]], Iterable[LoaderDescriptionT]],
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]],
+    ) -> OrderedDescriptions:
+        load_start = time.perf_counter()
+        module_paths = self._harvest_valid_modules()
+
+        start = time.perf_counter()
+        descriptions = list(retrieve(module_paths))
+        self._report_phase(
+            "retrieve",
+            start,
+            modules=len(module_paths),
+            descriptions=len(descriptions),
+        )
+
+        if targets is not None:
+            start = time.perf_counter()
+            selected_targets = list(targets)
+            descriptions = select_dependency_closure(
+                descriptions,
+                selected_targets,
+                self._identifier_resolver,
+                self._dependency_resolver,
+            )
+            self._report_phase(
+                "select",
+                start,
+                targets=len(selected_targets),
+                descriptions=len(descriptions),
+            )
+
+        start = time.perf_counter()
+        order_operation = self._create_order_operation()
+        ordered = order_operation.order(descriptions)
+        self._report_phase(
+            "order",
+            start,
+            nodes=self._counting_engine.nodes,
+            edges=self._counting_engine.edges,
+        )
+
+        self._report_phase("load", load_start, descriptions=len(ordered.descriptions))
+        return ordered
+
+    def _stream_modules(
+        self, harvest_paths: Iterable[Path], cache: FileSystemCache
+    ) -> Iterator[Path]:
+        from .filesystem import filesystem_cache
+
+        seen = set()
+        for path in harvest_paths:
+            # The cache is only set while resolving, as the context of a generator is
+            # the context of its consumer.
+            with filesystem_cache(cache):
+                module_paths = self._resolve_modules(path)
+
+            for module_path in module_paths:
+                if module_path not in seen:
+                    seen.add(module_path)
+                    yield module_path
+
+    def stream_extension_descriptions(
+        self, harvest_paths: Optional[Iterable[Path]] = None
+    ) -> Iterator[LoaderDescriptionT]:
+        from .filesystem import FileSystemCache, filesystem_cache
+
+        start = time.perf_counter()
+        order = IncrementalOrderExtensionDescriptions(
+            self._identifier_resolver, self._dependency_resolver
+        )
+        module_count = description_count = 0
+        cache = FileSystemCache()
+
+        for module_path in self._stream_modules(
+            harvest_paths if harvest_paths is not None else self._harvest_paths, cache
+        ):
+            module_count += 1
+            with filesystem_cache(cache):
+                descriptions = [
+                    description
+                    for resolver in self._description_resolvers
+                    for description in resolver(iter([module_path]))
+                ]
+
+            for description in descriptions:
+                description_count += 1
+                yield from order.add(description)
+
+        order.finish()
+        self._report_phase(
+            "stream", start, modules=module_count, descriptions=description_count
+        )
+
+    def _create_order_operation(
+        self,
+    ) -> OrderExtensionDescriptions[LoaderDescriptionT, LoaderDescriptionIdentifierT]:
+        return OrderExtensionDescriptions(
+            self._identifier_resolver,
+            self._dependency_resolver,
+            self._counting_engine,
+        )
+
+    def load_extension_registry(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> ExtensionRegistry:
+        from .registry import ExtensionFactory, ExtensionRegistry
+
+        if self._extension_factory is None:
+            raise exceptions.IncompleteLoaderConfigurationException(
+                f"No '{ExtensionFactory.__name__}' provided."
+            )
+
+        return ExtensionRegistry(
+            self.load_extension_descriptions(targets),
+            self._identifier_resolver,
+            self._dependency_resolver,
+            self._extension_factory,
+        )
+
+    def load_pipeline(
+        self,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+        batch_size: int = 256,
+    ) -> Pipeline:
+        from .pipeline import Pipeline
+
+        registry = self.load_extension_registry(targets)
+        return Pipeline(
+            [registry[extension_id] for extension_id in registry], batch_size
+        )
+
+    def load_prefork_registry(
+        self,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+        fork_safe: Optional[Callable[[LoaderDescriptionT], bool]] = None,
+    ) -> PreforkRegistry:
+        from .prefork import PreforkRegistry
+        from .registry import ExtensionFactory
+
+        if self._extension_factory is None:
+            raise exceptions.IncompleteLoaderConfigurationException(
+                f"No '{ExtensionFactory.__name__}' provided."
+            )
+
+        return PreforkRegistry(
+            self.load_extension_descriptions(targets),
+            self._identifier_resolver,
+            self._dependency_resolver,
+            self._extension_factory,
+            fork_safe,
+            self._logger,
+        )
+
+    def load_extension_graph(
+        self, targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None
+    ) -> ExtensionGraph:
+        from .graph import ExtensionGraph
+
+        return ExtensionGraph.from_ordered(self._load_ordered_descriptions(targets))
+
+    def export_plan(
+        self,
+        path: Path,
+        targets: Optional[Iterable[LoaderDescriptionIdentifierT]] = None,
+    ) -> None:
+        from .filesystem import filesystem_cache
+        from .plan import LoadPlan, PlanEntry, fingerprint
+
+        sources: Dict[int, Tuple[Path, int]] = {}
+        with filesystem_cache():
+            ordered = self._load_descriptions(
+                lambda module_paths: self._retrieve_description_sources(
+                    module_paths, sources
+                ),
+                targets,
+            )
+
+        entries = []
+        for description, extension_id, dependencies in zip(*ordered):
+            module_path, resolver_index = sources[id(description)]
+            entries.append(
+                PlanEntry(
+                    module_path,
+                    self._plan_namespace(resolver_index, module_path),
+                    resolver_index,
+                    extension_id,
+                    [ordered.extension_ids[d] for d in dependencies],
+                    fingerprint(module_path),
+                )
+            )
+
+        LoadPlan(self._plan_configuration(), entries).dump(path)
+
+    def create_hot_reloader(self, poll_interval: float = 1.0) -> HotReloader:
+        from .reload import HotReloader
+
+        order_operation = self._create_order_operation()
+        return HotReloader(
+            self._poll_valid_modules,
+            self._retrieve_module_descriptions,
+            self._invalidate_modules,
+            lambda descriptions, available_ids: list(
+                order_operation(descriptions, available_ids)
+            ),
+            self._identifier_resolver,
+            self._dependency_resolver,
+            poll_interval,
+            self._logger,
+            self._module_files,
+        )
 
 
 class _Builder(Generic[BuilderDescriptionT, BuilderDescriptionIdentifierT]):
     def __init__(self) -> None:
         self._logger: Optional[Logger] = None
+        self._observers: List[LoaderObserver] = []
+        self._profiler: Optional[ExtensionProfiler] = None
         self._module_resolvers: List[ModuleResolver] = []
         self._description_resolvers: List[DescriptionResolver] = []
         self._harvest_paths: List[Path] = []
+        self._harvest_cache_path: Optional[Path] = None
+        self._plan_path: Optional[Path] = None
+        self._ordering_engine: Optional[OrderingEngine] = None
+        self._harvest_concurrency = 1
+        self._extension_factory: Optional[ExtensionFactory] = None
 
         self._identifier_resolver: Optional[ResolveIdentifier] = None
         self._dependency_resolver: Optional[ResolveDependency] = None
 
-    def build(self) -> Loader:
+    def _get_resolvers(self) -> Tuple[ResolveIdentifier, ResolveDependency]:
         if self._identifier_resolver is None:
             raise exceptions.IncompleteLoaderConfigurationException(
                 f"No '{ResolveIdentifier.__name__}' provided."
@@ -205,18 +1045,83 @@ class _Builder(Generic[BuilderDescriptionT, BuilderDescriptionIdentifierT]):
                 f"No '{ResolveDependency.__name__}' provided."
             )
 
+        return self._identifier_resolver, self._dependency_resolver
+
+    def _get_extension_factory(self) -> Optional[ExtensionFactory]:
+        if self._extension_factory is None or self._profiler is None:
+            return self._extension_factory
+        return self._profiler.wrap_factory(self._extension_factory)
+
+    def build(self) -> Loader:
+        identifier_resolver, dependency_resolver = self._get_resolvers()
+
+        if self._logger is not None:
+            from .metrics import configure_loggers
+
+            configure_loggers(
+                [
+                    *self._module_resolvers,
+                    *self._description_resolvers,
+                    identifier_resolver,
+                    dependency_resolver,
+                    self._ordering_engine,
+                    self._extension_factory,
+                ],
+                self._logger,
+            )
+
+        if self._profiler is not None:
+            for resolver in self._description_resolvers:
+                if (
+                    configure_profiler := getattr(resolver, "configure_profiler", None)
+                ) is not None:
+                    configure_profiler(self._profiler)
+
+        harvest_cache = None
+        if self._harvest_cache_path is not None:
+            from .cache import HarvestCache
+
+            harvest_cache = HarvestCache(self._harvest_cache_path)
+
         return _Loader(
-            self._identifier_resolver,
-            self._dependency_resolver,
+            identifier_resolver,
+            dependency_resolver,
             self._harvest_paths,
             self._module_resolvers,
             self._description_resolvers,
+            harvest_cache,
+            self._ordering_engine,
+            self._harvest_concurrency,
+            self._get_extension_factory(),
+            self._logger,
+            list(self._observers),
+            self._plan_path,
+        )
+
+    def build_async(self) -> AsyncLoader:
+        from .aio import _AsyncLoader
+
+        identifier_resolver, dependency_resolver = self._get_resolvers()
+
+        return _AsyncLoader(
+            self.build(),
+            identifier_resolver,
+            dependency_resolver,
+            self._get_extension_factory(),
         )
 
     def configure_logger(self, logger: Logger) -> Builder:
         self._logger = logger
         return self
 
+    def add_observer(self, observer: LoaderObserver) -> Builder:
+        self._observers.append(observer)
+        return self
+
+    def configure_profiler(self, profiler: ExtensionProfiler) -> Builder:
+        self._profiler = profiler
+        return self
+
     def add_module_resolver(self, resolver: ModuleResolver) -> Builder:
         self._module_resolvers.append(resolver)
         return self
@@ -245,6 +1150,30 @@ class _Builder(Generic[BuilderDescriptionT, BuilderDescriptionIdentifierT]):
         self._dependency_resolver = resolver
         return self
 
+    def from_plan(self, path: Path) -> Builder:
+        self._plan_path = path
+        return self
+
+    def configure_harvest_cache(self, path: Path) -> Builder:
+        self._harvest_cache_path = path
+        return self
+
+    def configure_ordering_engine(self, engine: OrderingEngine) -> Builder:
+        self._ordering_engine = engine
+        return self
+
+    def configure_harvest_concurrency(self, n: int) -> Builder:
+        if n < 1:
+            raise ValueError(f"The harvest concurrency should be at least 1, got {n}.")
+        self._harvest_concurrency = n
+        return self
+
+    def configure_extension_factory(
+        self, factory: ExtensionFactory[BuilderDescriptionT, object]
+    ) -> Builder:
+        self._extension_factory = factory
+        return self
+
 
 def construct_builder() -> Builder[BuilderDescriptionT, BuilderDescriptionIdentifierT]:
     """
@@ -0,0 +1,146 @@
+"""
+sbe.eggstensibility.bytecode provides the source loader which caches the compiled code
+of extension modules in a dedicated directory, rather than in the `__pycache__`
+directory next to the source.
+"""
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import marshal
+import sys
+
+from pathlib import Path
+from types import CodeType
+from typing import Literal, Optional
+
+from .atomic import atomic_write_bytes
+
+
+BytecodeValidation = Literal["timestamp", "checked-hash"]
+
+_TIMESTAMP_FLAGS = 0b00
+_CHECKED_HASH_FLAGS = 0b11
+_HEADER_SIZE = 16
+
+
+def _pack_uint32(value: int) -> bytes:
+    return (value & 0xFFFFFFFF).to_bytes(4, "little")
+
+
+class BytecodeCacheLoader(importlib.machinery.SourceFileLoader):
+    """
+    BytecodeCacheLoader loads python source files while caching the compiled code in a
+    dedicated cache directory, which allows reusing compiled code for source trees which
+    are not writable.
+
+    The cached files use the regular pyc layout. They are validated either by the
+    mtime and size of the source ("timestamp"), identical to the default `__pycache__`
+    behaviour, or by the hash of the source ("checked-hash"), which remains valid when
+    the cache directory is shared in between hosts with different mtimes.
+
+    The cache files are keyed by the path of the source and the module name, thus
+    sharing a cache in between hosts requires the sources to be located at the same
+    path.
+    """
+
+    def __init__(
+        self,
+        fullname: str,
+        path: str,
+        cache_directory: Path,
+        validation: BytecodeValidation = "timestamp",
+    ) -> None:
+        """
+        Create a new BytecodeCacheLoader.
+
+        Args:
+            fullname (str): The name of the module to load.
+            path (str): The path to the source of the module.
+            cache_directory (Path): The directory in which the compiled code is cached.
+            validation (BytecodeValidation):
+                How the cached code is validated, either "timestamp" or "checked-hash".
+        """
+        super().__init__(fullname, path)
+        self._cache_directory = cache_directory
+        self._validation = validation
+
+    def _cache_path(self, fullname: str, source_path: str) -> Path:
+        key = hashlib.sha256(f"{fullname}\0{source_path}".encode()).hexdigest()[:32]
+        return self._cache_directory / f"{key}.{sys.implementation.cache_tag}.pyc"
+
+    def _create_header(self, source_path: str, source_bytes: bytes) -> bytes:
+        if self._validation == "checked-hash":
+            return (
+                importlib.util.MAGIC_NUMBER
+                + _pack_uint32(_CHECKED_HASH_FLAGS)
+                + importlib.util.source_hash(source_bytes)
+            )
+
+        stats = self.path_stats(source_path)
+        return (
+            importlib.util.MAGIC_NUMBER
+            + _pack_uint32(_TIMESTAMP_FLAGS)
+            + _pack_uint32(int(stats["mtime"]))
+            + _pack_uint32(stats["size"])
+        )
+
+    def _read_cached_code(
+        self, cache_path: Path, source_path: str, source_bytes: Optional[bytes]
+    ) -> Optional[CodeType]:
+        try:
+            data = cache_path.read_bytes()
+        except OSError:
+            return None
+
+        if source_bytes is None:
+            source_bytes = b""
+        if data[:_HEADER_SIZE] != self._create_header(source_path, source_bytes):
+            return None
+
+        try:
+            return marshal.loads(data[_HEADER_SIZE:])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _write_cached_code(
+        self, cache_path: Path, header: bytes, code: CodeType
+    ) -> None:
+        try:
+            atomic_write_bytes(cache_path, header + marshal.dumps(code))
+        except OSError:
+            # A cache which cannot be written only costs a compilation next time.
+            return
+
+    def get_code(self, fullname: str) -> CodeType:
+        """
+        Retrieve the code object of the module, from the cache if it is valid and by
+        compiling the source otherwise.
+
+        Args:
+            fullname (str): The name of the module.
+
+        Returns:
+            CodeType: The code object of the module.
+        """
+        source_path = self.get_filename(fullname)
+        cache_path = self._cache_path(fullname, source_path)
+
+        # Hash-based validation requires the source, timestamp-based validation only
+        # requires its metadata.
+        source_bytes = (
+            self.get_data(source_path) if self._validation == "checked-hash" else None
+        )
+
+        code = self._read_cached_code(cache_path, source_path, source_bytes)
+        if code is not None:
+            return code
+
+        if source_bytes is None:
+            source_bytes = self.get_data(source_path)
+
+        code = self.source_to_code(source_bytes, source_path)
+        self._write_cached_code(
+            cache_path, self._create_header(source_path, source_bytes), code
+        )
+        return code
@@ -0,0 +1,197 @@
+"""
+sbe.eggstensibility.cache provides the persistent harvest cache, which allows the
+loader to skip the module resolution of harvest paths that did not change since the
+previous load.
+"""
+
+import json
+import os
+import threading
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .atomic import atomic_write_json
+
+
+# Bump whenever the layout of the cache file changes, older files are then ignored.
+_CACHE_VERSION = 1
+
+# Only attributes holding these values participate in the resolver key. Anything else
+# (loggers, callables, ...) does not influence which modules are resolved.
+_KEY_VALUE_TYPES = (str, int, float, bool, type(None))
+
+
+def _stat_metadata(path: Path) -> Optional[List[int]]:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def _is_key_value(value: object) -> bool:
+    if isinstance(value, (tuple, list, frozenset)):
+        return all(_is_key_value(v) for v in value)
+    return isinstance(value, _KEY_VALUE_TYPES)
+
+
+def _describe_resolver(resolver: object) -> str:
+    resolver_type = type(resolver)
+    state = getattr(resolver, "__dict__", {})
+    configuration = sorted(
+        (name, value) for name, value in state.items() if _is_key_value(value)
+    )
+    return f"{resolver_type.__module__}.{resolver_type.__qualname__}{configuration!r}"
+
+
+def resolver_key(resolvers: Iterable[object]) -> str:
+    """
+    Create the key describing the configuration of the provided module resolvers.
+
+    Cached entries are only valid for the exact resolver configuration they were
+    created with.
+
+    Args:
+        resolvers (Iterable[object]): The module resolvers used to harvest a path.
+
+    Returns:
+        str: The key describing the resolvers.
+    """
+    return ";".join(_describe_resolver(resolver) for resolver in resolvers)
+
+
+def _watched_paths(harvest_path: Path, module_paths: Sequence[Path]) -> List[Path]:
+    # The harvest path itself and every directory in between the harvest path and the
+    # resolved modules are watched. Adding or removing entries from any of these
+    # directories changes their metadata and thus invalidates the entry.
+    root = harvest_path.resolve()
+    watched: Dict[Path, None] = {harvest_path: None, root: None}
+
+    for module_path in module_paths:
+        directory = module_path.parent
+        while directory not in watched:
+            watched[directory] = None
+            if root not in directory.parents:
+                break
+            directory = directory.parent
+
+    return list(watched)
+
+
+class HarvestCache:
+    """
+    HarvestCache persists the module paths resolved for each harvest path, together
+    with the metadata (mtime and size) of the directories they were resolved from.
+
+    A harvest path is only resolved again when the metadata of any of its watched paths
+    changed. Note that only the harvest path and the directories leading to resolved
+    modules are watched, modules added to a directory which did not contain any module
+    when the entry was created are only picked up once the entry is invalidated.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        """
+        Create a new HarvestCache persisted at the given cache_path.
+
+        Args:
+            cache_path (Path):
+                The file in which the cache is stored. It is created upon the first
+                flush if it does not exist yet.
+        """
+        self._cache_path = cache_path
+        self._entries: Optional[Dict[str, dict]] = None
+        self._is_dirty = False
+
+        # Harvest paths can be looked up and stored concurrently by the loader, and
+        # concurrent loads can flush the same cache.
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """The file in which the cache is stored."""
+        return self._cache_path
+
+    def _read_entries(self) -> Dict[str, dict]:
+        try:
+            with self._cache_path.open("r", encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(content, dict) or content.get("version") != _CACHE_VERSION:
+            return {}
+
+        entries = content.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _get_entries(self) -> Dict[str, dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_entries()
+            return self._entries
+
+    def lookup(self, harvest_path: Path, key: str) -> Optional[List[Path]]:
+        """
+        Retrieve the cached module paths of the given harvest_path.
+
+        Args:
+            harvest_path (Path): The harvest path to look up.
+            key (str): The key describing the module resolvers.
+
+        Returns:
+            Optional[List[Path]]:
+                The cached module paths, or None if there is no valid entry.
+        """
+        entry = self._get_entries().get(str(harvest_path))
+        if entry is None or entry.get("resolvers") != key:
+            return None
+
+        for watched_path, metadata in entry["watched"]:
+            if _stat_metadata(Path(watched_path)) != metadata:
+                return None
+
+        return [Path(p) for p in entry["modules"]]
+
+    def store(self, harvest_path: Path, key: str, module_paths: Sequence[Path]) -> None:
+        """
+        Store the module paths resolved for the given harvest_path.
+
+        Args:
+            harvest_path (Path): The harvest path that has been resolved.
+            key (str): The key describing the module resolvers.
+            module_paths (Sequence[Path]): The resolved module paths.
+        """
+        entry = {
+            "resolvers": key,
+            "watched": [
+                [str(p), _stat_metadata(p)]
+                for p in _watched_paths(harvest_path, module_paths)
+            ],
+            "modules": [str(p) for p in module_paths],
+        }
+        entries = self._get_entries()
+
+        with self._lock:
+            entries[str(harvest_path)] = entry
+            self._is_dirty = True
+
+    def flush(self) -> None:
+        """Write the cache to disk if any entry has been stored since the last flush."""
+        # Flushes are serialized, such that a snapshot never replaces a newer one.
+        with self._flush_lock:
+            with self._lock:
+                if not self._is_dirty or self._entries is None:
+                    return
+                entries = dict(self._entries)
+                self._is_dirty = False
+
+            try:
+                atomic_write_json(
+                    self._cache_path, {"version": _CACHE_VERSION, "entries": entries}
+                )
+            except BaseException:
+                with self._lock:
+                    self._is_dirty = True
+                raise
@@ -0,0 +1,182 @@
+"""
+sbe.eggstensibility.construct provides the construction of the extensions of ordered
+descriptions, constructing independent extensions concurrently.
+"""
+
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_EXCEPTION,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Dict, Generic, Iterable, List, Literal, Optional, TypeVar
+
+from ..exceptions import ExtensionConstructionException
+from .order import ResolveDependency, ResolveIdentifier, group_dependency_levels
+from .registry import ExtensionFactory
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+ExtensionT = TypeVar("ExtensionT")
+
+ErrorPolicy = Literal["fail_fast", "collect"]
+
+
+class ConstructExtensions(Generic[DescriptionT, DescriptionIdentifierT, ExtensionT]):
+    """
+    ConstructExtensions is responsible for constructing the extensions of ordered
+    descriptions.
+
+    The descriptions are grouped into dependency levels, and the extensions within a
+    single level are constructed concurrently on a pool of workers. A level is only
+    started once all extensions of the preceding levels have been constructed.
+    """
+
+    def __init__(
+        self,
+        description_identifier_resolver: ResolveIdentifier[
+            DescriptionT, DescriptionIdentifierT
+        ],
+        description_dependency_resolver: ResolveDependency[
+            DescriptionT, DescriptionIdentifierT
+        ],
+        extension_factory: ExtensionFactory[DescriptionT, ExtensionT],
+        max_workers: Optional[int] = None,
+        error_policy: ErrorPolicy = "fail_fast",
+        executor_type: Callable[..., Executor] = ThreadPoolExecutor,
+    ) -> None:
+        """
+        Create a new ConstructExtensions.
+
+        Args:
+            description_identifier_resolver (ResolveIdentifier):
+                The resolver used to obtain identifiers of descriptions.
+            description_dependency_resolver (ResolveDependency):
+                The resolver used to obtain dependencies of descriptions.
+            extension_factory (ExtensionFactory):
+                The factory used to create the extensions of descriptions.
+            max_workers (Optional[int]):
+                The maximum number of workers, defaults to the default of the executor.
+            error_policy (ErrorPolicy):
+                "fail_fast" stops constructing upon the first error, "collect"
+                continues to construct every extension which does not depend on a
+                failed extension. In both cases an ExtensionConstructionException is
+                thrown once the construction stopped.
+            executor_type (Callable[..., Executor]):
+                The executor used to construct the extensions, e.g. the
+                ThreadPoolExecutor or ProcessPoolExecutor. The latter requires both the
+                descriptions, the factory and the extensions to be picklable.
+
+        Exceptions:
+            ValueError: Thrown when the error_policy is unknown.
+        """
+        if error_policy not in ("fail_fast", "collect"):
+            raise ValueError(f"Unknown error policy '{error_policy}'.")
+
+        self._identifier_resolver = description_identifier_resolver
+        self._dependency_resolver = description_dependency_resolver
+        self._extension_factory = extension_factory
+        self._max_workers = max_workers
+        self._error_policy = error_policy
+        self._executor_type = executor_type
+
+    def _has_failed_dependency(
+        self, description: DescriptionT, failed_ids: set
+    ) -> bool:
+        return any(
+            dependency_id in failed_ids
+            for dependency_id in self._dependency_resolver(description)
+        )
+
+    def _submit_level(
+        self,
+        executor: Executor,
+        level: List[DescriptionT],
+        failed_ids: set,
+        skipped: List[DescriptionIdentifierT],
+    ) -> Dict[DescriptionIdentifierT, Future]:
+        futures = {}
+
+        for description in level:
+            extension_id = self._identifier_resolver(description)
+            if self._has_failed_dependency(description, failed_ids):
+                failed_ids.add(extension_id)
+                skipped.append(extension_id)
+            else:
+                futures[extension_id] = executor.submit(
+                    self._extension_factory, description
+                )
+
+        return futures
+
+    def __call__(
+        self, extension_descriptions: Iterable[DescriptionT]
+    ) -> Dict[DescriptionIdentifierT, ExtensionT]:
+        """
+        Construct the extensions of the provided extension_descriptions.
+
+        Args:
+            extension_descriptions (Iterable[DescriptionT]):
+                The extension descriptions, ordered based upon their dependencies.
+
+        Returns:
+            Dict[DescriptionIdentifierT, ExtensionT]:
+                The constructed extensions by identifier, in the order of the
+                descriptions.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when a description depends on an identifier which does not
+                precede it in the extension_descriptions.
+            ExtensionConstructionException:
+                Thrown when any of the extensions could not be constructed.
+        """
+        descriptions = list(extension_descriptions)
+        levels = group_dependency_levels(
+            descriptions, self._identifier_resolver, self._dependency_resolver
+        )
+
+        constructed: Dict[DescriptionIdentifierT, ExtensionT] = {}
+        errors: Dict[DescriptionIdentifierT, BaseException] = {}
+        skipped: List[DescriptionIdentifierT] = []
+        failed_ids: set = set()
+
+        with self._executor_type(max_workers=self._max_workers) as executor:
+            for level in levels:
+                if errors and self._error_policy == "fail_fast":
+                    skipped.extend(self._identifier_resolver(d) for d in level)
+                    continue
+
+                futures = self._submit_level(executor, level, failed_ids, skipped)
+                return_when = (
+                    FIRST_EXCEPTION
+                    if self._error_policy == "fail_fast"
+                    else ALL_COMPLETED
+                )
+                wait(futures.values(), return_when=return_when)
+
+                for extension_id, future in futures.items():
+                    if not future.done() and future.cancel():
+                        skipped.append(extension_id)
+                        continue
+                    if (error := future.exception()) is not None:
+                        errors[extension_id] = error
+                        failed_ids.add(extension_id)
+                    else:
+                        constructed[extension_id] = future.result()
+
+        if errors:
+            raise ExtensionConstructionException(
+                f"Failed to construct {len(errors)} extension(s).",
+                errors,
+                constructed,
+                skipped,
+            )
+
+        return {
+            extension_id: constructed[extension_id]
+            for extension_id in map(self._identifier_resolver, descriptions)
+        }
@@ -3,8 +3,19 @@ sbe.eggstensibility.extension.description defines the default description for re
 extensions.
 """
 
-from functools import cache
-from typing import Callable, Generic, Iterable, TypeAlias, TypeVar, Union
+import itertools
+import sys
+
+from typing import (
+    Callable,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Optional,
+    TypeAlias,
+    TypeVar,
+    Union,
+)
 
 from uuid import uuid4
 
@@ -32,6 +43,7 @@ class DefaultDescription(Generic[ExtensionT]):
         dependencies: Union[
             Iterable[ExtensionID], Callable[[], Iterable[ExtensionID]], None
         ] = None,
+        extension_id: Optional[ExtensionID] = None,
     ) -> None:
         """
         Create a new DefaultDescription with the given name and dependencies.
@@ -41,11 +53,15 @@ class DefaultDescription(Generic[ExtensionT]):
                 The (human-readable) name of this extension
             dependencies (Iterable[ExtensionID] | Callable[[], Iterable[ExtensionID]]):
                 The dependencies of this extension.
+            extension_id (Optional[ExtensionID]):
+                The unique id of this extension. If None, a hex representation of a
+                uuid is generated.
         """
         self._name = name
-        self._id = hex(uuid4().int)
+        self._id = extension_id if extension_id is not None else hex(uuid4().int)
         self._extension_ctor = extension_ctor
         self._dependencies = dependencies if dependencies is not None else []
+        self._resolved_dependencies: Optional[FrozenSet[ExtensionID]] = None
 
     @property
     def name(self) -> str:
@@ -66,8 +82,112 @@ class DefaultDescription(Generic[ExtensionT]):
         """Create the extension described by this description."""
         return self._extension_ctor()
 
-    @cache
-    def _resolve_dependencies(self) -> Iterable[ExtensionID]:
-        return set(
-            self._dependencies() if callable(self._dependencies) else self._dependencies
+    def _resolve_dependencies(self) -> FrozenSet[ExtensionID]:
+        # Callable dependencies are only resolved upon first access, such that they can
+        # refer to extensions which are loaded afterwards.
+        if self._resolved_dependencies is None:
+            self._resolved_dependencies = frozenset(
+                self._dependencies()
+                if callable(self._dependencies)
+                else self._dependencies
+            )
+        return self._resolved_dependencies
+
+
+# Compact ids of descriptions without an explicit id, unique within the process. The
+# ids are negative, such that they cannot collide with explicit integer ids.
+_compact_ids = itertools.count(-1, -1)
+
+CompactExtensionID: TypeAlias = Union[str, int]
+
+
+class CompactDescription(Generic[ExtensionT]):
+    """
+    CompactDescription provides the interface of the DefaultDescription with a smaller
+    memory footprint, for processes loading a very large number of extensions.
+
+    The description defines `__slots__` rather than a per-instance `__dict__`, interns
+    its string identifiers, such that every identifier is stored once regardless of
+    the number of descriptions depending on it, and stores its dependencies as a
+    frozenset. Descriptions without an explicit extension_id are identified by a
+    negative integer which is unique within the process, rather than a uuid.
+    """
+
+    __slots__ = ("_name", "_id", "_extension_ctor", "_dependencies")
+
+    def __init__(
+        self,
+        name: str,
+        extension_ctor: Callable[[], ExtensionT],
+        dependencies: Union[
+            Iterable[CompactExtensionID],
+            Callable[[], Iterable[CompactExtensionID]],
+            None,
+        ] = None,
+        extension_id: Optional[CompactExtensionID] = None,
+    ) -> None:
+        """
+        Create a new CompactDescription with the given name and dependencies.
+
+        Args:
+            name (str):
+                The (human-readable) name of this extension
+            dependencies (Iterable[CompactExtensionID] | Callable[[], Iterable[CompactExtensionID]]):
+                The dependencies of this extension.
+            extension_id (Optional[CompactExtensionID]):
+                The unique id of this extension. If None, a negative integer unique
+                within the process is generated.
+
+        Exceptions:
+            ValueError: Thrown when the extension_id is a negative integer.
+        """
+        if isinstance(extension_id, int) and extension_id < 0:
+            raise ValueError(
+                f"The extension id should not be negative, got {extension_id}."
+            )
+
+        self._name = name
+        self._id = _intern(
+            extension_id if extension_id is not None else next(_compact_ids)
+        )
+        self._extension_ctor = extension_ctor
+        self._dependencies: Union[
+            FrozenSet[CompactExtensionID], Callable[[], Iterable[CompactExtensionID]]
+        ] = (
+            dependencies
+            if callable(dependencies)
+            else _intern_all(dependencies if dependencies is not None else ())
         )
+
+    @property
+    def name(self) -> str:
+        """The (human-readable) name of this extension."""
+        return self._name
+
+    @property
+    def extension_id(self) -> CompactExtensionID:
+        """The unique id of this extension."""
+        return self._id
+
+    @property
+    def dependencies(self) -> Iterable[CompactExtensionID]:
+        """The dependencies of this extension."""
+        if callable(self._dependencies):
+            # Callable dependencies are only resolved upon first access, such that
+            # they can refer to extensions which are loaded afterwards.
+            self._dependencies = _intern_all(self._dependencies())
+        return iter(self._dependencies)
+
+    def create_extension(self) -> ExtensionT:
+        """Create the extension described by this description."""
+        return self._extension_ctor()
+
+
+def _intern(extension_id: CompactExtensionID) -> CompactExtensionID:
+    return sys.intern(extension_id) if isinstance(extension_id, str) else extension_id
+
+
+def _intern_all(
+    extension_ids: Iterable[CompactExtensionID],
+) -> FrozenSet[CompactExtensionID]:
+    return frozenset(map(_intern, extension_ids))
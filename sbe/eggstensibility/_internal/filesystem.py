@@ -0,0 +1,153 @@
+"""
+sbe.eggstensibility.filesystem provides the per-load cache of file system queries,
+which is shared by every resolver invoked while loading the descriptions.
+"""
+
+import contextlib
+import contextvars
+import os
+import stat
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+class FileSystemCache:
+    """
+    FileSystemCache caches the stat results, resolved paths and directory entries
+    queried while loading descriptions, such that multiple resolvers querying the same
+    paths only query the file system once.
+
+    The cache is only valid for the duration of a single load, changes to the file
+    system made during the load are not observed. The cache can be shared in between
+    threads, concurrent queries of the same path may both query the file system.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, Optional[os.stat_result]] = {}
+        self._resolved: Dict[Path, Path] = {}
+        self._entries: Dict[str, List[os.DirEntry]] = {}
+
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Retrieve the stat result of path, following symbolic links.
+
+        Args:
+            path (Path): The path to query.
+
+        Returns:
+            Optional[os.stat_result]: The stat result, or None if path does not exist.
+        """
+        key = os.fspath(path)
+        try:
+            return self._stats[key]
+        except KeyError:
+            pass
+
+        try:
+            result: Optional[os.stat_result] = os.stat(key)
+        except (OSError, ValueError):
+            result = None
+        self._stats[key] = result
+        return result
+
+    def resolve(self, path: Path) -> Path:
+        """
+        Resolve path to an absolute path, resolving any symbolic links.
+
+        Args:
+            path (Path): The path to resolve.
+
+        Returns:
+            Path: The resolved path.
+        """
+        try:
+            return self._resolved[path]
+        except KeyError:
+            resolved = self._resolved[path] = path.resolve()
+            return resolved
+
+    def scandir(self, path: str) -> Sequence[os.DirEntry]:
+        """
+        Retrieve the entries of the directory at path, sorted by name.
+
+        Args:
+            path (str): The directory to scan.
+
+        Returns:
+            Sequence[os.DirEntry]: The entries of the directory.
+
+        Exceptions:
+            OSError: Thrown when the directory cannot be scanned.
+        """
+        try:
+            return self._entries[path]
+        except KeyError:
+            pass
+
+        with os.scandir(path) as entries:
+            result = sorted(entries, key=lambda entry: entry.name)
+        self._entries[path] = result
+        return result
+
+
+_current_cache: contextvars.ContextVar[Optional[FileSystemCache]] = (
+    contextvars.ContextVar("sbe.eggstensibility.filesystem_cache", default=None)
+)
+
+
+@contextlib.contextmanager
+def filesystem_cache(
+    cache: Optional[FileSystemCache] = None,
+) -> Iterator[FileSystemCache]:
+    """
+    Use a FileSystemCache for the file system queries within the context.
+
+    The cache is stored in a context variable, thus it is not available on other
+    threads, unless they run within a copy of the context, e.g. with
+    `contextvars.copy_context().run`.
+
+    Args:
+        cache (Optional[FileSystemCache]): The cache to use, or None for a new cache.
+
+    Returns:
+        Iterator[FileSystemCache]: The cache used within the context.
+    """
+    cache = cache if cache is not None else FileSystemCache()
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def resolve_path(path: Path) -> Path:
+    """Resolve path, through the FileSystemCache of the current context, if any."""
+    cache = _current_cache.get()
+    return cache.resolve(path) if cache is not None else path.resolve()
+
+
+def is_file(path: Path) -> bool:
+    """Whether path is a file, through the FileSystemCache of the current context."""
+    cache = _current_cache.get()
+    if cache is None:
+        return path.is_file()
+
+    result = cache.stat(path)
+    return result is not None and stat.S_ISREG(result.st_mode)
+
+
+def scandir(path: str) -> Sequence[os.DirEntry]:
+    """
+    Retrieve the entries of the directory at path sorted by name, through the
+    FileSystemCache of the current context, if any.
+
+    Exceptions:
+        OSError: Thrown when the directory cannot be scanned.
+    """
+    cache = _current_cache.get()
+    if cache is not None:
+        return cache.scandir(path)
+
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
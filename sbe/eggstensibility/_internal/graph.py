@@ -0,0 +1,294 @@
+"""
+sbe.eggstensibility.graph provides the immutable, queryable dependency graph of a set
+of ordered descriptions.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from ..exceptions import MissingDependencyException
+from .order import OrderedDescriptions, ResolveDependency, ResolveIdentifier
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+
+
+class ExtensionGraph(Generic[DescriptionT, DescriptionIdentifierT]):
+    """
+    ExtensionGraph indexes the dependency graph of a set of ordered descriptions.
+
+    The graph is built once, calling the identifier and dependency resolver once per
+    description, or from the identifiers and dependencies resolved while ordering the
+    descriptions, see `from_ordered`, after which every query is answered from precomputed indices: the
+    description, position, generation and direct dependencies and dependents of an
+    identifier are looked up in constant time, and the transitive dependencies and
+    dependents of an identifier are computed upon the first query and cached.
+
+    The graph is immutable, and can be shared in between threads.
+    """
+
+    def __init__(
+        self,
+        descriptions: Iterable[DescriptionT],
+        identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+        dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+    ) -> None:
+        """
+        Create a new ExtensionGraph of the given descriptions.
+
+        Args:
+            descriptions (Iterable[DescriptionT]):
+                The descriptions, ordered based upon their dependencies.
+            identifier_resolver (ResolveIdentifier):
+                The resolver used to obtain identifiers of descriptions.
+            dependency_resolver (ResolveDependency):
+                The resolver used to obtain dependencies of descriptions.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when a description depends on an identifier which does not
+                precede it in the descriptions.
+        """
+        ordered_descriptions = tuple(descriptions)
+        ids = tuple(map(identifier_resolver, ordered_descriptions))
+        positions: Dict[DescriptionIdentifierT, int] = {}
+        dependencies: List[Tuple[int, ...]] = []
+
+        for position, (extension_id, description) in enumerate(
+            zip(ids, ordered_descriptions)
+        ):
+            dependency_ids = tuple(dependency_resolver(description))
+            if missing := [d for d in dependency_ids if d not in positions]:
+                raise MissingDependencyException(
+                    f"The dependencies {missing} of '{extension_id}' do not precede it "
+                    "in the provided descriptions.",
+                    {extension_id: missing},
+                )
+
+            dependencies.append(tuple(positions[d] for d in dependency_ids))
+            positions[extension_id] = position
+
+        self._index(ordered_descriptions, ids, dependencies)
+
+    @classmethod
+    def from_ordered(
+        cls, ordered: OrderedDescriptions
+    ) -> ExtensionGraph[DescriptionT, DescriptionIdentifierT]:
+        """
+        Create a new ExtensionGraph of descriptions ordered by
+        OrderExtensionDescriptions, without resolving them again.
+
+        Args:
+            ordered (OrderedDescriptions):
+                The ordered descriptions, their identifiers and dependencies.
+
+        Returns:
+            ExtensionGraph: The graph of the ordered descriptions.
+        """
+        graph = cls.__new__(cls)
+        graph._index(
+            tuple(ordered.descriptions),
+            tuple(ordered.extension_ids),
+            ordered.dependencies,
+        )
+        return graph
+
+    def _index(
+        self,
+        descriptions: Tuple[DescriptionT, ...],
+        ids: Tuple[DescriptionIdentifierT, ...],
+        dependencies: Sequence[Tuple[int, ...]],
+    ) -> None:
+        self._descriptions = descriptions
+        self._ids = ids
+        self._positions: Dict[DescriptionIdentifierT, int] = {}
+
+        dependents: List[List[int]] = [[] for _ in descriptions]
+        generations: List[int] = []
+
+        for position, (extension_id, node_dependencies) in enumerate(
+            zip(ids, dependencies)
+        ):
+            for dependency in node_dependencies:
+                dependents[dependency].append(position)
+
+            generations.append(
+                1 + max((generations[d] for d in node_dependencies), default=-1)
+            )
+            self._positions[extension_id] = position
+
+        self._dependencies = tuple(dependencies)
+        self._dependents = tuple(map(tuple, dependents))
+        self._dependency_ids = tuple(self._to_ids(d) for d in self._dependencies)
+        self._dependent_ids = tuple(self._to_ids(d) for d in self._dependents)
+        self._generations = tuple(generations)
+        self._grouped_generations = self._group_generations()
+        self._transitive_dependencies: Dict[
+            int, Tuple[DescriptionIdentifierT, ...]
+        ] = {}
+        self._transitive_dependents: Dict[int, Tuple[DescriptionIdentifierT, ...]] = {}
+
+    def _to_ids(self, positions: Iterable[int]) -> Tuple[DescriptionIdentifierT, ...]:
+        return tuple(self._ids[position] for position in positions)
+
+    @property
+    def descriptions(self) -> Sequence[DescriptionT]:
+        """The descriptions of this graph, ordered based upon their dependencies."""
+        return self._descriptions
+
+    def _group_generations(self) -> Tuple[Tuple[DescriptionT, ...], ...]:
+        grouped: List[List[DescriptionT]] = []
+        for description, generation in zip(self._descriptions, self._generations):
+            if generation == len(grouped):
+                grouped.append([])
+            grouped[generation].append(description)
+        return tuple(map(tuple, grouped))
+
+    @property
+    def generations(self) -> Sequence[Sequence[DescriptionT]]:
+        """
+        The descriptions grouped by generation, every generation only depends on the
+        preceding generations.
+        """
+        return self._grouped_generations
+
+    def _position(self, extension_id: DescriptionIdentifierT) -> int:
+        try:
+            return self._positions[extension_id]
+        except KeyError:
+            raise KeyError(extension_id) from None
+
+    def get_description(self, extension_id: DescriptionIdentifierT) -> DescriptionT:
+        """
+        Retrieve the description with the given extension_id.
+
+        Args:
+            extension_id (DescriptionIdentifierT): The identifier of the description.
+
+        Returns:
+            DescriptionT: The description with the given identifier.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._descriptions[self._position(extension_id)]
+
+    def position(self, extension_id: DescriptionIdentifierT) -> int:
+        """
+        Retrieve the position of extension_id in the topological order.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._position(extension_id)
+
+    def generation(self, extension_id: DescriptionIdentifierT) -> int:
+        """
+        Retrieve the generation of extension_id, which is 0 for descriptions without
+        dependencies and one more than the generation of its latest dependency
+        otherwise.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._generations[self._position(extension_id)]
+
+    def dependencies(
+        self, extension_id: DescriptionIdentifierT
+    ) -> Sequence[DescriptionIdentifierT]:
+        """
+        Retrieve the identifiers extension_id directly depends on.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._dependency_ids[self._position(extension_id)]
+
+    def dependents(
+        self, extension_id: DescriptionIdentifierT
+    ) -> Sequence[DescriptionIdentifierT]:
+        """
+        Retrieve the identifiers which directly depend on extension_id, in
+        topological order.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._dependent_ids[self._position(extension_id)]
+
+    def _closure(
+        self,
+        position: int,
+        adjacency: Tuple[Tuple[int, ...], ...],
+        cache: Dict[int, Tuple[DescriptionIdentifierT, ...]],
+    ) -> Tuple[DescriptionIdentifierT, ...]:
+        if (closure := cache.get(position)) is not None:
+            return closure
+
+        reached = set()
+        pending = list(adjacency[position])
+        while pending:
+            current = pending.pop()
+            if current in reached:
+                continue
+            reached.add(current)
+            if (cached := cache.get(current)) is not None:
+                reached.update(self._positions[i] for i in cached)
+            else:
+                pending.extend(adjacency[current])
+
+        closure = self._to_ids(sorted(reached))
+        cache[position] = closure
+        return closure
+
+    def transitive_dependencies(
+        self, extension_id: DescriptionIdentifierT
+    ) -> Sequence[DescriptionIdentifierT]:
+        """
+        Retrieve the identifiers extension_id directly or indirectly depends on, in
+        topological order, i.e. the order in which they should be constructed.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._closure(
+            self._position(extension_id),
+            self._dependencies,
+            self._transitive_dependencies,
+        )
+
+    def transitive_dependents(
+        self, extension_id: DescriptionIdentifierT
+    ) -> Sequence[DescriptionIdentifierT]:
+        """
+        Retrieve the identifiers which directly or indirectly depend on extension_id,
+        in topological order.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._closure(
+            self._position(extension_id),
+            self._dependents,
+            self._transitive_dependents,
+        )
+
+    def __iter__(self) -> Iterator[DescriptionIdentifierT]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, extension_id: object) -> bool:
+        return extension_id in self._positions
@@ -0,0 +1,435 @@
+"""
+sbe.eggstensibility.host provides the extension host, which loads the extensions in a
+pool of worker processes and executes batches of calls to them over pipes.
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import queue
+import threading
+import traceback
+
+from multiprocessing.connection import Connection, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..exceptions import ExtensionHostException
+from .logging import IdentityLogger, Logger
+
+
+LoaderFactory = Callable[[], Any]
+
+
+class HostCall(NamedTuple):
+    """HostCall describes a single call of a method of a hosted extension."""
+
+    extension_id: Any
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Optional[Mapping[str, Any]] = None
+
+
+# A call either succeeds with its return value, or fails with its formatted traceback.
+_CallResult = Tuple[bool, Any]
+
+
+def _execute(registry: Mapping[Any, Any], call: HostCall) -> _CallResult:
+    try:
+        method = getattr(registry[call.extension_id], call.method)
+        return True, method(*call.args, **(call.kwargs or {}))
+    except Exception:
+        return False, traceback.format_exc()
+
+
+def _serve(
+    loader_factory: LoaderFactory,
+    targets: Optional[Sequence[Any]],
+    connection: Connection,
+) -> None:
+    try:
+        registry = loader_factory().load_extension_registry(targets)
+    except Exception:
+        connection.send((False, traceback.format_exc()))
+        return
+    connection.send((True, None))
+
+    while True:
+        try:
+            batch = connection.recv()
+        except EOFError:
+            return
+        if batch is None:
+            return
+
+        results = [_execute(registry, call) for call in batch]
+        try:
+            connection.send(results)
+        except Exception:
+            # The results are pickled before anything is written to the pipe.
+            connection.send([(False, traceback.format_exc())] * len(batch))
+
+
+class _Worker:
+    def __init__(
+        self,
+        context: Any,
+        loader_factory: LoaderFactory,
+        targets: Optional[Sequence[Any]],
+    ) -> None:
+        self.connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(loader_factory, targets, child_connection),
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        return self._process.exitcode
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def wait_ready(self) -> None:
+        try:
+            is_ready, error = self.connection.recv()
+        except (EOFError, OSError):
+            is_ready, error = False, "The worker process exited while loading."
+
+        if not is_ready:
+            self.stop()
+            raise ExtensionHostException(
+                f"Unable to load the extensions in a worker process:\n{error}"
+            )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self.connection.close()
+
+
+class ExtensionProxy:
+    """
+    ExtensionProxy exposes the methods of an extension hosted by an ExtensionHost.
+
+    Every method accessed on the proxy calls the method of the extension in a worker
+    process, e.g. `proxy.execute(msg)`. The arguments and return values are pickled,
+    and should therefore be picklable.
+    """
+
+    def __init__(self, host: ExtensionHost, extension_id: Any) -> None:
+        """
+        Create a new ExtensionProxy of the extension with extension_id.
+
+        Args:
+            host (ExtensionHost): The host of the extension.
+            extension_id (Any): The identifier of the extension.
+        """
+        self._host = host
+        self._extension_id = extension_id
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        return functools.partial(self._host.call, self._extension_id, method)
+
+    def map(self, method: str, *arguments: Iterable[Any]) -> List[Any]:
+        """
+        Call method once for every item of the arguments, in batches distributed over
+        the worker processes, similar to the built-in map.
+
+        Args:
+            method (str): The name of the method to call.
+            *arguments (Iterable[Any]): The iterables providing the arguments.
+
+        Returns:
+            List[Any]: The return value of each call, in the order of the arguments.
+
+        Exceptions:
+            ExtensionHostException: Thrown when any of the calls failed.
+        """
+        return self._host.call_batch(
+            HostCall(self._extension_id, method, args) for args in zip(*arguments)
+        )
+
+
+class ExtensionHost:
+    """
+    ExtensionHost loads the extensions inside a pool of worker processes, such that
+    CPU-bound extensions run in parallel on multiple cores, and an extension which
+    crashes its process does not take down the host application.
+
+    Each worker process calls the loader_factory to build a Loader, and loads its
+    ExtensionRegistry. The loader_factory is sent to the worker processes, and should
+    therefore be picklable, e.g. a module-level function building the loader. Calls
+    are sent to the workers in batches over pipes, batches of concurrent callers are
+    distributed over the idle workers. Workers which exit unexpectedly are restarted,
+    and the calls of their current batch fail.
+    """
+
+    def __init__(
+        self,
+        loader_factory: LoaderFactory,
+        workers: int = 1,
+        targets: Optional[Iterable[Any]] = None,
+        batch_size: int = 64,
+        start_method: Optional[str] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Create a new ExtensionHost. The worker processes are started with `start`, or
+        upon entering the host as a context manager.
+
+        Args:
+            loader_factory (Callable[[], Loader]):
+                The picklable callable building the Loader in each worker process. The
+                loader requires a configured ExtensionFactory.
+            workers (int): The number of worker processes, should be at least one.
+            targets (Optional[Iterable[Any]]):
+                The identifiers of the extensions to load, or None to load all.
+            batch_size (int):
+                The maximum number of calls sent to a worker at once, should be at
+                least one.
+            start_method (Optional[str]):
+                The multiprocessing start method, e.g. "spawn", or None to use the
+                default of the platform.
+            logger (Optional[Logger]): The logger used to report restarted workers.
+
+        Exceptions:
+            ValueError: Thrown when workers or batch_size is smaller than one.
+        """
+        if workers < 1:
+            raise ValueError(
+                f"The number of workers should be at least 1, got {workers}."
+            )
+        if batch_size < 1:
+            raise ValueError(f"The batch size should be at least 1, got {batch_size}.")
+
+        self._loader_factory = loader_factory
+        self._worker_count = workers
+        self._targets = list(targets) if targets is not None else None
+        self._batch_size = batch_size
+        self._context = multiprocessing.get_context(start_method)
+        self._logger = logger if logger is not None else IdentityLogger()
+
+        self._workers: List[_Worker] = []
+        self._idle_workers: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._restarts = 0
+
+    @property
+    def restarts(self) -> int:
+        """The number of worker processes restarted after exiting unexpectedly."""
+        return self._restarts
+
+    def _create_worker(self) -> _Worker:
+        return _Worker(self._context, self._loader_factory, self._targets)
+
+    def start(self) -> None:
+        """
+        Start the worker processes and wait until each of them loaded the extensions.
+
+        Exceptions:
+            ExtensionHostException:
+                Thrown when a worker process failed to load the extensions.
+        """
+        with self._lock:
+            if self._workers:
+                return
+
+            workers = [self._create_worker() for _ in range(self._worker_count)]
+            try:
+                for worker in workers:
+                    worker.wait_ready()
+            except ExtensionHostException:
+                for worker in workers:
+                    worker.stop()
+                raise
+
+            self._workers = workers
+            for worker in workers:
+                self._idle_workers.put(worker)
+
+    def close(self) -> None:
+        """Stop the worker processes, calls which are still running are aborted."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._idle_workers = queue.SimpleQueue()
+
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> ExtensionHost:
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _restart(self, worker: _Worker) -> _Worker:
+        self._logger.warning(
+            f"Restarting a worker process which exited with code {worker.exitcode}."
+        )
+        worker.stop()
+        replacement = self._create_worker()
+        replacement.wait_ready()
+
+        with self._lock:
+            self._workers = [replacement if w is worker else w for w in self._workers]
+            self._restarts += 1
+        return replacement
+
+    def _send(self, worker: _Worker, batch: List[HostCall]) -> _Worker:
+        if not worker.is_alive():
+            worker = self._restart(worker)
+        try:
+            worker.connection.send(batch)
+        except (BrokenPipeError, ConnectionResetError):
+            worker = self._restart(worker)
+            worker.connection.send(batch)
+        return worker
+
+    def _receive(self, worker: _Worker, size: int) -> Tuple[_Worker, List[_CallResult]]:
+        try:
+            return worker, worker.connection.recv()
+        except (EOFError, OSError):
+            pass
+
+        # The exit code is only available once the worker is stopped by the restart.
+        try:
+            replacement = self._restart(worker)
+        except ExtensionHostException as e:
+            # The stopped worker is returned to the pool, such that the restart is
+            # retried upon its next use rather than shrinking the pool.
+            replacement, restart_error = worker, f"\n{e}"
+        else:
+            restart_error = ""
+        error = (
+            f"The worker process exited unexpectedly with code {worker.exitcode}."
+            f"{restart_error}"
+        )
+        return replacement, [(False, error)] * size
+
+    def call_batch(self, calls: Iterable[HostCall]) -> List[Any]:
+        """
+        Execute the calls on the worker processes, and wait for all of them to finish.
+
+        The calls are split into batches of at most batch_size calls, which are
+        executed concurrently by the idle worker processes. The calls within a single
+        batch are executed sequentially in the same worker process.
+
+        Args:
+            calls (Iterable[HostCall]): The calls to execute.
+
+        Returns:
+            List[Any]: The return value of each call, in the order of the calls.
+
+        Exceptions:
+            ExtensionHostException:
+                Thrown when the host is not started, or when any of the calls failed,
+                after all of the calls finished.
+        """
+        if not self._workers:
+            raise ExtensionHostException("The extension host is not started.")
+
+        calls = list(calls)
+        pending = [
+            (start, calls[start : start + self._batch_size])
+            for start in range(0, len(calls), self._batch_size)
+        ]
+        pending.reverse()
+
+        results: List[Any] = [None] * len(calls)
+        errors: Dict[int, str] = {}
+        in_flight: Dict[Any, Tuple[_Worker, int, int]] = {}
+
+        try:
+            while pending or in_flight:
+                while pending:
+                    try:
+                        # Block for a worker only if this caller has nothing running.
+                        worker = self._idle_workers.get(block=not in_flight)
+                    except queue.Empty:
+                        break
+                    start, batch = pending.pop()
+                    try:
+                        worker = self._send(worker, batch)
+                    except BaseException:
+                        self._idle_workers.put(worker)
+                        raise
+                    in_flight[worker.connection] = (worker, start, len(batch))
+
+                for connection in wait(list(in_flight)):
+                    worker, start, size = in_flight.pop(connection)
+                    worker, batch_results = self._receive(worker, size)
+                    self._idle_workers.put(worker)
+
+                    for index, (is_success, value) in enumerate(batch_results, start):
+                        if is_success:
+                            results[index] = value
+                        else:
+                            errors[index] = value
+        finally:
+            # Drain the batches which are still running, such that their workers can
+            # be reused.
+            for worker, _, size in in_flight.values():
+                self._idle_workers.put(self._receive(worker, size)[0])
+
+        if errors:
+            raise ExtensionHostException(
+                f"{len(errors)} of {len(calls)} calls failed, the first error was:\n"
+                f"{errors[min(errors)]}",
+                errors,
+            )
+        return results
+
+    def call(self, extension_id: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call method of the extension with extension_id in a worker process.
+
+        Args:
+            extension_id (Any): The identifier of the extension.
+            method (str): The name of the method to call.
+            *args (Any): The positional arguments of the call.
+            **kwargs (Any): The keyword arguments of the call.
+
+        Returns:
+            Any: The return value of the call.
+
+        Exceptions:
+            ExtensionHostException: Thrown when the call failed.
+        """
+        return self.call_batch([HostCall(extension_id, method, args, kwargs)])[0]
+
+    def proxy(self, extension_id: Any) -> ExtensionProxy:
+        """
+        Create a proxy of the extension with extension_id.
+
+        Args:
+            extension_id (Any): The identifier of the extension.
+
+        Returns:
+            ExtensionProxy: The proxy calling the extension in the worker processes.
+        """
+        return ExtensionProxy(self, extension_id)
@@ -0,0 +1,115 @@
+"""
+sbe.eggstensibility.lazy provides the deferred execution of extension packages and
+their submodules with importlib.util.LazyLoader.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import threading
+
+from typing import Optional, Sequence, Set
+
+
+def make_lazy(spec: importlib.machinery.ModuleSpec) -> importlib.machinery.ModuleSpec:
+    """
+    Replace the loader of spec with a LazyLoader, such that the module is only executed
+    upon the first access of one of its attributes.
+
+    Args:
+        spec (ModuleSpec): The spec of the module to load lazily.
+
+    Returns:
+        ModuleSpec: The provided spec.
+    """
+    if spec.loader is not None and not isinstance(
+        spec.loader, importlib.util.LazyLoader
+    ):
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+    return spec
+
+
+class LazySubmoduleFinder(importlib.abc.MetaPathFinder):
+    """
+    LazySubmoduleFinder finds the submodules of the extension packages added to it,
+    e.g. the modules imported with `from . import heavy` by an extension module, and
+    loads them lazily.
+
+    Only the submodules of the added packages are found, such that resolvers sharing
+    a namespace do not load the submodules of each other's packages lazily.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a new LazySubmoduleFinder without any packages.
+        """
+        self._packages: Set[str] = set()
+
+    def add_package(self, name: str) -> None:
+        """
+        Find the submodules of the package with the fully qualified name.
+
+        Args:
+            name (str): The fully qualified name of the extension package.
+        """
+        self._packages.add(name)
+
+    def discard_package(self, name: str) -> None:
+        """
+        Stop finding the submodules of the package with the fully qualified name.
+
+        Args:
+            name (str): The fully qualified name of the extension package.
+        """
+        self._packages.discard(name)
+
+    def _is_submodule(self, fullname: str) -> bool:
+        parent, _, _ = fullname.rpartition(".")
+        while parent:
+            if parent in self._packages:
+                return True
+            parent, _, _ = parent.rpartition(".")
+        return False
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: object = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        # Only submodules are found, the extension packages themselves are
+        # initialized by the description resolvers.
+        if path is None or not self._is_submodule(fullname):
+            return None
+
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        return make_lazy(spec) if spec is not None else None
+
+
+_install_lock = threading.Lock()
+
+
+def install_lazy_finder(finder: LazySubmoduleFinder) -> None:
+    """
+    Install the finder in front of sys.meta_path, unless it is installed already.
+
+    Args:
+        finder (LazySubmoduleFinder): The finder to install.
+    """
+    with _install_lock:
+        if not any(installed is finder for installed in sys.meta_path):
+            sys.meta_path.insert(0, finder)
+
+
+def uninstall_lazy_finder(finder: LazySubmoduleFinder) -> None:
+    """
+    Remove the finder from sys.meta_path, if it is installed.
+
+    Args:
+        finder (LazySubmoduleFinder): The finder to remove.
+    """
+    with _install_lock:
+        sys.meta_path[:] = [
+            installed for installed in sys.meta_path if installed is not finder
+        ]
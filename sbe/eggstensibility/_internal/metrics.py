@@ -0,0 +1,106 @@
+"""
+sbe.eggstensibility.metrics provides the structured events describing the phases of
+loading extensions, and the observers receiving them.
+"""
+
+import time
+
+from typing import Iterable, Mapping, NamedTuple, Protocol, Sequence
+
+from .logging import Logger
+from .order import OrderingEngine
+
+
+class LoaderEvent(NamedTuple):
+    """
+    LoaderEvent describes a single completed phase of loading extensions.
+
+    The following phases are reported, with their counts:
+
+    * "harvest": "harvest_paths", "modules", and "cache_hits" and "cache_misses" if a
+      harvest cache is configured.
+    * "retrieve": "modules" and "descriptions".
+    * "select": "targets" and "descriptions", only reported when targets are provided.
+    * "order": "nodes" and "edges" of the dependency graph.
+    * "load": "descriptions", the duration covers all of the preceding phases.
+    * "stream": "modules" and "descriptions", reported once a stream of descriptions
+      is exhausted, instead of the preceding phases.
+    """
+
+    phase: str
+    duration: float
+    counts: Mapping[str, int]
+
+
+class LoaderObserver(Protocol):
+    def __call__(self, event: LoaderEvent) -> None:
+        """
+        Observe the provided event, e.g. by forwarding it to a metrics system.
+
+        Args:
+            event (LoaderEvent): The event describing a completed phase.
+        """
+
+
+class PhaseReporter:
+    """
+    PhaseReporter reports completed phases to the logger and the observers. Observers
+    which fail are reported to the logger, such that they never fail the load.
+    """
+
+    def __init__(self, logger: Logger, observers: Sequence[LoaderObserver]) -> None:
+        self._logger = logger
+        self._observers = observers
+
+    def __call__(self, phase: str, start: float, **counts: int) -> None:
+        """
+        Report the phase which started at the perf_counter value start.
+
+        Args:
+            phase (str): The name of the phase.
+            start (float): The time.perf_counter() value at the start of the phase.
+            counts (int): The counts describing the phase.
+        """
+        event = LoaderEvent(phase, time.perf_counter() - start, counts)
+        self._logger.debug(
+            f"Completed phase '{phase}' in {event.duration * 1000:.1f}ms: {counts}"
+        )
+
+        for observer in self._observers:
+            try:
+                observer(event)
+            except Exception as e:
+                self._logger.error(f"Observer {observer!r} failed: {e}")
+
+
+class CountingOrderingEngine:
+    """
+    CountingOrderingEngine wraps an OrderingEngine, recording the number of nodes and
+    edges of the last ordered dependency graph.
+    """
+
+    def __init__(self, engine: OrderingEngine) -> None:
+        self._engine = engine
+        self.nodes = 0
+        self.edges = 0
+
+    def __call__(self, dependencies: Sequence[Sequence[int]]) -> Sequence[int]:
+        self.nodes = len(dependencies)
+        self.edges = sum(map(len, dependencies))
+        return self._engine(dependencies)
+
+
+def configure_loggers(components: Iterable[object], logger: Logger) -> None:
+    """
+    Configure the logger of every component which supports a logger, i.e. defines a
+    `configure_logger(logger)` method.
+
+    Args:
+        components (Iterable[object]): The resolvers and other configured components.
+        logger (Logger): The logger to configure.
+    """
+    for component in components:
+        if (
+            configure_logger := getattr(component, "configure_logger", None)
+        ) is not None:
+            configure_logger(logger)
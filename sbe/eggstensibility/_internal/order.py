@@ -2,9 +2,25 @@
 sbe.eggstensibility.order provides the default order logic.
 """
 
-from typing import Generic, Iterable, Protocol, TypeVar
-
-import networkx as nx  # type: ignore
+import itertools
+
+from array import array
+from collections import deque
+from typing import (
+    Any,
+    Container,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ..exceptions import CircularDependencyException, MissingDependencyException
 from .description import DefaultDescription, ExtensionID
@@ -111,10 +127,256 @@ class DefaultResolveDependency:
         return description.dependencies
 
 
+class OrderingEngine(Protocol):
+    """
+    OrderingEngine topologically sorts a dependency graph of which the nodes are
+    identified by their index.
+    """
+
+    def __call__(self, dependencies: Sequence[Sequence[int]]) -> Sequence[int]:
+        """
+        Sort the nodes described by dependencies such that every node is preceded by
+        the nodes it depends on.
+
+        Args:
+            dependencies (Sequence[Sequence[int]]):
+                For each node, the indices of the nodes it depends on.
+
+        Returns:
+            Sequence[int]:
+                The sorted node indices. If the graph contains a cycle, the nodes part
+                of or depending on the cycle are omitted.
+        """
+
+
+class DefaultOrderingEngine:
+    """
+    DefaultOrderingEngine sorts the dependency graph with Kahn's algorithm in linear
+    time.
+
+    The dependents of all nodes are stored as a compressed sparse row adjacency, a
+    single integer array indexed by the offset of each node, rather than as a list per
+    node. This roughly halves the memory of large graphs.
+
+    Ties are broken deterministically: nodes are emitted in the order in which they
+    become available, and nodes which become available at the same time are emitted in
+    the order in which they were provided.
+    """
+
+    def __call__(self, dependencies: Sequence[Sequence[int]]) -> Sequence[int]:
+        """
+        Sort the nodes described by dependencies such that every node is preceded by
+        the nodes it depends on.
+
+        Args:
+            dependencies (Sequence[Sequence[int]]):
+                For each node, the indices of the nodes it depends on.
+
+        Returns:
+            Sequence[int]:
+                The sorted node indices. If the graph contains a cycle, the nodes part
+                of or depending on the cycle are omitted.
+        """
+        node_count = len(dependencies)
+        in_degrees = [len(node_dependencies) for node_dependencies in dependencies]
+
+        # The dependents of node n are dependents[offsets[n]:offsets[n + 1]], in
+        # ascending order.
+        offsets = [0] * (node_count + 1)
+        for node_dependencies in dependencies:
+            for dependency in node_dependencies:
+                offsets[dependency + 1] += 1
+        offsets = list(itertools.accumulate(offsets))
+
+        dependents = array("i", [0]) * offsets[node_count]
+        positions = offsets[:node_count]
+        for node, node_dependencies in enumerate(dependencies):
+            for dependency in node_dependencies:
+                dependents[positions[dependency]] = node
+                positions[dependency] += 1
+        del positions
+
+        available = deque(node for node in range(node_count) if in_degrees[node] == 0)
+        order: List[int] = []
+
+        while available:
+            node = available.popleft()
+            order.append(node)
+
+            for dependent in dependents[offsets[node] : offsets[node + 1]]:
+                in_degrees[dependent] -= 1
+                if in_degrees[dependent] == 0:
+                    available.append(dependent)
+
+        return order
+
+
+class NetworkXOrderingEngine:
+    """
+    NetworkXOrderingEngine sorts the dependency graph with networkx.
+
+    networkx is an optional dependency, which can be installed with the `networkx`
+    extra of this package. It is only imported once the engine is invoked.
+    """
+
+    def __call__(self, dependencies: Sequence[Sequence[int]]) -> Sequence[int]:
+        """
+        Sort the nodes described by dependencies such that every node is preceded by
+        the nodes it depends on.
+
+        Args:
+            dependencies (Sequence[Sequence[int]]):
+                For each node, the indices of the nodes it depends on.
+
+        Returns:
+            Sequence[int]:
+                The sorted node indices. If the graph contains a cycle, no nodes are
+                returned.
+        """
+        import networkx as nx  # type: ignore
+
+        dag = nx.DiGraph()
+        dag.add_nodes_from(range(len(dependencies)))
+        dag.add_edges_from(
+            (dependency, node)
+            for node, node_dependencies in enumerate(dependencies)
+            for dependency in node_dependencies
+        )
+
+        if not nx.is_directed_acyclic_graph(dag):
+            return []
+
+        return list(nx.topological_sort(dag))
+
+
 DescriptionT = TypeVar("DescriptionT")
 DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
 
 
+def select_dependency_closure(
+    descriptions: Iterable[DescriptionT],
+    targets: Iterable[DescriptionIdentifierT],
+    identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+    dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+) -> List[DescriptionT]:
+    """
+    Select the descriptions of the targets and all of their transitive dependencies.
+
+    Args:
+        descriptions (Iterable[DescriptionT]):
+            The descriptions to select from.
+        targets (Iterable[DescriptionIdentifierT]):
+            The identifiers of the descriptions to select.
+        identifier_resolver (ResolveIdentifier):
+            The resolver used to obtain identifiers of descriptions.
+        dependency_resolver (ResolveDependency):
+            The resolver used to obtain dependencies of descriptions.
+
+    Returns:
+        List[DescriptionT]:
+            The selected descriptions, in the order in which they were provided.
+            Like OrderExtensionDescriptions, the first description of an identifier
+            is selected. Dependencies which are not part of the provided descriptions
+            are left to be reported when ordering the selected descriptions.
+
+    Exceptions:
+        MissingDependencyException:
+            Thrown when any of the targets is not part of the provided descriptions.
+    """
+    description_map: Dict[DescriptionIdentifierT, DescriptionT] = {}
+    for description in descriptions:
+        description_map.setdefault(identifier_resolver(description), description)
+
+    pending = list(targets)
+    if missing_targets := [t for t in pending if t not in description_map]:
+        raise MissingDependencyException(
+            f"The targets {missing_targets} are not part of the provided descriptions."
+        )
+
+    selected = set()
+    while pending:
+        extension_id = pending.pop()
+        if extension_id in selected or extension_id not in description_map:
+            continue
+        selected.add(extension_id)
+        pending.extend(dependency_resolver(description_map[extension_id]))
+
+    return [
+        description
+        for extension_id, description in description_map.items()
+        if extension_id in selected
+    ]
+
+
+def group_dependency_levels(
+    descriptions: Iterable[DescriptionT],
+    identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+    dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+) -> List[List[DescriptionT]]:
+    """
+    Group the ordered descriptions into dependency levels, also known as generations.
+
+    The first level contains the descriptions without dependencies, and every
+    subsequent level contains the descriptions of which all dependencies are part of
+    the preceding levels. Descriptions within the same level are independent of each
+    other.
+
+    Args:
+        descriptions (Iterable[DescriptionT]):
+            The descriptions, ordered based upon their dependencies.
+        identifier_resolver (ResolveIdentifier):
+            The resolver used to obtain identifiers of descriptions.
+        dependency_resolver (ResolveDependency):
+            The resolver used to obtain dependencies of descriptions.
+
+    Returns:
+        List[List[DescriptionT]]:
+            The dependency levels, each level retains the order of the descriptions.
+
+    Exceptions:
+        MissingDependencyException:
+            Thrown when a description depends on an identifier which does not precede
+            it in the descriptions.
+    """
+    description_levels: Dict[DescriptionIdentifierT, int] = {}
+    levels: List[List[DescriptionT]] = []
+
+    for description in descriptions:
+        extension_id = identifier_resolver(description)
+        dependency_ids = tuple(dependency_resolver(description))
+        if missing := [d for d in dependency_ids if d not in description_levels]:
+            raise MissingDependencyException(
+                f"The dependencies {missing} of '{extension_id}' do not precede it "
+                "in the provided descriptions.",
+                {extension_id: missing},
+            )
+
+        level = 1 + max(
+            (description_levels[dependency_id] for dependency_id in dependency_ids),
+            default=-1,
+        )
+        description_levels[extension_id] = level
+
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(description)
+
+    return levels
+
+
+class OrderedDescriptions(NamedTuple):
+    """
+    OrderedDescriptions holds the descriptions ordered by OrderExtensionDescriptions,
+    together with their resolved identifiers and dependencies, such that they can be
+    indexed without resolving them again.
+    """
+
+    descriptions: List[Any]
+    extension_ids: List[Any]
+    # The positions of the dependencies of each description, within descriptions.
+    dependencies: List[Tuple[int, ...]]
+
+
 class OrderExtensionDescriptions(Generic[DescriptionT, DescriptionIdentifierT]):
     """
     OrderExtensionDescriptions is responsible for ordering the descriptions based upon their
@@ -129,6 +391,7 @@ class OrderExtensionDescriptions(Generic[DescriptionT, DescriptionIdentifierT]):
         description_dependency_resolver: ResolveDependency[
             DescriptionT, DescriptionIdentifierT
         ],
+        ordering_engine: Optional[OrderingEngine] = None,
     ) -> None:
         """
         Create a new DefaultOrderExtensionDescriptions.
@@ -140,56 +403,265 @@ class OrderExtensionDescriptions(Generic[DescriptionT, DescriptionIdentifierT]):
             description_dependency_resolver (ResolveDependency):
                 The resolver used to retrieve the extensions descriptions that a given
                 extension description relies on.
+            ordering_engine (Optional[OrderingEngine]):
+                The engine used to sort the dependency graph, defaults to the
+                DefaultOrderingEngine.
         """
         self._identifier_resolver = description_identifier_resolver
         self._dependency_resolver = description_dependency_resolver
+        self._ordering_engine = (
+            ordering_engine if ordering_engine is not None else DefaultOrderingEngine()
+        )
 
     def __call__(
-        self, extension_descriptions: Iterable[DescriptionT]
+        self,
+        extension_descriptions: Iterable[DescriptionT],
+        available_ids: Container[DescriptionIdentifierT] = (),
     ) -> Iterable[DescriptionT]:
         """
         Order the provided extension_descriptions based on their dependencies.
 
+        Descriptions sharing their identifier with a preceding description, e.g. the
+        descriptions of a module retrieved by multiple description resolvers, are
+        omitted.
+
         Args:
             extension_descriptions (Iterable[DescriptionT]):
                 The extension descriptions to sort
+            available_ids (Container[DescriptionIdentifierT]):
+                The identifiers of the descriptions ordered before the provided
+                descriptions. Dependencies upon them are satisfied, and provided
+                descriptions sharing their identifier are omitted.
 
         Returns:
             Iterable[DescriptionT]: The ordered description based on their dependencies
-        """
-        descriptions = list(extension_descriptions)
-        available_extension_ids = {
-            self._identifier_resolver(description) for description in descriptions
-        }
-        required_ids = {
-            extension_id
-            for description in descriptions
-            for extension_id in self._dependency_resolver(description)
-        }
-
-        if not required_ids.issubset(available_extension_ids):
-            raise MissingDependencyException(
-                "The set of dependency descriptions is not a subset of the provided descriptions."
-            )
 
-        dag = nx.DiGraph()
+        Exceptions:
+            MissingDependencyException:
+                Thrown when descriptions depend on identifiers which are not provided,
+                the missing identifiers of each description are reported by its
+                `missing` property.
+        """
+        return self.order(extension_descriptions, available_ids).descriptions
 
-        description_map = dict()
+    def order(
+        self,
+        extension_descriptions: Iterable[DescriptionT],
+        available_ids: Container[DescriptionIdentifierT] = (),
+    ) -> OrderedDescriptions:
+        """
+        Order the provided extension_descriptions based on their dependencies, and
+        retain their resolved identifiers and dependencies, see `__call__`.
 
-        for description in descriptions:
-            description_id = self._identifier_resolver(description)
-            description_map[description_id] = description
-            dag.add_node(description_id)
+        Args:
+            extension_descriptions (Iterable[DescriptionT]):
+                The extension descriptions to sort
+            available_ids (Container[DescriptionIdentifierT]):
+                The identifiers of the descriptions ordered before the provided
+                descriptions. Dependencies upon them are satisfied, and provided
+                descriptions sharing their identifier are omitted.
 
-        for description in descriptions:
+        Returns:
+            OrderedDescriptions:
+                The ordered descriptions, their identifiers and the positions of their
+                dependencies. Dependencies upon available_ids are omitted.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when descriptions depend on identifiers which are not provided,
+                the missing identifiers of each description are reported by its
+                `missing` property.
+        """
+        # Every resolver is invoked exactly once per description. Descriptions which
+        # share an identifier describe the same node, only the first is retained.
+        descriptions: List[DescriptionT] = []
+        extension_ids = []
+        dependency_ids = []
+        description_indices: Dict[DescriptionIdentifierT, int] = {}
+        for description in extension_descriptions:
             extension_id = self._identifier_resolver(description)
-            if deps := list(self._dependency_resolver(description)):
-                dag.add_edges_from(((dep_id, extension_id) for dep_id in deps))
+            if extension_id in description_indices or extension_id in available_ids:
+                continue
+            description_indices[extension_id] = len(descriptions)
+            descriptions.append(description)
+            extension_ids.append(extension_id)
+            dependency_ids.append(tuple(self._dependency_resolver(description)))
+
+        dependencies = []
+        missing: Dict[DescriptionIdentifierT, List[DescriptionIdentifierT]] = {}
+
+        for extension_id, node_dependency_ids in zip(extension_ids, dependency_ids):
+            node_dependencies = []
+            for dependency_id in node_dependency_ids:
+                if (index := description_indices.get(dependency_id)) is not None:
+                    node_dependencies.append(index)
+                elif dependency_id not in available_ids:
+                    missing.setdefault(extension_id, []).append(dependency_id)
+            dependencies.append(tuple(node_dependencies))
+
+        if missing:
+            raise MissingDependencyException(
+                "The descriptions depend on unavailable descriptions: "
+                + ", ".join(f"'{i}' requires {ids}" for i, ids in missing.items()),
+                missing,
+            )
 
-        if not nx.is_directed_acyclic_graph(dag):
+        order = self._ordering_engine(dependencies)
+
+        if len(order) != len(descriptions):
             raise CircularDependencyException(
                 "There is a circular dependency in the provided extension descriptions.",
                 descriptions,
             )
 
-        return [description_map[n] for n in nx.topological_sort(dag)]
+        positions = [0] * len(descriptions)
+        for position, index in enumerate(order):
+            positions[index] = position
+
+        return OrderedDescriptions(
+            [descriptions[index] for index in order],
+            [extension_ids[index] for index in order],
+            [tuple(positions[d] for d in dependencies[index]) for index in order],
+        )
+
+
+class _PendingDescription(Generic[DescriptionT, DescriptionIdentifierT]):
+    __slots__ = ("description", "extension_id", "remaining")
+
+    def __init__(
+        self,
+        description: DescriptionT,
+        extension_id: DescriptionIdentifierT,
+        remaining: int,
+    ) -> None:
+        self.description = description
+        self.extension_id = extension_id
+        self.remaining = remaining
+
+
+class IncrementalOrderExtensionDescriptions(
+    Generic[DescriptionT, DescriptionIdentifierT]
+):
+    """
+    IncrementalOrderExtensionDescriptions orders descriptions as they are added, rather
+    than ordering a complete set of descriptions at once.
+
+    Every added description is released as soon as all of its dependencies have been
+    released, thus the released descriptions are ordered based upon their
+    dependencies. Descriptions of which a dependency has not been added yet are held
+    back until it is added. Each resolver is called once per description, descriptions
+    sharing their identifier with a previously added description are omitted.
+    """
+
+    def __init__(
+        self,
+        description_identifier_resolver: ResolveIdentifier[
+            DescriptionT, DescriptionIdentifierT
+        ],
+        description_dependency_resolver: ResolveDependency[
+            DescriptionT, DescriptionIdentifierT
+        ],
+    ) -> None:
+        """
+        Create a new IncrementalOrderExtensionDescriptions.
+
+        Args:
+            description_identifier_resolver (ResolveIdentifier):
+                The resolver used to retrieve the unique identifier of a provided
+                extension description
+            description_dependency_resolver (ResolveDependency):
+                The resolver used to retrieve the identifiers of the descriptions an
+                extension description relies on.
+        """
+        self._identifier_resolver = description_identifier_resolver
+        self._dependency_resolver = description_dependency_resolver
+        self._added: Set[DescriptionIdentifierT] = set()
+        self._released: Set[DescriptionIdentifierT] = set()
+        self._waiting: Dict[
+            DescriptionIdentifierT,
+            List[_PendingDescription[DescriptionT, DescriptionIdentifierT]],
+        ] = {}
+        # Insertion ordered set of the descriptions which have not been released.
+        self._pending: Dict[
+            _PendingDescription[DescriptionT, DescriptionIdentifierT], None
+        ] = {}
+
+    def add(self, description: DescriptionT) -> List[DescriptionT]:
+        """
+        Add the description, and release every description which became ready.
+
+        Args:
+            description (DescriptionT): The description to add.
+
+        Returns:
+            List[DescriptionT]:
+                The released descriptions, ordered based upon their dependencies.
+        """
+        extension_id = self._identifier_resolver(description)
+        if extension_id in self._added:
+            return []
+        self._added.add(extension_id)
+
+        remaining = [
+            dependency_id
+            for dependency_id in dict.fromkeys(self._dependency_resolver(description))
+            if dependency_id not in self._released
+        ]
+        pending = _PendingDescription(description, extension_id, len(remaining))
+        if remaining:
+            self._pending[pending] = None
+            for dependency_id in remaining:
+                self._waiting.setdefault(dependency_id, []).append(pending)
+            return []
+
+        released = []
+        ready = deque([pending])
+        while ready:
+            current = ready.popleft()
+            released.append(current.description)
+            self._released.add(current.extension_id)
+
+            for dependent in self._waiting.pop(current.extension_id, ()):
+                dependent.remaining -= 1
+                if dependent.remaining == 0:
+                    del self._pending[dependent]
+                    ready.append(dependent)
+        return released
+
+    @property
+    def pending(self) -> List[DescriptionT]:
+        """The added descriptions which have not been released, in the added order."""
+        return [pending.description for pending in self._pending]
+
+    def finish(self) -> None:
+        """
+        Verify that every added description has been released.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when descriptions depend on identifiers which have not been
+                added, the missing identifiers of each description are reported by its
+                `missing` property.
+            CircularDependencyException:
+                Thrown when the descriptions which have not been released depend on
+                each other.
+        """
+        if not self._pending:
+            return
+
+        missing: Dict[DescriptionIdentifierT, List[DescriptionIdentifierT]] = {}
+        for dependency_id, dependents in self._waiting.items():
+            if dependency_id not in self._added:
+                for dependent in dependents:
+                    missing.setdefault(dependent.extension_id, []).append(dependency_id)
+
+        if missing:
+            raise MissingDependencyException(
+                "The descriptions depend on unavailable descriptions: "
+                + ", ".join(f"'{i}' requires {ids}" for i, ids in missing.items()),
+                missing,
+            )
+        raise CircularDependencyException(
+            "There is a circular dependency in the provided extension descriptions.",
+            self.pending,
+        )
@@ -0,0 +1,93 @@
+"""
+sbe.eggstensibility.pipeline provides the pipeline, which streams messages through the
+ordered extensions in batches.
+"""
+
+import itertools
+
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
+
+
+_Stage = Callable[[List[Any]], Iterable[Any]]
+
+
+def _batches(messages: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(messages)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+class Pipeline:
+    """
+    Pipeline feeds messages through a sequence of extensions, in the order of the
+    extensions, e.g. the dependency order of their descriptions.
+
+    The messages are processed in batches: each batch is passed through every
+    extension before the next batch is read from the messages. Extensions defining an
+    `execute_batch(messages)` method receive the complete batch at once, and return
+    the messages passed to the next extension. Any other extension has its
+    `execute(message)` method called for each message of the batch. At most a single
+    batch is held in memory, regardless of the number of messages.
+    """
+
+    def __init__(
+        self,
+        extensions: Iterable[Any],
+        batch_size: int = 256,
+        method: str = "execute",
+        batch_method: str = "execute_batch",
+    ) -> None:
+        """
+        Create a new Pipeline of the given extensions.
+
+        Args:
+            extensions (Iterable[Any]): The extensions, in the order to execute them.
+            batch_size (int):
+                The maximum number of messages in a batch, should be at least one.
+            method (str): The name of the method processing a single message.
+            batch_method (str): The name of the method processing a batch of messages.
+
+        Exceptions:
+            ValueError: Thrown when the batch_size is smaller than one.
+            AttributeError: Thrown when an extension defines neither method.
+        """
+        if batch_size < 1:
+            raise ValueError(f"The batch size should be at least 1, got {batch_size}.")
+
+        self._extensions = list(extensions)
+        self._batch_size = batch_size
+        self._stages = [
+            self._create_stage(extension, method, batch_method)
+            for extension in self._extensions
+        ]
+
+    @staticmethod
+    def _create_stage(extension: Any, method: str, batch_method: str) -> _Stage:
+        if (execute_batch := getattr(extension, batch_method, None)) is not None:
+            return execute_batch
+
+        execute = getattr(extension, method)
+        return lambda batch: [execute(message) for message in batch]
+
+    @property
+    def extensions(self) -> Sequence[Any]:
+        """The extensions of this pipeline, in the order they are executed."""
+        return self._extensions
+
+    def __call__(self, messages: Iterable[Any]) -> Iterator[Any]:
+        """
+        Feed the messages through the extensions.
+
+        The messages are consumed lazily, batch by batch, and the results of a batch
+        are yielded once the batch passed through all extensions.
+
+        Args:
+            messages (Iterable[Any]): The messages to process.
+
+        Returns:
+            Iterator[Any]: The messages returned by the last extension.
+        """
+        for batch in _batches(messages, self._batch_size):
+            for stage in self._stages:
+                batch = list(stage(batch))
+            yield from batch
@@ -0,0 +1,156 @@
+"""
+sbe.eggstensibility.plan provides the load plan, a snapshot of the ordered descriptions
+of a load, which allows the loader to skip harvesting and ordering upon subsequent
+loads of the same extensions.
+"""
+
+import hashlib
+import json
+
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from .archive import _archive_path
+from .atomic import atomic_write_json
+
+
+# Plans written with any other version are ignored by LoadPlan.load.
+_PLAN_VERSION = 1
+
+
+def fingerprint(module_path: Path) -> Optional[str]:
+    """
+    Compute the fingerprint of the content of the extension module at module_path.
+
+    The fingerprint covers the module and, for modules within a package, the
+    `__init__.py` of the package. Modules within an archive are fingerprinted by the
+    content of the archive.
+
+    Args:
+        module_path (Path): The path to the extension module.
+
+    Returns:
+        Optional[str]: The hex sha256 digest, or None if the module cannot be read.
+    """
+    archive_path = _archive_path(module_path)
+    paths = (
+        [archive_path]
+        if archive_path is not None
+        else [module_path, module_path.parent / "__init__.py"]
+    )
+
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except FileNotFoundError:
+            if path == module_path:
+                return None
+        except OSError:
+            return None
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PlanEntry(NamedTuple):
+    """
+    PlanEntry describes a single description of a load plan.
+
+    The namespace is the module namespace reported by the description resolver, if it
+    defines a `module_namespace(module_path)` method, and None otherwise.
+    """
+
+    module_path: Path
+    namespace: Optional[str]
+    resolver: int
+    extension_id: Any
+    dependencies: List[Any]
+    fingerprint: Optional[str]
+
+
+class LoadPlan:
+    """
+    LoadPlan holds the ordered descriptions of a load, identified by the module they
+    were defined in and the index of the description resolver which retrieved them,
+    together with the configuration of the loader which created it.
+
+    Identifiers are stored as JSON, and should therefore be strings or numbers.
+    """
+
+    def __init__(self, configuration: str, entries: Sequence[PlanEntry]) -> None:
+        """
+        Create a new LoadPlan.
+
+        Args:
+            configuration (str):
+                The key describing the harvest paths and resolvers of the loader.
+            entries (Sequence[PlanEntry]):
+                The entries, ordered based upon their dependencies.
+        """
+        self._configuration = configuration
+        self._entries = tuple(entries)
+
+    @property
+    def configuration(self) -> str:
+        """The key describing the harvest paths and resolvers of the loader."""
+        return self._configuration
+
+    @property
+    def entries(self) -> Sequence[PlanEntry]:
+        """The entries, ordered based upon their dependencies."""
+        return self._entries
+
+    def dump(self, path: Path) -> None:
+        """
+        Write the plan as JSON to path, replacing any existing plan atomically.
+
+        Args:
+            path (Path): The file to write the plan to.
+
+        Exceptions:
+            TypeError: Thrown when an identifier cannot be serialized to JSON.
+        """
+        content = {
+            "version": _PLAN_VERSION,
+            "configuration": self._configuration,
+            "entries": [
+                {**entry._asdict(), "module_path": str(entry.module_path)}
+                for entry in self._entries
+            ],
+        }
+        atomic_write_json(path, content)
+
+    @staticmethod
+    def load(path: Path) -> Optional["LoadPlan"]:
+        """
+        Read the plan written to path.
+
+        Args:
+            path (Path): The file the plan was written to.
+
+        Returns:
+            Optional[LoadPlan]:
+                The plan, or None if the file cannot be read or has an unknown layout.
+        """
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") != _PLAN_VERSION:
+                return None
+
+            return LoadPlan(
+                content["configuration"],
+                [
+                    PlanEntry(
+                        Path(entry["module_path"]),
+                        entry["namespace"],
+                        entry["resolver"],
+                        entry["extension_id"],
+                        entry["dependencies"],
+                        entry["fingerprint"],
+                    )
+                    for entry in content["entries"]
+                ],
+            )
+        except (OSError, ValueError, AttributeError, KeyError, TypeError):
+            return None
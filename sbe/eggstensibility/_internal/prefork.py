@@ -0,0 +1,175 @@
+"""
+sbe.eggstensibility.prefork provides the extension registry of pre-fork servers, which
+warms up the extensions in the parent process such that their memory is shared with
+the forked worker processes.
+"""
+
+import gc
+import os
+import threading
+import weakref
+
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from .logging import IdentityLogger, Logger
+from .order import ResolveDependency, ResolveIdentifier
+from .registry import ExtensionFactory, ExtensionRegistry
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+ExtensionT = TypeVar("ExtensionT")
+
+
+class PreforkRegistry(
+    ExtensionRegistry[DescriptionT, DescriptionIdentifierT, ExtensionT]
+):
+    """
+    PreforkRegistry is the ExtensionRegistry of pre-fork servers, which load the
+    extensions once in the parent process and then fork their worker processes.
+
+    Calling `prepare_fork` in the parent constructs the extensions which are safe to
+    share with forked processes, and freezes the garbage collector, such that the
+    memory of the loaded modules and constructed extensions stays shared copy-on-write
+    with the workers rather than being copied into each of them. The remaining
+    extensions are constructed within each worker upon first access.
+
+    Extensions constructed in the parent can recreate their resources which cannot be
+    shared, such as threads, locks or sockets, in each worker: after a fork, every
+    constructed extension defining an `after_fork()` method has it called, after the
+    hooks added with `add_after_fork`, in the order of the descriptions.
+    """
+
+    def __init__(
+        self,
+        descriptions: Iterable[DescriptionT],
+        identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+        dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+        extension_factory: ExtensionFactory[DescriptionT, ExtensionT],
+        fork_safe: Optional[Callable[[DescriptionT], bool]] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Create a new PreforkRegistry of the given descriptions.
+
+        Args:
+            descriptions (Iterable[DescriptionT]):
+                The descriptions, ordered based upon their dependencies.
+            identifier_resolver (ResolveIdentifier):
+                The resolver used to obtain identifiers of descriptions.
+            dependency_resolver (ResolveDependency):
+                The resolver used to obtain dependencies of descriptions.
+            extension_factory (ExtensionFactory):
+                The factory used to create the extensions of descriptions.
+            fork_safe (Optional[Callable[[DescriptionT], bool]]):
+                Whether the extension of a description can be constructed before
+                forking. If None, no extensions are constructed before forking.
+            logger (Optional[Logger]):
+                The logger used to report failing after fork hooks.
+        """
+        super().__init__(
+            descriptions, identifier_resolver, dependency_resolver, extension_factory
+        )
+        self._fork_safe = fork_safe
+        self._logger = logger if logger is not None else IdentityLogger()
+        self._after_fork_hooks: Dict[
+            DescriptionIdentifierT, List[Callable[[ExtensionT], None]]
+        ] = {}
+        self._is_registered = False
+
+    def add_after_fork(
+        self,
+        extension_id: DescriptionIdentifierT,
+        hook: Callable[[ExtensionT], None],
+    ) -> None:
+        """
+        Add a hook called with the extension of extension_id in each forked process, if
+        the extension has been constructed before forking.
+
+        Args:
+            extension_id (DescriptionIdentifierT): The identifier of the extension.
+            hook (Callable[[ExtensionT], None]): The hook to call after a fork.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        if extension_id not in self._descriptions:
+            raise KeyError(extension_id)
+        self._after_fork_hooks.setdefault(extension_id, []).append(hook)
+
+    def _is_fork_safe(self, extension_id: DescriptionIdentifierT) -> bool:
+        return self._fork_safe is not None and self._fork_safe(
+            self._descriptions[extension_id]
+        )
+
+    def prepare_fork(self, freeze: bool = True) -> List[DescriptionIdentifierT]:
+        """
+        Prepare the registry for forking, which should be called in the parent process
+        right before forking the workers.
+
+        Every fork-safe extension of which all dependencies are fork-safe is
+        constructed, and the hooks after a fork are registered. If freeze is True, all
+        objects tracked by the garbage collector are moved into its permanent
+        generation with `gc.freeze()`, such that collections in the workers do not
+        write to, and thereby copy, the pages shared with the parent.
+
+        Args:
+            freeze (bool): Whether to freeze the garbage collector.
+
+        Returns:
+            List[DescriptionIdentifierT]: The identifiers of the constructed extensions.
+        """
+        constructed = []
+        for extension_id in self._descriptions:
+            if self._is_fork_safe(extension_id) and all(
+                self.is_constructed(d) for d in self._dependencies[extension_id]
+            ):
+                self._construct(extension_id)
+                constructed.append(extension_id)
+
+        self._register_after_fork()
+
+        if freeze:
+            gc.freeze()
+        return constructed
+
+    def _register_after_fork(self) -> None:
+        if self._is_registered or not hasattr(os, "register_at_fork"):
+            return
+
+        # Fork hooks cannot be unregistered, thus the registry is only weakly
+        # referenced such that it can still be released.
+        after_fork = weakref.WeakMethod(self._after_fork_in_child)
+        os.register_at_fork(
+            after_in_child=lambda: (hook := after_fork()) is not None and hook()
+        )
+        self._is_registered = True
+
+    def _after_fork_in_child(self) -> None:
+        # Locks held by other threads of the parent are never released in the child.
+        self._locks = {extension_id: threading.RLock() for extension_id in self}
+
+        for extension_id in self._descriptions:
+            if (extension := self._extensions.get(extension_id)) is None:
+                continue
+
+            for hook in self._after_fork_hooks.get(extension_id, ()):
+                self._run_after_fork(extension_id, hook, extension)
+            if (after_fork := getattr(extension, "after_fork", None)) is not None:
+                self._run_after_fork(extension_id, after_fork)
+
+    def _run_after_fork(
+        self, extension_id: DescriptionIdentifierT, hook: Callable[..., None], *args
+    ) -> None:
+        # Exceptions raised within fork hooks are not propagated by the interpreter.
+        try:
+            hook(*args)
+        except Exception as e:
+            self._logger.error(f"The after fork hook of '{extension_id}' failed: {e}")
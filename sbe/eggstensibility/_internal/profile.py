@@ -0,0 +1,286 @@
+"""
+sbe.eggstensibility.profile provides the opt-in profiler recording the import and
+construction costs of each extension.
+"""
+
+import contextlib
+import json
+import sys
+import threading
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from .registry import ExtensionFactory
+
+
+class ExtensionProfile(NamedTuple):
+    """
+    ExtensionProfile describes the costs of a single extension module.
+
+    The import costs cover the execution of the extension module and its parent
+    package, including everything they import. The allocated bytes are the difference
+    of the memory traced by tracemalloc, and are None if memory is not traced. The
+    create time is None if the extension has not been created through the profiled
+    extension factory.
+    """
+
+    module_path: Path
+    import_wall_time: float
+    import_cpu_time: float
+    new_modules: int
+    allocated_bytes: Optional[int]
+    create_time: Optional[float]
+
+
+class _ProfileEntry:
+    __slots__ = (
+        "import_wall_time",
+        "import_cpu_time",
+        "new_modules",
+        "allocated_bytes",
+        "create_time",
+    )
+
+    def __init__(self) -> None:
+        self.import_wall_time = 0.0
+        self.import_cpu_time = 0.0
+        self.new_modules = 0
+        self.allocated_bytes: Optional[int] = None
+        self.create_time: Optional[float] = None
+
+
+class ProfileReport(Sequence[ExtensionProfile]):
+    """
+    ProfileReport is the sequence of the recorded ExtensionProfiles, in the order in
+    which the extension modules were first imported.
+    """
+
+    def __init__(self, profiles: Sequence[ExtensionProfile]) -> None:
+        self._profiles = list(profiles)
+
+    def __getitem__(self, index):
+        return self._profiles[index]
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def sorted_by(
+        self, field: str = "import_wall_time", descending: bool = True
+    ) -> List[ExtensionProfile]:
+        """
+        Sort the profiles by the provided field, profiles without a value for the field
+        are placed last.
+
+        Args:
+            field (str): The name of the ExtensionProfile field to sort by.
+            descending (bool): Whether the most expensive profiles are placed first.
+
+        Returns:
+            List[ExtensionProfile]: The sorted profiles.
+
+        Exceptions:
+            ValueError: Thrown when the field is not a numeric ExtensionProfile field.
+        """
+        if field not in ExtensionProfile._fields or field == "module_path":
+            raise ValueError(f"Unknown profile field '{field}'.")
+
+        present = [p for p in self._profiles if getattr(p, field) is not None]
+        missing = [p for p in self._profiles if getattr(p, field) is None]
+        return (
+            sorted(present, key=lambda p: getattr(p, field), reverse=descending)
+            + missing
+        )
+
+    def to_json(self) -> str:
+        """
+        Serialize the report to JSON.
+
+        Returns:
+            str: A JSON object with the list of profiles under "extensions".
+        """
+        return json.dumps(
+            {
+                "extensions": [
+                    {**profile._asdict(), "module_path": str(profile.module_path)}
+                    for profile in self._profiles
+                ]
+            },
+            indent=2,
+        )
+
+    def dump(self, path: Path) -> None:
+        """
+        Write the report as JSON to path.
+
+        Args:
+            path (Path): The file to write the report to.
+        """
+        path.write_text(self.to_json())
+
+
+class _ProfiledExtensionFactory:
+    def __init__(
+        self, profiler: "ExtensionProfiler", factory: ExtensionFactory[Any, Any]
+    ) -> None:
+        self._profiler = profiler
+        self._factory = factory
+
+    def __call__(self, description: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._factory(description)
+        finally:
+            self._profiler.record_creation(description, time.perf_counter() - start)
+
+
+class ExtensionProfiler:
+    """
+    ExtensionProfiler records, for each extension module, the wall and CPU time of
+    importing it, the number of modules added to sys.modules while importing it, the
+    memory allocated while importing it, and the time of creating its extension.
+
+    The profiler is enabled with `Builder.configure_profiler`, which passes it to the
+    description resolvers defining a `configure_profiler(profiler)` method, such as the
+    default description resolvers, and wraps the configured extension factory.
+
+    Memory is traced with tracemalloc, which is started upon the first profiled import
+    if it is not tracing yet, and slows down imports considerably. Imports on multiple
+    threads at the same time are attributed to each of the importing extensions.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """
+        Create a new ExtensionProfiler.
+
+        Args:
+            trace_memory (bool): Whether to record the allocated memory of imports.
+        """
+        self._trace_memory = trace_memory
+        self._started_tracing = False
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, _ProfileEntry] = {}
+        self._description_paths: Dict[int, Path] = {}
+        # Keep the descriptions alive, such that their ids are never reused.
+        self._descriptions: List[Any] = []
+
+    def _start_tracing(self) -> None:
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _get_entry(self, module_path: Path) -> _ProfileEntry:
+        with self._lock:
+            return self._entries.setdefault(module_path, _ProfileEntry())
+
+    @contextlib.contextmanager
+    def profile_import(self, module_path: Path) -> Iterator[None]:
+        """
+        Profile the import of the extension module at module_path within the context.
+
+        Args:
+            module_path (Path): The path to the extension module.
+        """
+        self._start_tracing()
+        is_tracing = tracemalloc.is_tracing()
+
+        module_count = len(sys.modules)
+        memory = tracemalloc.get_traced_memory()[0] if is_tracing else 0
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.thread_time() - cpu_start
+            entry = self._get_entry(module_path)
+
+            with self._lock:
+                entry.import_wall_time += wall_time
+                entry.import_cpu_time += cpu_time
+                entry.new_modules += max(len(sys.modules) - module_count, 0)
+                if is_tracing and tracemalloc.is_tracing():
+                    allocated = tracemalloc.get_traced_memory()[0] - memory
+                    entry.allocated_bytes = (entry.allocated_bytes or 0) + allocated
+
+    def record_description(self, module_path: Path, description: Any) -> None:
+        """
+        Attribute the description to the extension module at module_path, such that
+        the creation of its extension is recorded for the module.
+
+        Args:
+            module_path (Path): The path to the extension module.
+            description (Any): The description defined by the module.
+        """
+        self._get_entry(module_path)
+        with self._lock:
+            self._descriptions.append(description)
+            self._description_paths[id(description)] = module_path
+
+    def record_creation(self, description: Any, duration: float) -> None:
+        """
+        Record the duration of creating the extension of the description.
+
+        Args:
+            description (Any): The description of which the extension was created.
+            duration (float): The duration in seconds.
+        """
+        with self._lock:
+            module_path = self._description_paths.get(id(description))
+            if module_path is None:
+                return
+            entry = self._entries[module_path]
+            entry.create_time = (entry.create_time or 0.0) + duration
+
+    def wrap_factory(
+        self, factory: ExtensionFactory[Any, Any]
+    ) -> ExtensionFactory[Any, Any]:
+        """
+        Wrap the extension factory, such that the creation of each extension is
+        recorded.
+
+        Args:
+            factory (ExtensionFactory): The extension factory to wrap.
+
+        Returns:
+            ExtensionFactory: The profiled extension factory.
+        """
+        return _ProfiledExtensionFactory(self, factory)
+
+    def stop(self) -> None:
+        """Stop tracing memory, if it was started by this profiler."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self) -> ProfileReport:
+        """
+        Create a report of the profiles recorded so far.
+
+        Returns:
+            ProfileReport: The recorded profiles.
+        """
+        with self._lock:
+            return ProfileReport(
+                [
+                    ExtensionProfile(
+                        module_path,
+                        entry.import_wall_time,
+                        entry.import_cpu_time,
+                        entry.new_modules,
+                        entry.allocated_bytes,
+                        entry.create_time,
+                    )
+                    for module_path, entry in self._entries.items()
+                ]
+            )
@@ -0,0 +1,215 @@
+"""
+sbe.eggstensibility.registry provides the extension registry, which lazily constructs
+the extensions of the ordered descriptions upon first access.
+"""
+
+import threading
+
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from ..exceptions import MissingDependencyException
+from .description import DefaultDescription
+from .order import ResolveDependency, ResolveIdentifier
+
+
+ExtensionFactoryDescriptionT = TypeVar(
+    "ExtensionFactoryDescriptionT", contravariant=True
+)
+ExtensionFactoryExtensionT = TypeVar("ExtensionFactoryExtensionT", covariant=True)
+
+
+class ExtensionFactory(
+    Protocol, Generic[ExtensionFactoryDescriptionT, ExtensionFactoryExtensionT]
+):
+    """
+    ExtensionFactory creates the extension described by a given extension description.
+    """
+
+    def __call__(
+        self, description: ExtensionFactoryDescriptionT
+    ) -> ExtensionFactoryExtensionT:
+        """
+        Create the extension described by the description.
+
+        Args:
+            description (ExtensionFactoryDescriptionT):
+                The description of the extension to create.
+
+        Returns:
+            ExtensionFactoryExtensionT: The created extension.
+        """
+
+
+class DefaultExtensionFactory:
+    """
+    DefaultExtensionFactory creates the extension of a given extension description by
+    calling its `create_extension` method.
+    """
+
+    def __call__(self, description: DefaultDescription) -> Any:
+        """
+        Create the extension described by the description.
+
+        Args:
+            description (DefaultDescription): The description of the extension to create.
+
+        Returns:
+            Any: The created extension.
+        """
+        return description.create_extension()
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+ExtensionT = TypeVar("ExtensionT")
+
+
+class ExtensionRegistry(
+    Mapping[DescriptionIdentifierT, ExtensionT],
+    Generic[DescriptionT, DescriptionIdentifierT, ExtensionT],
+):
+    """
+    ExtensionRegistry provides the extensions of a set of ordered descriptions by their
+    identifier.
+
+    Extensions are constructed upon first access, after constructing the extensions
+    they depend on, and are cached afterwards. Each extension is constructed exactly
+    once, even when accessed concurrently from multiple threads.
+    """
+
+    def __init__(
+        self,
+        descriptions: Iterable[DescriptionT],
+        identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+        dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+        extension_factory: ExtensionFactory[DescriptionT, ExtensionT],
+    ) -> None:
+        """
+        Create a new ExtensionRegistry of the given descriptions.
+
+        Args:
+            descriptions (Iterable[DescriptionT]):
+                The descriptions, ordered based upon their dependencies.
+            identifier_resolver (ResolveIdentifier):
+                The resolver used to obtain identifiers of descriptions.
+            dependency_resolver (ResolveDependency):
+                The resolver used to obtain dependencies of descriptions.
+            extension_factory (ExtensionFactory):
+                The factory used to create the extensions of descriptions.
+
+        Exceptions:
+            MissingDependencyException:
+                Thrown when a description depends on an identifier which does not
+                precede it in the descriptions.
+        """
+        self._descriptions: Dict[DescriptionIdentifierT, DescriptionT] = {}
+        self._dependencies: Dict[
+            DescriptionIdentifierT, Tuple[DescriptionIdentifierT, ...]
+        ] = {}
+
+        for description in descriptions:
+            extension_id = identifier_resolver(description)
+            dependency_ids = tuple(dependency_resolver(description))
+            if missing := [d for d in dependency_ids if d not in self._descriptions]:
+                raise MissingDependencyException(
+                    f"The dependencies {missing} of '{extension_id}' do not precede it "
+                    "in the provided descriptions.",
+                    {extension_id: missing},
+                )
+
+            self._descriptions[extension_id] = description
+            self._dependencies[extension_id] = dependency_ids
+
+        self._positions = {
+            extension_id: position
+            for position, extension_id in enumerate(self._descriptions)
+        }
+        self._extension_factory = extension_factory
+        self._extensions: Dict[DescriptionIdentifierT, ExtensionT] = {}
+        self._locks = {extension_id: threading.RLock() for extension_id in self}
+
+    @property
+    def descriptions(self) -> Sequence[DescriptionT]:
+        """The descriptions of this registry, ordered based upon their dependencies."""
+        return list(self._descriptions.values())
+
+    def get_description(self, extension_id: DescriptionIdentifierT) -> DescriptionT:
+        """
+        Retrieve the description with the given extension_id.
+
+        Args:
+            extension_id (DescriptionIdentifierT): The identifier of the description.
+
+        Returns:
+            DescriptionT: The description with the given identifier.
+
+        Exceptions:
+            KeyError: Thrown when no description with the given identifier exists.
+        """
+        return self._descriptions[extension_id]
+
+    def is_constructed(self, extension_id: DescriptionIdentifierT) -> bool:
+        """
+        Whether the extension with the given extension_id has been constructed.
+
+        Args:
+            extension_id (DescriptionIdentifierT): The identifier of the extension.
+
+        Returns:
+            bool: True if the extension has been constructed, False otherwise.
+        """
+        return extension_id in self._extensions
+
+    def _construction_order(
+        self, extension_id: DescriptionIdentifierT
+    ) -> List[DescriptionIdentifierT]:
+        required = set()
+        pending = [extension_id]
+
+        while pending:
+            current_id = pending.pop()
+            if current_id in required or current_id in self._extensions:
+                continue
+            required.add(current_id)
+            pending.extend(self._dependencies[current_id])
+
+        return sorted(required, key=self._positions.__getitem__)
+
+    def _construct(self, extension_id: DescriptionIdentifierT) -> ExtensionT:
+        with self._locks[extension_id]:
+            if extension_id not in self._extensions:
+                self._extensions[extension_id] = self._extension_factory(
+                    self._descriptions[extension_id]
+                )
+            return self._extensions[extension_id]
+
+    def __getitem__(self, extension_id: DescriptionIdentifierT) -> ExtensionT:
+        if extension_id in self._extensions:
+            return self._extensions[extension_id]
+        if extension_id not in self._descriptions:
+            raise KeyError(extension_id)
+
+        for required_id in self._construction_order(extension_id):
+            self._construct(required_id)
+        return self._extensions[extension_id]
+
+    def __iter__(self) -> Iterator[DescriptionIdentifierT]:
+        return iter(self._descriptions)
+
+    def __len__(self) -> int:
+        return len(self._descriptions)
+
+    def __contains__(self, extension_id: object) -> bool:
+        return extension_id in self._descriptions
@@ -0,0 +1,317 @@
+"""
+sbe.eggstensibility.reload provides the hot reloader, which polls the extension modules
+for changes and atomically swaps the live set of descriptions once the affected
+modules have been reloaded.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from pathlib import Path
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ..exceptions import BaseEggstensibilityException
+from .logging import IdentityLogger, Logger
+from .order import ResolveDependency, ResolveIdentifier
+
+
+DescriptionT = TypeVar("DescriptionT")
+DescriptionIdentifierT = TypeVar("DescriptionIdentifierT")
+
+_FileMetadata = Optional[Tuple[int, int]]
+_ModuleMetadata = Tuple[Tuple[Path, _FileMetadata], ...]
+
+
+def _stat_metadata(path: Path) -> _FileMetadata:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class ExtensionGeneration(Generic[DescriptionT]):
+    """ExtensionGeneration is a consistent, immutable set of ordered descriptions."""
+
+    __slots__ = ("_number", "_descriptions")
+
+    def __init__(self, number: int, descriptions: Iterable[DescriptionT]) -> None:
+        """
+        Create a new ExtensionGeneration.
+
+        Args:
+            number (int): The number of this generation.
+            descriptions (Iterable[DescriptionT]): The ordered descriptions.
+        """
+        self._number = number
+        self._descriptions = tuple(descriptions)
+
+    @property
+    def number(self) -> int:
+        """The number of this generation, incremented upon every reload."""
+        return self._number
+
+    @property
+    def descriptions(self) -> Tuple[DescriptionT, ...]:
+        """The descriptions of this generation, ordered based upon their dependencies."""
+        return self._descriptions
+
+
+class HotReloader(Generic[DescriptionT, DescriptionIdentifierT]):
+    """
+    HotReloader keeps a live generation of ordered descriptions up to date with the
+    extension modules on disk.
+
+    Changes are detected by polling the mtime and size of the source files of the
+    harvested modules, thus no OS-specific APIs are required. Only the changed modules
+    and the modules of the extensions depending on them are reloaded. The descriptions
+    of the other modules never depend on the reloaded descriptions, thus they retain
+    their order of the live generation, and only the reloaded descriptions are ordered
+    after them. The new generation is swapped in atomically once it is ordered.
+    Readers of `generation` are never blocked and always observe a complete
+    generation.
+
+    Reloading modules requires the description resolvers to provide an
+    `invalidate(module_paths)` method, such as the DefaultDescriptionResolver.
+    """
+
+    def __init__(
+        self,
+        harvest_modules: Callable[[], Sequence[Path]],
+        retrieve_module_descriptions: Callable[
+            [Sequence[Path]], Dict[Path, List[DescriptionT]]
+        ],
+        invalidate_modules: Callable[[Sequence[Path]], None],
+        order_descriptions: Callable[
+            [Iterable[DescriptionT], Container[DescriptionIdentifierT]],
+            Sequence[DescriptionT],
+        ],
+        identifier_resolver: ResolveIdentifier[DescriptionT, DescriptionIdentifierT],
+        dependency_resolver: ResolveDependency[DescriptionT, DescriptionIdentifierT],
+        poll_interval: float = 1.0,
+        logger: Optional[Logger] = None,
+        module_files: Optional[Callable[[Path], Iterable[Path]]] = None,
+    ) -> None:
+        """
+        Create a new HotReloader and synchronously load the initial generation.
+
+        Args:
+            harvest_modules (Callable[[], Sequence[Path]]):
+                Harvests the module paths to watch.
+            retrieve_module_descriptions (Callable):
+                Loads the descriptions of each of the provided module paths.
+            invalidate_modules (Callable[[Sequence[Path]], None]):
+                Invalidates the loaded modules of the provided module paths.
+            order_descriptions (Callable):
+                Orders the descriptions based upon their dependencies, after the
+                descriptions of the provided identifiers.
+            identifier_resolver (ResolveIdentifier):
+                The resolver used to obtain identifiers of descriptions.
+            dependency_resolver (ResolveDependency):
+                The resolver used to obtain dependencies of descriptions.
+            poll_interval (float):
+                The number of seconds in between polls when running in the background.
+            logger (Optional[Logger]):
+                The logger used to report failed reloads.
+            module_files (Optional[Callable[[Path], Iterable[Path]]]):
+                Retrieves the source files of a module path of which the changes are
+                detected, or None to only watch the module path itself.
+        """
+        self._harvest_modules = harvest_modules
+        self._retrieve_module_descriptions = retrieve_module_descriptions
+        self._invalidate_modules = invalidate_modules
+        self._order_descriptions = order_descriptions
+        self._identifier_resolver = identifier_resolver
+        self._dependency_resolver = dependency_resolver
+        self._poll_interval = poll_interval
+        self._logger = logger if logger is not None else IdentityLogger()
+        self._module_files = (
+            module_files if module_files is not None else lambda path: [path]
+        )
+
+        self._poll_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        module_paths = list(self._harvest_modules())
+        self._metadata = {p: self._module_metadata(p) for p in module_paths}
+        self._module_descriptions = self._retrieve_module_descriptions(module_paths)
+        self._generation = ExtensionGeneration(
+            0, self._order_descriptions(self._all_descriptions(), ())
+        )
+
+    @property
+    def generation(self) -> ExtensionGeneration[DescriptionT]:
+        """The live generation of ordered descriptions."""
+        return self._generation
+
+    def _module_metadata(self, module_path: Path) -> _ModuleMetadata:
+        return tuple((p, _stat_metadata(p)) for p in self._module_files(module_path))
+
+    def _all_descriptions(self) -> Iterable[DescriptionT]:
+        for descriptions in self._module_descriptions.values():
+            yield from descriptions
+
+    def _affected_module_paths(self, changed_paths: Iterable[Path]) -> Set[Path]:
+        # The modules of all extensions (transitively) depending on the extensions
+        # defined in the changed modules are affected as well.
+        module_paths: Dict[DescriptionIdentifierT, Path] = {}
+        dependents: Dict[DescriptionIdentifierT, List[DescriptionIdentifierT]] = {}
+
+        for module_path, descriptions in self._module_descriptions.items():
+            for description in descriptions:
+                extension_id = self._identifier_resolver(description)
+                module_paths[extension_id] = module_path
+                for dependency_id in self._dependency_resolver(description):
+                    dependents.setdefault(dependency_id, []).append(extension_id)
+
+        affected = set(changed_paths)
+        pending = [
+            self._identifier_resolver(description)
+            for module_path in affected
+            for description in self._module_descriptions.get(module_path, [])
+        ]
+        visited = set()
+
+        while pending:
+            extension_id = pending.pop()
+            if extension_id in visited:
+                continue
+            visited.add(extension_id)
+            affected.add(module_paths[extension_id])
+            pending.extend(dependents.get(extension_id, []))
+
+        return affected
+
+    def _reload_order(self, module_paths: Iterable[Path]) -> List[Path]:
+        # Reload in the order of the live generation, such that the modules of
+        # dependencies are executed before the modules of their dependents.
+        positions: Dict[Path, int] = {}
+        descriptions = self._generation.descriptions
+        description_positions = {id(d): i for i, d in enumerate(descriptions)}
+
+        for module_path, module_descriptions in self._module_descriptions.items():
+            positions[module_path] = min(
+                (
+                    description_positions.get(id(d), len(descriptions))
+                    for d in module_descriptions
+                ),
+                default=len(descriptions),
+            )
+
+        return sorted(module_paths, key=lambda p: positions.get(p, len(descriptions)))
+
+    def poll(self) -> bool:
+        """
+        Poll the extension modules once, and reload the changed modules.
+
+        Returns:
+            bool: True if a new generation has been swapped in, False otherwise.
+        """
+        with self._poll_lock:
+            module_paths = list(self._harvest_modules())
+            metadata = {p: self._module_metadata(p) for p in module_paths}
+
+            changed_paths = [
+                p for p in module_paths if self._metadata.get(p) != metadata[p]
+            ]
+            removed_paths = [p for p in self._metadata if p not in metadata]
+
+            if not changed_paths and not removed_paths:
+                return False
+
+            affected_paths = self._affected_module_paths(changed_paths + removed_paths)
+            reload_paths = self._reload_order(
+                p for p in affected_paths if p in metadata
+            )
+
+            self._logger.info(
+                f"Reloading {len(reload_paths)} extension module(s), "
+                f"{len(removed_paths)} removed."
+            )
+            self._invalidate_modules(removed_paths + reload_paths)
+            reloaded = self._retrieve_module_descriptions(reload_paths)
+
+            # The unaffected descriptions do not depend on any affected description,
+            # thus only the reloaded descriptions are ordered, after them.
+            affected = {
+                id(description)
+                for p in affected_paths
+                for description in self._module_descriptions.get(p, [])
+            }
+            retained = [
+                description
+                for description in self._generation.descriptions
+                if id(description) not in affected
+            ]
+
+            try:
+                ordered = self._order_descriptions(
+                    (d for p in module_paths if p in reloaded for d in reloaded[p]),
+                    {self._identifier_resolver(d) for d in retained},
+                )
+            except BaseEggstensibilityException as e:
+                # The live generation and the state it was loaded from are kept, thus
+                # the changes are reloaded again upon the next poll.
+                self._logger.error(f"Unable to order the reloaded extensions: {e}")
+                return False
+
+            self._module_descriptions = {
+                p: reloaded[p] if p in reloaded else self._module_descriptions[p]
+                for p in module_paths
+            }
+            self._metadata = metadata
+            self._generation = ExtensionGeneration(
+                self._generation.number + 1, [*retained, *ordered]
+            )
+            return True
+
+    def _poll_until_stopped(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                self._logger.error(f"Unable to reload the extensions: {e}")
+
+    def start(self) -> None:
+        """Start polling the extension modules on a background thread."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._poll_until_stopped,
+            name=f"{type(self).__name__}-poll",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling the extension modules and wait for the background thread."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> HotReloader[DescriptionT, DescriptionIdentifierT]:
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
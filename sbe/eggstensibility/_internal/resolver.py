@@ -2,15 +2,43 @@
 sbe.eggstensibility.resolver provides the default resolver implementations
 """
 
+import contextlib
+import fnmatch
 import importlib
 import importlib.util
+import os
 import sys
+import threading
 import types
+import weakref
 
 from pathlib import Path
-from typing import Generic, Iterable, Optional, Protocol, Sequence, TypeVar
-
-from sbe.eggstensibility._internal.description import DefaultDescription  # noqa: F401
+from typing import (
+    Callable,
+    ContextManager,
+    Generic,
+    Iterable,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+from sbe.eggstensibility._internal.bytecode import (
+    BytecodeCacheLoader,
+    BytecodeValidation,
+)
+from sbe.eggstensibility._internal.description import DefaultDescription
+from sbe.eggstensibility._internal.filesystem import is_file, resolve_path, scandir
+from sbe.eggstensibility._internal.lazy import (
+    LazySubmoduleFinder,
+    install_lazy_finder,
+    make_lazy,
+    uninstall_lazy_finder,
+)
+from sbe.eggstensibility._internal.logging import IdentityLogger, Logger
+from sbe.eggstensibility._internal.profile import ExtensionProfiler
+from sbe.eggstensibility._internal.static import extract_description_arguments
 
 
 class ModuleResolver(Protocol):
@@ -54,9 +82,8 @@ class DefaultDirectoryModuleResolver:
 
     @staticmethod
     def _is_valid_directory(prospective_module_path: Path) -> bool:
-        return (
-            prospective_module_path.is_file()
-            and (prospective_module_path.parent / "__init__.py").is_file()
+        return is_file(prospective_module_path) and is_file(
+            prospective_module_path.parent / "__init__.py"
         )
 
     def __call__(self, directory_path: Path) -> Iterable[Path]:
@@ -70,7 +97,7 @@ class DefaultDirectoryModuleResolver:
             Iterable[Path]: The collection of file paths describing the modules
             with extension points.
         """
-        prospective_module_path = (directory_path / self._module_name).resolve()
+        prospective_module_path = resolve_path(directory_path / self._module_name)
 
         if self._is_valid_directory(prospective_module_path):
             yield prospective_module_path
@@ -91,9 +118,8 @@ class DefaultFileModuleResolver:
 
     @staticmethod
     def _is_valid_directory(prospective_module_path: Path) -> bool:
-        return (
-            prospective_module_path.is_file()
-            and prospective_module_path.suffix == ".py"
+        return prospective_module_path.suffix == ".py" and is_file(
+            prospective_module_path
         )
 
     def __call__(self, file_path: Path) -> Iterable[Path]:
@@ -107,11 +133,118 @@ class DefaultFileModuleResolver:
             Iterable[Path]: The collection of file paths describing the modules
             with extension points.
         """
-        prospective_module_path = file_path.resolve()
+        prospective_module_path = resolve_path(file_path)
         if self._is_valid_directory(prospective_module_path):
             yield prospective_module_path
 
 
+class DefaultRecursiveModuleResolver:
+    """
+    DefaultRecursiveModuleResolver resolves every module matching a glob pattern, e.g.
+    "extension.py", within the provided directory and all of its subdirectories.
+    Similar to the DefaultDirectoryModuleResolver, a module is only resolved if the
+    directory containing it is itself a python module.
+
+    The directory tree is traversed in a single pass with os.scandir, which provides
+    the type of each entry without additional stat calls on most platforms. Hidden
+    directories, `__pycache__` directories and entries matching any of the ignore
+    patterns are skipped, and symbolic links to directories are not followed.
+
+    The following directory structure is expected:
+
+    <provided directory>
+    ├─── <plug-in name>
+    │    ├─── __init__.py
+    │    ├─── <module matching pattern>
+    │    └─── ...
+    └─── <group>
+         └─── <plug-in name>
+              ├─── __init__.py
+              ├─── <module matching pattern>
+              └─── ...
+    """
+
+    def __init__(
+        self,
+        pattern: str = "extension.py",
+        max_depth: Optional[int] = None,
+        ignore_patterns: Iterable[str] = (),
+    ):
+        """
+        Create a new DefaultRecursiveModuleResolver resolving modules matching pattern.
+
+        Args:
+            pattern (str):
+                The glob pattern the file names of the resolved modules should match.
+            max_depth (Optional[int]):
+                The maximum number of directory levels below the provided directory to
+                descend into. If None, the whole tree is traversed.
+            ignore_patterns (Iterable[str]):
+                Glob patterns of file and directory names which should be skipped.
+        """
+        self._pattern = pattern
+        self._max_depth = max_depth
+        self._ignore_patterns = tuple(ignore_patterns)
+        self._logger: Logger = IdentityLogger()
+
+    def configure_logger(self, logger: Logger) -> None:
+        """
+        Configure the logger used to report directories which cannot be scanned.
+
+        Args:
+            logger (Logger): The logger to use.
+        """
+        self._logger = logger
+
+    def _is_ignored(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self._ignore_patterns)
+
+    def _is_skipped_directory(self, name: str) -> bool:
+        return name.startswith(".") or name == "__pycache__" or self._is_ignored(name)
+
+    def _scan_directory(self, directory_path: str) -> Sequence[os.DirEntry]:
+        try:
+            return scandir(directory_path)
+        except OSError as e:
+            self._logger.warning(f"Unable to scan directory '{directory_path}': {e}")
+            return []
+
+    def __call__(self, directory_path: Path) -> Iterable[Path]:
+        """
+        Resolve the modules defined in the directory path and its subdirectories.
+
+        Args:
+            directory_path (Path): The root directory to resolve the paths from
+
+        Returns:
+            Iterable[Path]: The collection of file paths describing the modules
+            with extension points.
+        """
+        pending = [(str(resolve_path(directory_path)), 0)]
+
+        while pending:
+            current_path, depth = pending.pop()
+            entries = self._scan_directory(current_path)
+            is_package = any(entry.name == "__init__.py" for entry in entries)
+            subdirectories = []
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._is_skipped_directory(entry.name):
+                        subdirectories.append(entry.path)
+                elif (
+                    is_package
+                    and fnmatch.fnmatch(entry.name, self._pattern)
+                    and not self._is_ignored(entry.name)
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path)
+
+            if self._max_depth is None or depth < self._max_depth:
+                # Reversed, such that the subdirectories are traversed in sorted order.
+                pending.extend((p, depth + 1) for p in reversed(subdirectories))
+
+
 DescriptionT = TypeVar("DescriptionT", covariant=True)
 
 
@@ -139,6 +272,9 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
         self,
         description_variable="description",
         external_namespace="sbe.eggstensibility.external",
+        bytecode_cache: Optional[Path] = None,
+        bytecode_validation: BytecodeValidation = "timestamp",
+        lazy: bool = False,
     ):
         """
         Create a new DefaultDescriptionResolver with the given description_variable
@@ -148,9 +284,66 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
                 The name of the variable in the module containing the extension description.
             external_namespace (str):
                 The namespace under which to place the loaded modules.
+            bytecode_cache (Optional[Path]):
+                The writable directory in which the compiled code of the loaded modules
+                is cached. If None, the default `__pycache__` directories next to the
+                modules are used, which requires the modules to be writable.
+            bytecode_validation (BytecodeValidation):
+                How the cached code in the bytecode_cache is validated, either by the
+                mtime and size ("timestamp") or by the hash ("checked-hash") of the
+                source of the module.
+            lazy (bool):
+                Whether the parent packages of the extension modules and the
+                submodules they import are executed lazily, i.e. upon the first access
+                of one of their attributes, rather than upon loading the description.
+
+        Exceptions:
+            ValueError: Thrown when the bytecode_validation is unknown.
         """
+        if bytecode_validation not in ("timestamp", "checked-hash"):
+            raise ValueError(f"Unknown bytecode validation '{bytecode_validation}'.")
+
         self._description_variable = description_variable
         self._external_namespace = external_namespace
+        self._bytecode_cache = bytecode_cache
+        self._bytecode_validation: BytecodeValidation = bytecode_validation
+        self._lazy_finder: Optional[LazySubmoduleFinder] = None
+        self._logger: Logger = IdentityLogger()
+        self._profiler: Optional[ExtensionProfiler] = None
+
+        if lazy:
+            # The finder is scoped to the packages initialized by this resolver, and
+            # removed from sys.meta_path once the resolver is discarded.
+            self._lazy_finder = LazySubmoduleFinder()
+            weakref.finalize(self, uninstall_lazy_finder, self._lazy_finder)
+
+    def configure_logger(self, logger: Logger) -> None:
+        """
+        Configure the logger used to report modules which cannot be loaded or do not
+        define a description.
+
+        Args:
+            logger (Logger): The logger to use.
+        """
+        self._logger = logger
+
+    def configure_profiler(self, profiler: ExtensionProfiler) -> None:
+        """
+        Configure the profiler recording the import costs of the extension modules.
+
+        Args:
+            profiler (ExtensionProfiler): The profiler to use.
+        """
+        self._profiler = profiler
+
+    def _profile_import(self, module_path: Path) -> ContextManager[None]:
+        if self._profiler is None:
+            return contextlib.nullcontext()
+        return self._profiler.profile_import(module_path)
+
+    def _record_description(self, module_path: Path, description: object) -> None:
+        if self._profiler is not None:
+            self._profiler.record_description(module_path, description)
 
     def _initialize_extension_points(self) -> None:
         namespace_components = self._external_namespace.split(".")
@@ -159,17 +352,57 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
             module_namespace = ".".join(namespace_components[: (i + 1)])
             sys.modules.setdefault(module_namespace, types.ModuleType(module_namespace))
 
+        if self._lazy_finder is not None:
+            install_lazy_finder(self._lazy_finder)
+
+    def _is_package_module(self, module_path: Path) -> bool:
+        return is_file(module_path.parent / "__init__.py")
+
+    def module_namespace(self, module_path: Path) -> str:
+        """
+        Retrieve the namespace under which the module at module_path is placed.
+
+        Args:
+            module_path (Path): The path to the extension module.
+
+        Returns:
+            str: The fully qualified name of the module.
+        """
+        if self._is_package_module(module_path):
+            module_name = f"{module_path.parent.stem}.{module_path.stem}"
+        else:
+            module_name = module_path.name
+        return f"{self._external_namespace}.{module_name}"
+
+    def _create_spec(self, namespace: str, path: Path):
+        if self._bytecode_cache is None or path.suffix != ".py":
+            return importlib.util.spec_from_file_location(namespace, path)
+
+        return importlib.util.spec_from_file_location(
+            namespace,
+            path,
+            loader=BytecodeCacheLoader(
+                namespace, str(path), self._bytecode_cache, self._bytecode_validation
+            ),
+        )
+
     def _initialize_module(self, name: str, path: Path):
         namespace = f"{self._external_namespace}.{name}"
 
         if namespace in sys.modules:
             return sys.modules[namespace]
 
-        spec = importlib.util.spec_from_file_location(namespace, path)
+        spec = self._create_spec(namespace, path)
 
         if spec is None or spec.loader is None:
+            self._logger.warning(f"Unable to create a module spec for '{path}'.")
             return None
 
+        # The extension module itself is executed to retrieve its description, only
+        # its parent package is executed lazily.
+        if self._lazy_finder is not None and path.name == "__init__.py":
+            make_lazy(spec)
+
         module = importlib.util.module_from_spec(spec)
         if module is None:
             return None
@@ -182,6 +415,11 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
         self, module_path: Path, module_directory_init: Path
     ):
         module_parent_name = module_directory_init.parent.stem
+        if self._lazy_finder is not None:
+            self._lazy_finder.add_package(
+                f"{self._external_namespace}.{module_parent_name}"
+            )
+
         parent_module = self._initialize_module(
             module_parent_name, module_directory_init
         )
@@ -197,18 +435,28 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
         return self._initialize_module(module_path.name, module_path)
 
     def _initialize_extension_module(self, module_path: Path):
-        if (module_directory_init := module_path.parent / "__init__.py").is_file():
+        if self._is_package_module(module_path):
             return self._initialize_extension_directory(
-                module_path, module_directory_init
+                module_path, module_path.parent / "__init__.py"
             )
         else:
             return self._initialize_extension_standalone(module_path)
 
     def _load_description(self, module_path: Path) -> Optional[DescriptionT]:
-        module = self._initialize_extension_module(module_path)
+        with self._profile_import(module_path):
+            module = self._initialize_extension_module(module_path)
         if module is None:
             return None
-        return getattr(module, self._description_variable, None)
+
+        description = getattr(module, self._description_variable, None)
+        if description is None:
+            self._logger.debug(
+                f"Module '{module_path}' does not define "
+                f"'{self._description_variable}'."
+            )
+        else:
+            self._record_description(module_path, description)
+        return description
 
     def _load_descriptions(
         self, module_paths: Iterable[Path]
@@ -232,3 +480,171 @@ class DefaultDescriptionResolver(Generic[DescriptionT]):
         """
         self._initialize_extension_points()
         return list(self._load_descriptions(module_paths))
+
+    def _package_namespace(self, module_path: Path) -> str:
+        namespace = self.module_namespace(module_path)
+        if self._is_package_module(module_path):
+            return namespace.rpartition(".")[0]
+        return namespace
+
+    def module_files(self, module_path: Path) -> Sequence[Path]:
+        """
+        Retrieve the source files of the module at module_path, i.e. the sources of
+        every module within its parent package, or the module itself if it is not
+        part of a package.
+
+        Args:
+            module_path (Path): The path to the extension module.
+
+        Returns:
+            Sequence[Path]: The paths of the source files, in sorted order.
+        """
+        if not self._is_package_module(module_path):
+            return [module_path]
+        return sorted(module_path.parent.rglob("*.py"))
+
+    def invalidate(self, module_paths: Iterable[Path]) -> None:
+        """
+        Invalidate the initialized modules of the provided module_paths, such that they
+        are executed again upon the next resolution. The parent package of a module
+        and all of its submodules are invalidated as well.
+
+        Args:
+            module_paths (Iterable[Path]):
+                The paths to the modules to invalidate.
+        """
+        namespaces = {self._package_namespace(p) for p in module_paths}
+        prefixes = tuple(f"{namespace}." for namespace in namespaces)
+
+        for name in list(sys.modules):
+            if name in namespaces or name.startswith(prefixes):
+                sys.modules.pop(name, None)
+        if self._lazy_finder is not None:
+            for namespace in namespaces:
+                self._lazy_finder.discard_package(namespace)
+        importlib.invalidate_caches()
+
+
+class _DeferredExtensionConstructor:
+    """
+    _DeferredExtensionConstructor executes the extension module upon the construction
+    of its extension and calls its module-level constructor.
+    """
+
+    def __init__(
+        self, initialize_module: Callable[[], Optional[types.ModuleType]], name: str
+    ) -> None:
+        self._initialize_module = initialize_module
+        self._name = name
+
+    def __call__(self):
+        module = self._initialize_module()
+        if module is None:
+            raise ImportError(f"Unable to initialize the extension module of {self}.")
+        return getattr(module, self._name)()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._name!r})"
+
+
+class DefaultStaticDescriptionResolver(DefaultDescriptionResolver[DefaultDescription]):
+    """
+    DefaultStaticDescriptionResolver retrieves the DefaultDescription of extension
+    modules without executing them, by analysing the source of the module instead.
+
+    The analysis only succeeds for descriptions assigned once at the module level, e.g.:
+
+        description = Description(
+            __name__,
+            ctor,  # a module-level constructor
+            ["<dependency id>", ...],  # literal dependencies
+            extension_id="<extension id>",  # a literal extension id
+        )
+
+    The extension module (and its parent `__init__.py`) is only executed once the
+    extension is created. Modules which cannot be analysed are executed immediately,
+    identical to the DefaultDescriptionResolver.
+    """
+
+    def __init__(
+        self,
+        description_variable="description",
+        external_namespace="sbe.eggstensibility.external",
+        bytecode_cache: Optional[Path] = None,
+        bytecode_validation: BytecodeValidation = "timestamp",
+        lazy: bool = False,
+    ):
+        """
+        Create a new DefaultStaticDescriptionResolver with the given description_variable
+
+        Args:
+            description_variable (str):
+                The name of the variable in the module containing the extension description.
+            external_namespace (str):
+                The namespace under which to place the loaded modules.
+            bytecode_cache (Optional[Path]):
+                The writable directory in which the compiled code of the loaded modules
+                is cached, see DefaultDescriptionResolver.
+            bytecode_validation (BytecodeValidation):
+                How the cached code in the bytecode_cache is validated, either
+                "timestamp" or "checked-hash".
+            lazy (bool):
+                Whether the parent packages of the extension modules and the
+                submodules they import are executed lazily, see
+                DefaultDescriptionResolver.
+
+        Exceptions:
+            ValueError: Thrown when the bytecode_validation is unknown.
+        """
+        super().__init__(
+            description_variable,
+            external_namespace,
+            bytecode_cache,
+            bytecode_validation,
+            lazy,
+        )
+
+        # Deferred constructors can be invoked from multiple threads, and can be
+        # invoked from within each other while executing extension modules.
+        self._initialize_lock = threading.RLock()
+
+    def _initialize_deferred_module(self, module_path: Path):
+        with self._initialize_lock, self._profile_import(module_path):
+            self._initialize_extension_points()
+            return self._initialize_extension_module(module_path)
+
+    def _load_static_description(
+        self, module_path: Path
+    ) -> Optional[DefaultDescription]:
+        try:
+            source = importlib.util.decode_source(module_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        arguments = extract_description_arguments(source, self._description_variable)
+        if arguments is None:
+            return None
+
+        return DefaultDescription(
+            (
+                arguments.name
+                if arguments.name is not None
+                else self.module_namespace(module_path)
+            ),
+            _DeferredExtensionConstructor(
+                lambda: self._initialize_deferred_module(module_path),
+                arguments.ctor_name,
+            ),
+            arguments.dependencies,
+            extension_id=arguments.extension_id,
+        )
+
+    def _load_description(self, module_path: Path) -> Optional[DefaultDescription]:
+        if (description := self._load_static_description(module_path)) is not None:
+            self._record_description(module_path, description)
+            return description
+
+        self._logger.debug(
+            f"Unable to analyse module '{module_path}', executing it instead."
+        )
+        return super()._load_description(module_path)
@@ -0,0 +1,175 @@
+"""
+sbe.eggstensibility.static provides the static extraction of default descriptions,
+which reads the arguments of the description from the source of an extension module
+without executing it.
+"""
+
+import ast
+
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+_DEFAULTS_MODULE = "sbe.eggstensibility.defaults"
+_DEFAULTS_PARENT_MODULE, _, _DEFAULTS_NAME = _DEFAULTS_MODULE.rpartition(".")
+_DESCRIPTION_NAME = "Description"
+
+_ARGUMENT_NAMES = ("name", "extension_ctor", "dependencies", "extension_id")
+
+
+class StaticDescriptionArguments(NamedTuple):
+    """The arguments of a default description, extracted from the module source."""
+
+    name: Optional[str]
+    """The name of the description, None if it is the `__name__` of the module."""
+
+    ctor_name: str
+    """The name of the module-level constructor function."""
+
+    dependencies: Tuple[str, ...]
+    """The literal extension ids of the dependencies."""
+
+    extension_id: str
+    """The literal extension id."""
+
+
+def _dotted_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        if (value := _dotted_name(node.value)) is not None:
+            return f"{value}.{node.attr}"
+    return None
+
+
+def _description_names(tree: ast.Module) -> Set[str]:
+    # The (dotted) names under which the default Description is available at the
+    # module level of the extension module.
+    names = {f"{_DEFAULTS_MODULE}.{_DESCRIPTION_NAME}"}
+
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom) and statement.level == 0:
+            for alias in statement.names:
+                bound_name = alias.asname or alias.name
+                if (statement.module, alias.name) == (
+                    _DEFAULTS_MODULE,
+                    _DESCRIPTION_NAME,
+                ):
+                    names.add(bound_name)
+                elif (statement.module, alias.name) == (
+                    _DEFAULTS_PARENT_MODULE,
+                    _DEFAULTS_NAME,
+                ):
+                    names.add(f"{bound_name}.{_DESCRIPTION_NAME}")
+        elif isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.name == _DEFAULTS_MODULE and alias.asname is not None:
+                    names.add(f"{alias.asname}.{_DESCRIPTION_NAME}")
+
+    return names
+
+
+def _find_description_value(
+    tree: ast.Module, description_variable: str
+) -> Optional[ast.expr]:
+    values: List[ast.expr] = []
+
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            if any(
+                isinstance(target, ast.Name) and target.id == description_variable
+                for target in statement.targets
+            ):
+                values.append(statement.value)
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            if (
+                isinstance(statement.target, ast.Name)
+                and statement.target.id == description_variable
+            ):
+                values.append(statement.value)
+
+    # A description which is assigned multiple times cannot be determined statically.
+    return values[0] if len(values) == 1 else None
+
+
+def _bind_arguments(call: ast.Call) -> Optional[Dict[str, ast.expr]]:
+    if len(call.args) > len(_ARGUMENT_NAMES) or any(
+        isinstance(argument, ast.Starred) for argument in call.args
+    ):
+        return None
+
+    arguments = dict(zip(_ARGUMENT_NAMES, call.args))
+    for keyword in call.keywords:
+        if keyword.arg is None or keyword.arg in arguments:
+            return None
+        arguments[keyword.arg] = keyword.value
+    return arguments
+
+
+def _literal_dependencies(node: Optional[ast.expr]) -> Optional[Tuple[str, ...]]:
+    if node is None or (isinstance(node, ast.Constant) and node.value is None):
+        return ()
+    if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return None
+
+    dependencies = []
+    for element in node.elts:
+        if not (isinstance(element, ast.Constant) and isinstance(element.value, str)):
+            return None
+        dependencies.append(element.value)
+    return tuple(dependencies)
+
+
+def extract_description_arguments(
+    source: str, description_variable: str
+) -> Optional[StaticDescriptionArguments]:
+    """
+    Extract the arguments of the default description assigned to description_variable
+    in the provided module source.
+
+    The extraction only succeeds if the description is assigned exactly once at the
+    module level by calling the default Description with a literal (or `__name__`)
+    name, the name of a module-level constructor, literal dependencies and a literal
+    extension_id.
+
+    Args:
+        source (str): The source of the extension module.
+        description_variable (str): The variable containing the description.
+
+    Returns:
+        Optional[StaticDescriptionArguments]:
+            The extracted arguments, or None if they cannot be determined statically.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    call = _find_description_value(tree, description_variable)
+    if not isinstance(call, ast.Call):
+        return None
+    if _dotted_name(call.func) not in _description_names(tree):
+        return None
+    if (arguments := _bind_arguments(call)) is None:
+        return None
+
+    name_node = arguments.get("name")
+    if isinstance(name_node, ast.Constant) and isinstance(name_node.value, str):
+        name: Optional[str] = name_node.value
+    elif isinstance(name_node, ast.Name) and name_node.id == "__name__":
+        name = None
+    else:
+        return None
+
+    ctor_node = arguments.get("extension_ctor")
+    if not isinstance(ctor_node, ast.Name):
+        return None
+
+    dependencies = _literal_dependencies(arguments.get("dependencies"))
+    if dependencies is None:
+        return None
+
+    id_node = arguments.get("extension_id")
+    if not (isinstance(id_node, ast.Constant) and isinstance(id_node.value, str)):
+        return None
+
+    return StaticDescriptionArguments(name, ctor_node.id, dependencies, id_node.value)
@@ -11,6 +11,8 @@ from typing import TypeAlias
 from ._internal.description import (
     DefaultDescription as Description,
     ExtensionID as ExtensionID,
+    CompactDescription as CompactDescription,  # noqa: F401
+    CompactExtensionID as CompactExtensionID,  # noqa: F401
 )
 
 from ._internal.resolver import (
@@ -18,10 +20,23 @@ from ._internal.resolver import (
 )
 from ._internal.resolver import (
     DefaultFileModuleResolver as FileModuleResolver,  # noqa: F401
+    DefaultRecursiveModuleResolver as RecursiveModuleResolver,  # noqa: F401
     DefaultDescriptionResolver as _DefaultDescriptionResolver,
+    DefaultStaticDescriptionResolver as StaticDescriptionResolver,  # noqa: F401
+)
+
+from ._internal.archive import (
+    DefaultArchiveModuleResolver as ArchiveModuleResolver,  # noqa: F401
+    DefaultArchiveDescriptionResolver as _DefaultArchiveDescriptionResolver,
+)
+
+from ._internal.registry import (
+    DefaultExtensionFactory as ExtensionFactory,  # noqa: F401
 )
 
 from ._internal.order import (
+    DefaultOrderingEngine as OrderingEngine,  # noqa: F401
+    NetworkXOrderingEngine as NetworkXOrderingEngine,  # noqa: F401
     DefaultResolveIdentifier as ResolveIdentifier,  # noqa: F401
     DefaultResolveDependency as ResolveDependency,  # noqa: F401
     OrderExtensionDescriptions as _OrderExtensionDescriptions,
@@ -29,6 +44,7 @@ from ._internal.order import (
 
 
 DescriptionResolver: TypeAlias = _DefaultDescriptionResolver[Description]
+ArchiveDescriptionResolver: TypeAlias = _DefaultArchiveDescriptionResolver[Description]
 OrderExtensionDescriptions: TypeAlias = _OrderExtensionDescriptions[
     Description, ExtensionID
 ]
@@ -4,6 +4,7 @@ eggstensibility.
 """
 
 from pathlib import Path
+from typing import Optional
 
 
 class BaseEggstensibilityException(Exception):
@@ -89,6 +90,94 @@ class MissingDependencyException(EggstensibilityDependencyException):
     require other extensions that are not available.
     """
 
+    def __init__(self, message: str, missing: Optional[dict] = None):
+        """
+        Create a new MissingDependencyException with the given message and the missing
+        dependencies of each extension.
+
+        The exact types of the identifiers depend on the descriptions provided to the
+        load mechanism.
+
+        Args:
+            message (str): The exception message
+            missing (Optional[dict]):
+                The identifiers of the missing dependencies by the identifier of the
+                extension requiring them.
+        """
+        super().__init__(message)
+        self._missing = missing if missing is not None else {}
+
+    @property
+    def missing(self) -> dict:
+        """The missing dependency identifiers by the extension requiring them."""
+        return dict(self._missing)
+
+
+class ExtensionConstructionException(BaseEggstensibilityException):
+    """
+    ExtensionConstructionException is thrown when one or more extensions could not be
+    constructed.
+    """
+
+    def __init__(self, message: str, errors: dict, extensions: dict, skipped: list):
+        """
+        Create a new ExtensionConstructionException with the given message, the errors
+        which occurred and the extensions which were constructed successfully.
+
+        The exact types of the identifiers and extensions depend on the descriptions
+        and factory provided to the construction.
+
+        Args:
+            message (str): The exception message
+            errors (dict): The exception raised for each failed extension identifier
+            extensions (dict): The successfully constructed extensions by identifier
+            skipped (list): The identifiers of the extensions which were not constructed
+        """
+        super().__init__(message)
+        self._errors = errors
+        self._extensions = extensions
+        self._skipped = skipped
+
+    @property
+    def errors(self) -> dict:
+        """The exception raised for each extension identifier that failed."""
+        return dict(self._errors)
+
+    @property
+    def extensions(self) -> dict:
+        """The successfully constructed extensions by identifier."""
+        return dict(self._extensions)
+
+    @property
+    def skipped(self) -> list:
+        """The identifiers of the extensions which were not constructed."""
+        return list(self._skipped)
+
+
+class ExtensionHostException(BaseEggstensibilityException):
+    """
+    ExtensionHostException is thrown when calls to extensions hosted in worker
+    processes failed, or the worker processes could not be started.
+    """
+
+    def __init__(self, message: str, errors: Optional[dict] = None):
+        """
+        Create a new ExtensionHostException with the given message and the errors of
+        the failed calls.
+
+        Args:
+            message (str): The exception message
+            errors (Optional[dict]):
+                The formatted error of each failed call, by the index of the call.
+        """
+        super().__init__(message)
+        self._errors = errors if errors is not None else {}
+
+    @property
+    def errors(self) -> dict:
+        """The formatted error of each failed call, by the index of the call."""
+        return dict(self._errors)
+
 
 class IncompleteLoaderConfigurationException(BaseEggstensibilityException):
     """
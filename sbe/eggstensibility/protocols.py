@@ -4,8 +4,12 @@ sbe.eggstensibility.protocols defines the interface contracts used within this l
 
 from ._internal.order import ResolveIdentifier as ResolveIdentifier
 from ._internal.order import ResolveDependency as ResolveDependency
+from ._internal.order import OrderingEngine as OrderingEngine
 
 from ._internal.resolver import ModuleResolver as ModuleResolver
 from ._internal.resolver import DescriptionResolver as DescriptionResolver
 
+from ._internal.registry import ExtensionFactory as ExtensionFactory
+
 from ._internal.logging import Logger as Logger
+from ._internal.metrics import LoaderObserver as LoaderObserver
@@ -0,0 +1,41 @@
+"""
+conftest.py provides the fixtures shared by the unit tests.
+"""
+
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+
+PluginFactory = Callable[..., Path]
+
+
+@pytest.fixture
+def create_plugin(tmp_path: Path) -> PluginFactory:
+    """
+    Provide a factory creating extension packages, by default within tmp_path.
+
+    The factory takes the name of the package, the source of its `extension.py`, the
+    source of its `__init__.py` as init, the directory in which to create the package
+    as root, and the sources of any further modules as keyword arguments. It returns
+    the path to the created package.
+    """
+
+    def create(
+        name: str,
+        source: str = "",
+        *,
+        init: str = "",
+        root: Optional[Path] = None,
+        **modules: str,
+    ) -> Path:
+        plugin_path = (root if root is not None else tmp_path) / name
+        plugin_path.mkdir(parents=True)
+        (plugin_path / "__init__.py").write_text(init)
+        (plugin_path / "extension.py").write_text(source)
+        for module, module_source in modules.items():
+            (plugin_path / f"{module}.py").write_text(module_source)
+        return plugin_path
+
+    return create
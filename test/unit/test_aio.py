@@ -0,0 +1,155 @@
+"""
+test_aio.py validates that the asyncio-native loader constructs sync and async
+extensions concurrently, respecting their dependencies and the concurrency limit.
+"""
+
+import asyncio
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+class Tracker:
+    def __init__(self, concurrency: int = 1) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.finished = []
+        # Async extensions wait until the expected number of them are constructed at
+        # the same time, and fail with a timeout if construction is not concurrent.
+        self._concurrency = concurrency
+        self._concurrent = asyncio.Event()
+
+    def create_async_ctor(self, extension_id, dependencies):
+        async def ctor():
+            assert all(d in self.finished for d in dependencies)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            if self.running == self._concurrency:
+                self._concurrent.set()
+            await asyncio.wait_for(self._concurrent.wait(), timeout=10)
+            self.running -= 1
+            self.finished.append(extension_id)
+            return f"async {extension_id}"
+
+        return ctor
+
+    def create_sync_ctor(self, extension_id, dependencies):
+        def ctor():
+            assert all(d in self.finished for d in dependencies)
+            self.finished.append(extension_id)
+            return f"sync {extension_id}"
+
+        return ctor
+
+
+def create_async_loader(tracker: Tracker, dependencies, factory=True):
+    descriptions = {
+        extension_id: defaults.Description(
+            extension_id,
+            (
+                tracker.create_sync_ctor(extension_id, extension_dependencies)
+                if extension_id.startswith("sync")
+                else tracker.create_async_ctor(extension_id, extension_dependencies)
+            ),
+            extension_dependencies,
+            extension_id=extension_id,
+        )
+        for extension_id, extension_dependencies in dependencies.items()
+    }
+
+    builder = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(
+            lambda module_paths: [descriptions[p.name] for p in module_paths]
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(*(Path(extension_id) for extension_id in dependencies))
+    )
+    if factory:
+        builder.configure_extension_factory(defaults.ExtensionFactory())
+    return builder.build_async()
+
+
+def test_async_loader_constructs_concurrently():
+    tracker = Tracker(concurrency=2)
+    dependencies = {
+        "sync_root": [],
+        "a": ["sync_root"],
+        "b": ["sync_root"],
+        "c": ["sync_root"],
+        "d": ["a", "b", "c"],
+    }
+    loader = create_async_loader(tracker, dependencies)
+
+    extensions = asyncio.run(loader.load_extensions(max_concurrency=2))
+
+    assert extensions == {
+        "sync_root": "sync sync_root",
+        "a": "async a",
+        "b": "async b",
+        "c": "async c",
+        "d": "async d",
+    }
+    assert tracker.max_running == 2
+    assert tracker.finished[0] == "sync_root"
+    assert tracker.finished[-1] == "d"
+
+
+def test_async_loader_targets():
+    tracker = Tracker()
+    dependencies = {"a": [], "b": ["a"], "c": []}
+    loader = create_async_loader(tracker, dependencies)
+
+    descriptions = asyncio.run(loader.load_extension_descriptions(targets=["b"]))
+
+    assert [d.extension_id for d in descriptions] == ["a", "b"]
+
+
+def test_async_loader_requires_extension_factory():
+    loader = create_async_loader(Tracker(), {"a": []}, factory=False)
+
+    with pytest.raises(eggstensibility.exceptions.IncompleteLoaderConfigurationException):
+        asyncio.run(loader.load_extensions())
+
+
+def test_async_loader_reports_unordered_and_missing_dependencies():
+    tracker = Tracker()
+    loader = create_async_loader(tracker, {"a": [], "b": ["a"]})
+    a, b = asyncio.run(loader.load_extension_descriptions())
+
+    with pytest.raises(exceptions.MissingDependencyException) as info:
+        asyncio.run(loader.construct_extensions([b, a]))
+    assert info.value.missing == {"b": ["a"]}
+
+    with pytest.raises(exceptions.MissingDependencyException) as info:
+        asyncio.run(loader.construct_extensions([b]))
+    assert info.value.missing == {"b": ["a"]}
+
+    assert tracker.finished == []
+
+
+def test_async_loader_requires_positive_concurrency():
+    loader = create_async_loader(Tracker(), {"a": []})
+
+    with pytest.raises(ValueError):
+        asyncio.run(loader.load_extensions(max_concurrency=0))
+    with pytest.raises(ValueError):
+        asyncio.run(loader.construct_extensions([], max_concurrency=0))
+
+
+def test_building_a_loader_does_not_import_asyncio():
+    code = (
+        "import sys\n"
+        "from sbe import eggstensibility\n"
+        "eggstensibility.construct_builder()\n"
+        "assert 'asyncio' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,81 @@
+"""
+test_archive.py validates that extensions are resolved and loaded directly from zip
+archives.
+"""
+
+import sys
+import zipfile
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+from . import helper
+
+
+def ctor():
+    return helper.VALUE
+
+
+description = Description(__name__, ctor, {dependencies}, extension_id="{name}")
+"""
+
+
+def create_archive(archive_path: Path, plugins) -> Path:
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, dependencies in plugins.items():
+            archive.writestr(f"{name}/__init__.py", "")
+            archive.writestr(f"{name}/helper.py", f"VALUE = 'extension {name}'\n")
+            archive.writestr(
+                f"{name}/extension.py",
+                EXTENSION.format(name=name, dependencies=dependencies),
+            )
+        archive.writestr("not_a_package/extension.py", "")
+        archive.writestr("grouped/__init__.py", "")
+    return archive_path
+
+
+def test_archive_module_resolver(tmp_path: Path):
+    archive_path = create_archive(tmp_path / "plugins.zip", {"a": [], "b": []})
+
+    module_paths = list(defaults.ArchiveModuleResolver()(archive_path))
+
+    assert module_paths == [
+        archive_path / "a" / "extension.py",
+        archive_path / "b" / "extension.py",
+    ]
+    assert list(defaults.ArchiveModuleResolver()(tmp_path)) == []
+
+
+def test_load_extensions_from_archive(tmp_path: Path):
+    archive_path = create_archive(
+        tmp_path / "plugins-1.0-py3-none-any.whl", {"a": ["b"], "b": []}
+    )
+    namespace = "sbe.eggstensibility.test_archive"
+
+    loader = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.ArchiveModuleResolver())
+        .add_description_resolver(
+            defaults.ArchiveDescriptionResolver(external_namespace=namespace)
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(archive_path)
+        .build()
+    )
+    descriptions = list(loader.load_extension_descriptions())
+
+    assert [d.extension_id for d in descriptions] == ["b", "a"]
+    assert [d.create_extension() for d in descriptions] == [
+        "extension b",
+        "extension a",
+    ]
+    assert sys.modules[f"{namespace}.a.extension"].__file__ == str(
+        archive_path / "a" / "extension.py"
+    )
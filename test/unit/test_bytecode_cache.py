@@ -0,0 +1,92 @@
+"""
+test_bytecode_cache.py validates that the DefaultDescriptionResolver caches the compiled
+code of extension modules in a dedicated directory, and reuses it while it is valid.
+"""
+
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from sbe.eggstensibility import defaults
+from sbe.eggstensibility._internal.bytecode import BytecodeCacheLoader
+
+
+EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return "{value}"
+
+
+description = Description(__name__, ctor, extension_id="{name}")
+"""
+
+
+def load_extension(module_path: Path, cache_path: Path, validation: str, namespace):
+    resolver = defaults.DescriptionResolver(
+        external_namespace=namespace,
+        bytecode_cache=cache_path,
+        bytecode_validation=validation,
+    )
+    (description,) = resolver([module_path])
+    resolver.invalidate([module_path])
+    return description.create_extension()
+
+
+@pytest.mark.parametrize("validation", ["timestamp", "checked-hash"])
+def test_bytecode_cache_is_reused_and_invalidated(
+    tmp_path: Path, create_plugin, validation: str
+):
+    plugins_path = tmp_path / "plugins"
+    cache_path = tmp_path / "bytecode"
+    plugin_path = create_plugin(
+        "plugin", EXTENSION.format(name="plugin", value="original"), root=plugins_path
+    )
+    module_path = plugin_path / "extension.py"
+    namespace = f"sbe.eggstensibility.test_bytecode_{validation.replace('-', '_')}"
+
+    assert load_extension(module_path, cache_path, validation, namespace) == "original"
+    assert not (plugins_path / "plugin" / "__pycache__").exists()
+    cached_paths = sorted(cache_path.glob("*.pyc"))
+    assert len(cached_paths) == 2  # The parent __init__.py and the extension.
+
+    # Cached code is reused while the source is unchanged.
+    cached_mtimes = [p.stat().st_mtime_ns for p in cached_paths]
+    assert load_extension(module_path, cache_path, validation, namespace) == "original"
+    assert [p.stat().st_mtime_ns for p in cached_paths] == cached_mtimes
+
+    # Modified sources are recompiled, hash-based validation even detects
+    # modifications which retain the size and mtime of the source.
+    stat = module_path.stat()
+    module_path.write_text(EXTENSION.format(name="plugin", value="modified"))
+    mtime_offset = 0 if validation == "checked-hash" else 10**9
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+    assert load_extension(module_path, cache_path, validation, namespace) == "modified"
+
+
+def test_unknown_bytecode_validation():
+    with pytest.raises(ValueError):
+        defaults.DescriptionResolver(bytecode_validation="never")
+
+
+def test_bytecode_cache_is_written_concurrently(tmp_path: Path):
+    module_path = tmp_path / "module.py"
+    module_path.write_text("VALUE = 1\n")
+    cache_path = tmp_path / "bytecode"
+
+    def get_code(_):
+        loader = BytecodeCacheLoader(
+            "test_bytecode_concurrent", str(module_path), cache_path, "checked-hash"
+        )
+        return loader.get_code("test_bytecode_concurrent")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        codes = list(executor.map(get_code, range(32)))
+
+    assert all(code.co_names == codes[0].co_names for code in codes)
+    # Every thread writes through its own temporary file, none of which remain.
+    assert [p.suffix for p in cache_path.iterdir()] == [".pyc"]
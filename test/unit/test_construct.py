@@ -0,0 +1,113 @@
+"""
+test_construct.py validates that ConstructExtensions constructs independent extensions
+concurrently while respecting their dependencies, and reports failures.
+"""
+
+import threading
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+class RecordingFactory:
+    def __init__(self, dependencies, failing=(), concurrent=()):
+        self._dependencies = dependencies
+        self._failing = set(failing)
+        # The concurrent extensions are only constructed once all of them are being
+        # constructed at the same time.
+        self._concurrent = set(concurrent)
+        self._barrier = threading.Barrier(max(len(self._concurrent), 1), timeout=10)
+        self._lock = threading.Lock()
+        self.finished = set()
+
+    def __call__(self, extension_id):
+        assert all(d in self.finished for d in self._dependencies[extension_id])
+
+        if extension_id in self._concurrent:
+            self._barrier.wait()
+
+        with self._lock:
+            self.finished.add(extension_id)
+
+        if extension_id in self._failing:
+            raise RuntimeError(f"{extension_id} failed")
+        return f"extension {extension_id}"
+
+
+def construct(dependencies, factory, error_policy="fail_fast"):
+    descriptions = list(
+        eggstensibility.OrderExtensionDescriptions(
+            lambda description: description,
+            lambda description: dependencies[description],
+        )(dependencies)
+    )
+    return eggstensibility.ConstructExtensions(
+        lambda description: description,
+        lambda description: dependencies[description],
+        factory,
+        max_workers=8,
+        error_policy=error_policy,
+    )(descriptions)
+
+
+def test_independent_extensions_are_constructed_concurrently():
+    dependencies = {"a": [], "b": [], "c": [], "d": ["a", "b"], "e": ["d"]}
+    factory = RecordingFactory(dependencies, concurrent=["a", "b", "c"])
+
+    extensions = construct(dependencies, factory)
+
+    assert extensions == {k: f"extension {k}" for k in ["a", "b", "c", "d", "e"]}
+
+
+def test_unordered_dependencies_are_reported():
+    dependencies = {"a": [], "b": ["a", "c"], "c": []}
+    factory = RecordingFactory(dependencies)
+
+    with pytest.raises(exceptions.MissingDependencyException) as info:
+        eggstensibility.ConstructExtensions(
+            lambda description: description,
+            lambda description: dependencies[description],
+            factory,
+        )(["a", "b", "c"])
+
+    assert info.value.missing == {"b": ["c"]}
+    assert factory.finished == set()
+
+
+def test_collect_skips_dependents_of_failed_extensions():
+    dependencies = {"a": [], "b": [], "c": ["a"], "d": ["b"]}
+    factory = RecordingFactory(dependencies, failing=["a"])
+
+    with pytest.raises(exceptions.ExtensionConstructionException) as exception_info:
+        construct(dependencies, factory, "collect")
+
+    assert list(exception_info.value.errors) == ["a"]
+    assert exception_info.value.skipped == ["c"]
+    assert exception_info.value.extensions == {
+        "b": "extension b",
+        "d": "extension d",
+    }
+
+
+def test_fail_fast_stops_after_failing_level():
+    dependencies = {"a": [], "b": [], "c": ["b"]}
+    factory = RecordingFactory(dependencies, failing=["a"], concurrent=["a", "b"])
+
+    with pytest.raises(exceptions.ExtensionConstructionException) as exception_info:
+        construct(dependencies, factory)
+
+    assert list(exception_info.value.errors) == ["a"]
+    assert exception_info.value.skipped == ["c"]
+    assert "c" not in factory.finished
+
+
+def test_unknown_error_policy():
+    with pytest.raises(ValueError):
+        eggstensibility.ConstructExtensions(
+            defaults.ResolveIdentifier(),
+            defaults.ResolveDependency(),
+            defaults.ExtensionFactory(),
+            error_policy="ignore",
+        )
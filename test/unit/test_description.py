@@ -0,0 +1,69 @@
+"""
+test_description.py validates the memory behaviour of the DefaultDescription and the
+CompactDescription.
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from sbe.eggstensibility import defaults
+
+
+def ctor():
+    return "extension"
+
+
+def test_descriptions_are_released():
+    description = defaults.Description("a", ctor, ["b", "c"])
+    assert sorted(description.dependencies) == ["b", "c"]
+
+    reference = weakref.ref(description)
+    del description
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_compact_description():
+    dependency_id = "".join(["dependency", "_id"])
+    description = defaults.CompactDescription(
+        "a", ctor, [dependency_id, dependency_id], extension_id="".join(["a", "_id"])
+    )
+
+    assert not hasattr(description, "__dict__")
+    assert description.extension_id is "a_id"  # noqa: F632
+    assert list(description.dependencies) == ["dependency_id"]
+    assert next(iter(description.dependencies)) is "dependency_id"  # noqa: F632
+    assert description.create_extension() == "extension"
+
+    other = defaults.CompactDescription("b", ctor)
+    assert isinstance(other.extension_id, int)
+    assert other.extension_id != defaults.CompactDescription("c", ctor).extension_id
+
+
+def test_compact_description_ids_are_disjoint_from_explicit_ids():
+    generated = defaults.CompactDescription("a", ctor)
+    explicit = defaults.CompactDescription("b", ctor, extension_id=abs(generated.extension_id))
+
+    assert generated.extension_id < 0
+    assert explicit.extension_id != generated.extension_id
+
+    with pytest.raises(ValueError):
+        defaults.CompactDescription("c", ctor, extension_id=-1)
+
+
+def test_compact_description_resolves_callable_dependencies_lazily():
+    calls = []
+
+    def dependencies():
+        calls.append(None)
+        return ["b"]
+
+    description = defaults.CompactDescription("a", ctor, dependencies)
+    assert calls == []
+
+    assert list(description.dependencies) == ["b"]
+    assert list(description.dependencies) == ["b"]
+    assert len(calls) == 1
@@ -0,0 +1,113 @@
+"""
+test_filesystem.py validates that the loader shares a file system cache between its
+module resolvers, and only loads each resolved module path once.
+"""
+
+import os
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+from sbe.eggstensibility._internal.filesystem import filesystem_cache, is_file
+
+
+def create_plugins(root: Path, count: int):
+    plugin_paths = []
+    for index in range(count):
+        plugin_path = root / f"plugin_{index}"
+        plugin_path.mkdir()
+        (plugin_path / "__init__.py").touch()
+        (plugin_path / "extension.py").touch()
+        plugin_paths.append(plugin_path)
+    return plugin_paths
+
+
+class RecordingDescriptionResolver:
+    def __init__(self) -> None:
+        self.module_paths = []
+
+    def __call__(self, module_paths):
+        module_paths = list(module_paths)
+        self.module_paths.extend(module_paths)
+        return module_paths
+
+
+def record_stats(monkeypatch, root: Path):
+    stat = os.stat
+    paths = []
+
+    def recording_stat(path, *args, **kwargs):
+        if str(path).startswith(str(root)):
+            paths.append(path)
+        return stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", recording_stat)
+    return paths
+
+
+def test_cache_stats_each_path_once(tmp_path: Path, monkeypatch):
+    (tmp_path / "module.py").touch()
+    stat_paths = record_stats(monkeypatch, tmp_path)
+
+    with filesystem_cache():
+        assert is_file(tmp_path / "module.py")
+        assert is_file(tmp_path / "module.py")
+        assert not is_file(tmp_path)
+        assert not is_file(tmp_path / "missing.py")
+        assert not is_file(tmp_path / "missing.py")
+
+    assert len(stat_paths) == 3
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_loader_deduplicates_module_paths(
+    tmp_path: Path, monkeypatch, concurrency: int
+):
+    plugin_paths = create_plugins(tmp_path, 8)
+    stat_paths = record_stats(monkeypatch, tmp_path)
+    description_resolver = RecordingDescriptionResolver()
+
+    descriptions = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(description_resolver)
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: [])
+        .configure_harvest_concurrency(concurrency)
+        .add_harvest_path(*plugin_paths, *plugin_paths)
+        .build()
+        .load_extension_descriptions()
+    )
+
+    expected = [plugin_path / "extension.py" for plugin_path in plugin_paths]
+    assert descriptions == expected
+    assert description_resolver.module_paths == expected
+    # Each module and package is queried once, and the other queries hit the cache.
+    # Concurrent threads could both miss the cache of the same path.
+    assert len(set(stat_paths)) == 2 * len(plugin_paths)
+    if concurrency == 1:
+        assert len(stat_paths) == 2 * len(plugin_paths)
+
+
+def test_stream_deduplicates_module_paths(tmp_path: Path):
+    plugin_paths = create_plugins(tmp_path, 4)
+    description_resolver = RecordingDescriptionResolver()
+
+    descriptions = list(
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(description_resolver)
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: [])
+        .build()
+        .stream_extension_descriptions(plugin_paths * 2)
+    )
+
+    expected = [plugin_path / "extension.py" for plugin_path in plugin_paths]
+    assert descriptions == expected
+    assert description_resolver.module_paths == expected
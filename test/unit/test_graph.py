@@ -0,0 +1,99 @@
+"""
+test_graph.py validates the queries of the ExtensionGraph returned by the loader.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+DEPENDENCIES = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []}
+
+
+def load_graph(targets=None):
+    descriptions = {
+        extension_id: defaults.Description(
+            extension_id, object, dependencies, extension_id=extension_id
+        )
+        for extension_id, dependencies in DEPENDENCIES.items()
+    }
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(
+            lambda module_paths: [descriptions[p.name] for p in module_paths]
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(*map(Path, DEPENDENCIES))
+        .build()
+        .load_extension_graph(targets)
+    )
+
+
+def test_extension_graph_queries():
+    graph = load_graph()
+
+    assert list(graph) == ["a", "e", "b", "c", "d"]
+    assert len(graph) == 5 and "d" in graph and "f" not in graph
+    assert graph.get_description("d").extension_id == "d"
+    assert [graph.position(i) for i in graph] == [0, 1, 2, 3, 4]
+    assert [graph.generation(i) for i in graph] == [0, 0, 1, 1, 2]
+    assert [[d.extension_id for d in g] for g in graph.generations] == [
+        ["a", "e"],
+        ["b", "c"],
+        ["d"],
+    ]
+
+    assert sorted(graph.dependencies("d")) == ["b", "c"]
+    assert graph.dependents("a") == ("b", "c")
+    assert graph.transitive_dependencies("d") == ("a", "b", "c")
+    assert graph.transitive_dependencies("d") is graph.transitive_dependencies("d")
+    assert graph.transitive_dependents("a") == ("b", "c", "d")
+    assert graph.transitive_dependents("e") == ()
+
+    with pytest.raises(KeyError):
+        graph.dependents("f")
+
+
+def test_extension_graph_of_targets():
+    graph = load_graph(targets=["b"])
+
+    assert list(graph) == ["a", "b"]
+    assert graph.transitive_dependents("a") == ("b",)
+
+
+def test_extension_graph_requires_ordered_descriptions():
+    with pytest.raises(exceptions.MissingDependencyException):
+        eggstensibility.ExtensionGraph(
+            ["b", "a"], lambda d: d, lambda d: DEPENDENCIES[d]
+        )
+
+
+def test_extension_graph_resolves_each_description_once():
+    calls = {"identifier": 0, "dependency": 0}
+
+    def identifier_resolver(description):
+        calls["identifier"] += 1
+        return description
+
+    def dependency_resolver(description):
+        calls["dependency"] += 1
+        return DEPENDENCIES[description]
+
+    graph = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(lambda module_paths: [p.name for p in module_paths])
+        .configure_identifier_resolver(identifier_resolver)
+        .configure_dependency_resolver(dependency_resolver)
+        .add_harvest_path(*map(Path, DEPENDENCIES))
+        .build()
+        .load_extension_graph()
+    )
+
+    assert graph.transitive_dependencies("d") == ("a", "b", "c")
+    assert calls == {"identifier": len(DEPENDENCIES), "dependency": len(DEPENDENCIES)}
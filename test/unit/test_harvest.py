@@ -0,0 +1,68 @@
+"""
+test_harvest.py validates the harvesting of module paths by the loader.
+"""
+
+import random
+import time
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+class JitteredModuleResolver:
+    def __init__(self) -> None:
+        self._resolver = defaults.DirectoryModuleResolver("extension.py")
+
+    def __call__(self, path: Path):
+        time.sleep(random.random() / 1000.0)
+        return list(self._resolver(path))
+
+
+def create_plugins(root: Path, count: int):
+    plugin_paths = []
+    for index in range(count):
+        plugin_path = root / f"plugin_{index}"
+        plugin_path.mkdir()
+        (plugin_path / "__init__.py").touch()
+        (plugin_path / "extension.py").touch()
+        plugin_paths.append(plugin_path)
+    return plugin_paths
+
+
+def load_module_paths(concurrency: int, *paths: Path):
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(JitteredModuleResolver())
+        .add_module_resolver(defaults.FileModuleResolver())
+        .add_description_resolver(lambda module_paths: list(module_paths))
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: [])
+        .configure_harvest_concurrency(concurrency)
+        .add_harvest_path(*paths)
+        .build()
+        .load_extension_descriptions()
+    )
+
+
+def test_concurrent_harvest_preserves_order(tmp_path: Path):
+    plugin_paths = create_plugins(tmp_path, 50)
+    file_paths = [p / "extension.py" for p in plugin_paths[::5]]
+    harvest_paths = [p for pair in zip(plugin_paths, file_paths) for p in pair]
+
+    sequential = load_module_paths(1, *harvest_paths)
+    concurrent = load_module_paths(8, *harvest_paths)
+
+    # The modules of plugin_0 and plugin_5 are resolved by both harvest paths, and
+    # are only loaded at their first position.
+    assert len(sequential) == 2 * len(file_paths) - 2
+    assert len(set(sequential)) == len(sequential)
+    assert concurrent == sequential
+
+
+def test_harvest_concurrency_should_be_positive():
+    with pytest.raises(ValueError):
+        eggstensibility.construct_builder().configure_harvest_concurrency(0)
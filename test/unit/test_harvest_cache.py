@@ -0,0 +1,102 @@
+"""
+test_harvest_cache.py validates that the harvest cache configured on the builder only
+resolves the harvest paths that changed since the previous load.
+"""
+
+import threading
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+from sbe.eggstensibility._internal.cache import HarvestCache
+
+
+class CountingModuleResolver:
+    def __init__(self) -> None:
+        self._resolver = defaults.DirectoryModuleResolver("extension.py")
+        self.calls = []
+
+    def __call__(self, path: Path):
+        self.calls.append(path)
+        return self._resolver(path)
+
+
+def load_module_paths(resolver, cache_path: Path, *paths: Path):
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(resolver)
+        .add_description_resolver(lambda module_paths: list(module_paths))
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: [])
+        .configure_harvest_cache(cache_path)
+        .add_harvest_path(*paths)
+        .build()
+        .load_extension_descriptions()
+    )
+
+
+def test_harvest_cache_skips_unchanged_paths(tmp_path: Path, create_plugin):
+    cache_path = tmp_path / "cache" / "harvest.json"
+    plugin_a = create_plugin("plugin_a", root=tmp_path / "plugins")
+    plugin_b = tmp_path / "plugins" / "plugin_b"
+    plugin_b.mkdir()
+
+    cold_resolver = CountingModuleResolver()
+    cold = load_module_paths(cold_resolver, cache_path, plugin_a, plugin_b)
+
+    assert cold == [(plugin_a / "extension.py").resolve()]
+    assert cold_resolver.calls == [plugin_a, plugin_b]
+    assert cache_path.is_file()
+
+    warm_resolver = CountingModuleResolver()
+    warm = load_module_paths(warm_resolver, cache_path, plugin_a, plugin_b)
+
+    assert warm == cold
+    assert warm_resolver.calls == []
+
+    (plugin_b / "__init__.py").touch()
+    (plugin_b / "extension.py").touch()
+
+    changed_resolver = CountingModuleResolver()
+    changed = load_module_paths(changed_resolver, cache_path, plugin_a, plugin_b)
+
+    assert changed == cold + [(plugin_b / "extension.py").resolve()]
+    assert changed_resolver.calls == [plugin_b]
+
+
+def test_harvest_cache_ignores_corrupt_cache(tmp_path: Path, create_plugin):
+    cache_path = tmp_path / "harvest.json"
+    cache_path.write_text("{ not json")
+    plugin_a = create_plugin("plugin_a")
+
+    resolver = CountingModuleResolver()
+    module_paths = load_module_paths(resolver, cache_path, plugin_a)
+
+    assert module_paths == [(plugin_a / "extension.py").resolve()]
+    assert resolver.calls == [plugin_a]
+
+
+def test_harvest_cache_flushes_concurrently(tmp_path: Path):
+    cache = HarvestCache(tmp_path / "harvest.json")
+    errors = []
+
+    def store_and_flush(thread: int):
+        try:
+            for index in range(50):
+                cache.store(tmp_path / f"{thread}_{index}", "key", [])
+                cache.flush()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=store_and_flush, args=(thread,)) for thread in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(HarvestCache(tmp_path / "harvest.json")._read_entries()) == 200
+    assert [p.name for p in tmp_path.iterdir()] == ["harvest.json"]
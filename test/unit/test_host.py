@@ -0,0 +1,125 @@
+"""
+test_host.py validates that the ExtensionHost executes batches of calls in its worker
+processes, reports failing calls and restarts crashed workers.
+"""
+
+import os
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+class Calculator:
+    def square(self, x: int) -> int:
+        return x * x
+
+    def pid(self) -> int:
+        return os.getpid()
+
+    def fail(self) -> None:
+        raise ValueError("failed")
+
+    def crash(self) -> None:
+        os._exit(3)
+
+
+def describe(module_paths):
+    return [
+        defaults.Description(p.name, Calculator, extension_id=p.name)
+        for p in module_paths
+    ]
+
+
+def create_loader():
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(describe)
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(Path("calculator"))
+        .build()
+    )
+
+
+class FailingLoaderFactory:
+    def __init__(self, marker: Path) -> None:
+        self._marker = marker
+
+    def __call__(self):
+        if self._marker.exists():
+            self._marker.unlink()
+            raise RuntimeError("unable to load")
+        return create_loader()
+
+
+def test_host_distributes_batches_over_workers():
+    with eggstensibility.ExtensionHost(create_loader, workers=2, batch_size=1) as host:
+        calculator = host.proxy("calculator")
+
+        assert calculator.square(3) == 9
+        assert calculator.map("square", range(100)) == [x * x for x in range(100)]
+
+        pids = host.call_batch(
+            [eggstensibility.HostCall("calculator", "pid") for _ in range(20)]
+        )
+        assert os.getpid() not in pids
+        assert len(set(pids)) == 2
+
+
+def test_host_reports_failed_calls():
+    with eggstensibility.ExtensionHost(create_loader) as host:
+        with pytest.raises(exceptions.ExtensionHostException) as info:
+            host.call_batch(
+                [
+                    eggstensibility.HostCall("calculator", "square", (2,)),
+                    eggstensibility.HostCall("calculator", "fail"),
+                    eggstensibility.HostCall("unknown", "square", (2,)),
+                ]
+            )
+
+        assert sorted(info.value.errors) == [1, 2]
+        assert "ValueError: failed" in info.value.errors[1]
+        assert host.call("calculator", "square", 4) == 16
+
+
+def test_host_restarts_crashed_workers():
+    with eggstensibility.ExtensionHost(create_loader) as host:
+        pid = host.call("calculator", "pid")
+
+        with pytest.raises(exceptions.ExtensionHostException) as info:
+            host.call("calculator", "crash")
+
+        assert "code 3" in info.value.errors[0]
+        assert host.restarts == 1
+        assert host.call("calculator", "pid") != pid
+
+
+def test_host_retries_failed_restarts(tmp_path: Path):
+    marker = tmp_path / "fail"
+
+    with eggstensibility.ExtensionHost(FailingLoaderFactory(marker)) as host:
+        marker.touch()
+        with pytest.raises(exceptions.ExtensionHostException) as info:
+            host.call("calculator", "crash")
+
+        assert "unable to load" in info.value.errors[0]
+        assert host.restarts == 0
+
+        # The failed restart is retried by the next call, rather than blocking it.
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(host.call("calculator", "square", 3)),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(30)
+
+        assert results == [9]
+        assert host.restarts == 1
@@ -0,0 +1,109 @@
+"""
+test_lazy.py validates that the lazy mode of the DescriptionResolver defers executing
+extension packages and the submodules imported by extension modules until their
+attributes are accessed.
+"""
+
+import gc
+import sys
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+MARK_EXECUTED = """\
+from pathlib import Path
+Path(__file__).with_suffix(".executed").touch()
+"""
+
+STANDALONE_EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return "standalone"
+
+
+description = Description(__name__, ctor, extension_id="standalone")
+"""
+
+SUBMODULE_EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+from . import heavy
+
+
+def ctor():
+    return heavy.VALUE
+
+
+description = Description(__name__, ctor, extension_id="submodule")
+"""
+
+
+def create_lazy_plugin(create_plugin, name: str, source: str) -> Path:
+    return create_plugin(
+        name, source, init=MARK_EXECUTED, heavy=MARK_EXECUTED + "VALUE = 'heavy'\n"
+    )
+
+
+def is_executed(plugin_path: Path, module: str) -> bool:
+    return (plugin_path / f"{module}.executed").is_file()
+
+
+def test_lazy_resolver_defers_packages_and_submodules(create_plugin):
+    standalone = create_lazy_plugin(create_plugin, "standalone", STANDALONE_EXTENSION)
+    submodule = create_lazy_plugin(create_plugin, "submodule", SUBMODULE_EXTENSION)
+
+    registry = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver(
+                external_namespace="test_lazy_external", lazy=True
+            )
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(standalone, submodule)
+        .build()
+        .load_extension_registry()
+    )
+
+    assert sorted(registry) == ["standalone", "submodule"]
+    assert not is_executed(standalone, "__init__")
+    # Importing a submodule requires the package itself.
+    assert is_executed(submodule, "__init__")
+    assert not is_executed(submodule, "heavy")
+
+    assert registry["standalone"] == "standalone"
+    assert not is_executed(standalone, "__init__")
+
+    assert registry["submodule"] == "heavy"
+    assert is_executed(submodule, "heavy")
+
+
+def test_lazy_finder_is_scoped_to_its_resolver(create_plugin):
+    lazy_plugin = create_lazy_plugin(create_plugin, "lazy_plugin", SUBMODULE_EXTENSION)
+    eager_plugin = create_lazy_plugin(create_plugin, "eager_plugin", SUBMODULE_EXTENSION)
+    namespace = "test_lazy_scoped_external"
+    lazy_resolver = defaults.DescriptionResolver(
+        external_namespace=namespace, lazy=True
+    )
+    eager_resolver = defaults.DescriptionResolver(external_namespace=namespace)
+    meta_path = list(sys.meta_path)
+
+    lazy_resolver([lazy_plugin / "extension.py"])
+    eager_resolver([eager_plugin / "extension.py"])
+
+    # The eager resolver shares the namespace, but its submodules are not lazy.
+    assert not is_executed(lazy_plugin, "heavy")
+    assert is_executed(eager_plugin, "heavy")
+    assert len(sys.meta_path) == len(meta_path) + 1
+
+    del lazy_resolver
+    gc.collect()
+    assert sys.meta_path == meta_path
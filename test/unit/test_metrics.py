@@ -0,0 +1,91 @@
+"""
+test_metrics.py validates that the loader reports the phases of loading extensions to
+the configured observers, and passes the configured logger to its resolvers.
+"""
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return "{name}"
+
+
+description = Description(__name__, ctor, {dependencies}, extension_id="{name}")
+"""
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def debug(self, msg, *args, **kwargs):
+        self.messages.append(("debug", msg))
+
+    def info(self, msg, *args, **kwargs):
+        self.messages.append(("info", msg))
+
+    def warning(self, msg, *args, **kwargs):
+        self.messages.append(("warning", msg))
+
+    def error(self, msg, *args, **kwargs):
+        self.messages.append(("error", msg))
+
+
+def failing_observer(event):
+    raise RuntimeError("unavailable")
+
+
+def test_loader_reports_phases(tmp_path: Path, create_plugin):
+    plugin_paths = [
+        create_plugin("a", EXTENSION.format(name="a", dependencies=[])),
+        create_plugin("b", EXTENSION.format(name="b", dependencies=["a"])),
+        create_plugin("c", EXTENSION.format(name="c", dependencies=["b"])),
+        create_plugin("no_description", ""),
+    ]
+    events = []
+    logger = RecordingLogger()
+
+    loader = (
+        eggstensibility.construct_builder()
+        .configure_logger(logger)
+        .add_observer(failing_observer)
+        .add_observer(events.append)
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver(
+                external_namespace="sbe.eggstensibility.test_metrics"
+            )
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_harvest_cache(tmp_path / "harvest.json")
+        .add_harvest_path(*plugin_paths)
+        .build()
+    )
+    loader.load_extension_descriptions(targets=["b"])
+
+    assert [(event.phase, dict(event.counts)) for event in events] == [
+        (
+            "harvest",
+            {"harvest_paths": 4, "modules": 4, "cache_hits": 0, "cache_misses": 4},
+        ),
+        ("retrieve", {"modules": 4, "descriptions": 3}),
+        ("select", {"targets": 1, "descriptions": 2}),
+        ("order", {"nodes": 2, "edges": 1}),
+        ("load", {"descriptions": 2}),
+    ]
+    assert all(event.duration >= 0 for event in events)
+    assert events[-1].duration >= sum(event.duration for event in events[:-1])
+
+    assert any(
+        level == "debug" and "does not define 'description'" in message
+        for level, message in logger.messages
+    )
+    assert sum(level == "error" for level, _ in logger.messages) == len(events)
@@ -0,0 +1,126 @@
+"""
+test_order.py validates the ordering of descriptions by OrderExtensionDescriptions and
+the provided ordering engines.
+"""
+
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+DEPENDENCIES = {
+    "a": [],
+    "b": ["a"],
+    "c": [],
+    "d": ["b", "c"],
+    "e": ["a"],
+}
+
+
+def order(descriptions, engine=None, dependencies=DEPENDENCIES):
+    return list(
+        eggstensibility.OrderExtensionDescriptions(
+            lambda description: description,
+            lambda description: dependencies[description],
+            engine,
+        )(descriptions)
+    )
+
+
+def test_default_engine_orders_deterministically():
+    assert order(["d", "e", "b", "c", "a"]) == ["c", "a", "e", "b", "d"]
+    assert order(["a", "b", "c", "d", "e"]) == ["a", "c", "b", "e", "d"]
+
+
+def test_default_engine_detects_cycles():
+    assert defaults.OrderingEngine()([[1], [2], [0], []]) == [3]
+
+    with pytest.raises(exceptions.CircularDependencyException):
+        order(["a", "b", "c", "d"], dependencies={**DEPENDENCIES, "a": ["d"]})
+
+
+def test_missing_dependencies_are_reported():
+    with pytest.raises(exceptions.MissingDependencyException) as info:
+        order(["b", "d"])
+
+    assert info.value.missing == {"b": ["a"], "d": ["c"]}
+
+
+def test_resolvers_are_called_once_per_description():
+    calls = {"identifier": 0, "dependency": 0}
+
+    def identifier_resolver(description):
+        calls["identifier"] += 1
+        return description
+
+    def dependency_resolver(description):
+        calls["dependency"] += 1
+        return iter(DEPENDENCIES[description])
+
+    ordered = eggstensibility.OrderExtensionDescriptions(
+        identifier_resolver, dependency_resolver
+    )(["d", "e", "b", "c", "a"])
+
+    assert list(ordered) == ["c", "a", "e", "b", "d"]
+    assert calls == {"identifier": 5, "dependency": 5}
+
+
+def test_duplicate_identifiers_are_ordered_once():
+    assert order(["b", "a", "b", "a"]) == ["a", "b"]
+
+
+def test_descriptions_of_multiple_resolvers_are_loaded_once():
+    modules = Path(__file__).parents[1] / "acceptance" / "default" / "modules"
+    builder = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(modules / "module_b", modules / "module_a")
+    )
+    for _ in range(2):
+        builder.add_description_resolver(defaults.DescriptionResolver())
+
+    descriptions = list(builder.build().load_extension_descriptions())
+
+    assert [description.name for description in descriptions] == [
+        "sbe.eggstensibility.external.module_a.extension",
+        "sbe.eggstensibility.external.module_b.extension",
+    ]
+
+
+def test_networkx_engine_respects_dependencies():
+    pytest.importorskip("networkx")
+
+    ordered = order(["d", "e", "b", "c", "a"], defaults.NetworkXOrderingEngine())
+
+    for description in ordered:
+        for dependency in DEPENDENCIES[description]:
+            assert ordered.index(dependency) < ordered.index(description)
+
+    assert defaults.NetworkXOrderingEngine()([[1], [0]]) == []
+
+
+def test_loading_descriptions_does_not_import_optional_features():
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from sbe import eggstensibility\n"
+        "eggstensibility.construct_builder()"
+        ".add_module_resolver(lambda path: [path])"
+        ".add_description_resolver(lambda paths: [p.name for p in paths])"
+        ".configure_identifier_resolver(lambda description: description)"
+        ".configure_dependency_resolver(lambda description: [])"
+        ".add_harvest_path(Path('a'))"
+        ".build()"
+        ".load_extension_descriptions()\n"
+        "for name in ['hashlib', 'tracemalloc', 'zipfile', 'asyncio']:\n"
+        "    assert name not in sys.modules, name\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,66 @@
+"""
+test_pipeline.py validates that the Pipeline streams batches of messages through the
+extensions in dependency order.
+"""
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+class Upper:
+    def execute(self, msg: str) -> str:
+        return msg.upper()
+
+
+class Suffix:
+    batches: list = []
+
+    def execute(self, msg: str) -> str:
+        raise AssertionError("execute_batch should be used instead")
+
+    def execute_batch(self, messages):
+        Suffix.batches.append(len(messages))
+        return [f"{msg}!" for msg in messages]
+
+
+DESCRIPTIONS = {
+    "suffix": defaults.Description("suffix", Suffix, ["upper"], "suffix"),
+    "upper": defaults.Description("upper", Upper, [], "upper"),
+}
+
+
+def load_pipeline(batch_size):
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(
+            lambda module_paths: [DESCRIPTIONS[p.name] for p in module_paths]
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(*map(Path, DESCRIPTIONS))
+        .build()
+        .load_pipeline(batch_size=batch_size)
+    )
+
+
+def test_pipeline_streams_batches_in_dependency_order():
+    Suffix.batches.clear()
+    pipeline = load_pipeline(batch_size=2)
+    consumed = []
+
+    def messages():
+        for msg in ["a", "b", "c", "d", "e"]:
+            consumed.append(msg)
+            yield msg
+
+    results = pipeline(messages())
+
+    assert [type(e) for e in pipeline.extensions] == [Upper, Suffix]
+    assert next(results) == "A!"
+    assert consumed == ["a", "b"]
+    assert list(results) == ["B!", "C!", "D!", "E!"]
+    assert Suffix.batches == [2, 2, 1]
@@ -0,0 +1,120 @@
+"""
+test_plan.py validates that loaders built from an exported load plan load the planned
+descriptions without harvesting, and fall back to a full load once the plan no longer
+matches the extension modules.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+from sbe.eggstensibility._internal.plan import LoadPlan, PlanEntry
+
+
+DEPENDENCIES = {"a": [], "b": ["a"], "c": ["a", "b"], "d": []}
+
+EXTENSION_TEMPLATE = """
+from sbe.eggstensibility import defaults
+
+description = defaults.Description(
+    "{name}", object, {dependencies!r}, extension_id="{name}"
+)
+"""
+
+
+def create_plugins(root: Path) -> None:
+    for name, dependencies in DEPENDENCIES.items():
+        plugin = root / f"plugin_{name}"
+        plugin.mkdir(parents=True)
+        (plugin / "__init__.py").touch()
+        (plugin / "extension.py").write_text(
+            EXTENSION_TEMPLATE.format(name=name, dependencies=dependencies)
+        )
+
+
+def create_loader(root: Path, plan_path: Path, harvested: list):
+    module_resolver = defaults.DirectoryModuleResolver("extension.py")
+
+    def resolve_modules(path: Path):
+        harvested.append(path)
+        return module_resolver(path)
+
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(resolve_modules)
+        .add_description_resolver(
+            defaults.DescriptionResolver(
+                external_namespace="sbe.eggstensibility.external.test_plan"
+            )
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(*sorted(root.iterdir(), reverse=True))
+        .from_plan(plan_path)
+        .build()
+    )
+
+
+def extension_ids(descriptions):
+    return [description.extension_id for description in descriptions]
+
+
+def test_plan_skips_harvesting_until_modules_change(tmp_path: Path):
+    root = tmp_path / "plugins"
+    plan_path = tmp_path / "plan.json"
+    create_plugins(root)
+
+    harvested: list = []
+    loader = create_loader(root, plan_path, harvested)
+    expected = extension_ids(loader.load_extension_descriptions())
+    assert len(harvested) == 4
+
+    loader.export_plan(plan_path)
+    assert plan_path.is_file()
+
+    harvested.clear()
+    planned_loader = create_loader(root, plan_path, harvested)
+    assert extension_ids(planned_loader.load_extension_descriptions()) == expected
+    assert extension_ids(planned_loader.load_extension_descriptions(["c"])) == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert harvested == []
+
+    # The modules are not executed again, as they are already initialized.
+    with (root / "plugin_d" / "extension.py").open("a") as f:
+        f.write("# changed\n")
+    assert extension_ids(planned_loader.load_extension_descriptions()) == expected
+    assert len(harvested) == 4
+
+
+def test_unreadable_plan_falls_back_to_a_full_load(tmp_path: Path):
+    root = tmp_path / "plugins"
+    plan_path = tmp_path / "plan.json"
+    create_plugins(root)
+    plan_path.write_text("{")
+
+    harvested: list = []
+    descriptions = create_loader(
+        root, plan_path, harvested
+    ).load_extension_descriptions()
+
+    assert sorted(extension_ids(descriptions)) == ["a", "b", "c", "d"]
+    assert len(harvested) == 4
+
+
+def test_failed_dump_keeps_the_previous_plan(tmp_path: Path):
+    plan_path = tmp_path / "plan.json"
+    entry = PlanEntry(tmp_path / "extension.py", None, 0, "a", [], None)
+    LoadPlan("configuration", [entry]).dump(plan_path)
+
+    with pytest.raises(TypeError):
+        LoadPlan("configuration", [entry._replace(extension_id=object())]).dump(
+            plan_path
+        )
+
+    assert LoadPlan.load(plan_path).entries == (entry,)
+    assert [p.name for p in tmp_path.iterdir()] == ["plan.json"]
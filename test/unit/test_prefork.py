@@ -0,0 +1,135 @@
+"""
+test_prefork.py validates that the PreforkRegistry constructs the fork-safe extensions
+before forking, shares their memory with forked processes and runs the after fork
+hooks in the forked processes.
+"""
+
+import gc
+import json
+import os
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+PAYLOAD_SIZE = 64 * 2**20
+
+DEPENDENCIES = {"payload": [], "connection": [], "client": ["connection"]}
+FORK_SAFE = {"payload", "client"}
+
+
+class Payload:
+    def __init__(self) -> None:
+        self.data = b"x" * PAYLOAD_SIZE
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+
+class Client:
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+    def after_fork(self) -> None:
+        self.pid = os.getpid()
+
+
+CONSTRUCTORS = {"payload": Payload, "connection": Connection, "client": Client}
+
+
+def load_registry():
+    descriptions = {
+        extension_id: defaults.Description(
+            extension_id, CONSTRUCTORS[extension_id], dependencies, extension_id
+        )
+        for extension_id, dependencies in DEPENDENCIES.items()
+    }
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(
+            lambda module_paths: [descriptions[p.name] for p in module_paths]
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(*map(Path, DEPENDENCIES))
+        .build()
+        .load_prefork_registry(
+            fork_safe=lambda description: description.extension_id in FORK_SAFE
+        )
+    )
+
+
+def test_prepare_fork_constructs_fork_safe_extensions():
+    registry = load_registry()
+
+    # The client is fork-safe, but depends on the connection which is not.
+    assert registry.prepare_fork(freeze=False) == ["payload"]
+    assert registry.is_constructed("payload")
+    assert not registry.is_constructed("client")
+
+
+def read_memory() -> dict:
+    memory = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                memory[name] = int(value.split()[0]) * 1024
+    return memory
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not os.path.exists("/proc/self/smaps_rollup"),
+    reason="Requires fork and /proc/self/smaps_rollup",
+)
+def test_forked_processes_share_prepared_extensions():
+    FORK_SAFE.add("connection")
+    registry = load_registry()
+    hooked_pids = []
+    registry.add_after_fork("connection", lambda c: hooked_pids.append(os.getpid()))
+
+    try:
+        assert registry.prepare_fork() == ["payload", "connection", "client"]
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                result = {
+                    "payload": len(registry["payload"].data),
+                    "client_pid": registry["client"].pid,
+                    "hooked_pids": hooked_pids,
+                    "memory": read_memory(),
+                }
+                with os.fdopen(write_fd, "w") as f:
+                    json.dump(result, f)
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            result = json.load(f)
+        os.waitpid(pid, 0)
+    finally:
+        FORK_SAFE.discard("connection")
+        gc.unfreeze()
+
+    memory = result["memory"]
+    shared = memory["Shared_Clean"] + memory["Shared_Dirty"]
+    private = memory["Private_Clean"] + memory["Private_Dirty"]
+
+    assert result["payload"] == PAYLOAD_SIZE
+    assert result["client_pid"] == pid
+    assert result["hooked_pids"] == [pid]
+    assert shared >= PAYLOAD_SIZE
+    assert private < PAYLOAD_SIZE
+    assert hooked_pids == []
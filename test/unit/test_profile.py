@@ -0,0 +1,100 @@
+"""
+test_profile.py validates that the ExtensionProfiler records the import and creation
+costs of each extension, and reports them sorted and as JSON.
+"""
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+EXTENSION = """\
+import time
+
+{imports}
+from sbe.eggstensibility.defaults import Description
+
+time.sleep({import_delay})
+payload = [object() for _ in range({objects})]
+
+
+def ctor():
+    time.sleep({create_delay})
+    return "{name}"
+
+
+description = Description(__name__, ctor, extension_id="{name}")
+"""
+
+
+@pytest.mark.parametrize(
+    "description_resolver",
+    [defaults.DescriptionResolver, defaults.StaticDescriptionResolver],
+)
+def test_profiler_records_extension_costs(create_plugin, description_resolver):
+    plugin_paths = [
+        create_plugin(
+            "slow_import",
+            EXTENSION.format(
+                name="slow_import",
+                imports="import colorsys  # noqa: F401",
+                import_delay=0.05,
+                objects=10000,
+                create_delay=0,
+            ),
+        ),
+        create_plugin(
+            "slow_create",
+            EXTENSION.format(
+                name="slow_create",
+                imports="",
+                import_delay=0,
+                objects=0,
+                create_delay=0.05,
+            ),
+        ),
+    ]
+    namespace = f"sbe.eggstensibility.test_profile_{description_resolver.__name__}"
+    profiler = eggstensibility.ExtensionProfiler()
+
+    registry = (
+        eggstensibility.construct_builder()
+        .configure_profiler(profiler)
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(description_resolver(external_namespace=namespace))
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .configure_extension_factory(defaults.ExtensionFactory())
+        .add_harvest_path(*plugin_paths)
+        .build()
+        .load_extension_registry()
+    )
+    assert dict(registry) == {"slow_import": "slow_import", "slow_create": "slow_create"}
+    profiler.stop()
+
+    report = profiler.report()
+    slow_import, slow_create = (
+        plugin_path / "extension.py" for plugin_path in plugin_paths
+    )
+
+    assert [p.module_path for p in report] == [slow_import, slow_create]
+    assert report.sorted_by("import_wall_time")[0].module_path == slow_import
+    assert report[0].import_wall_time >= 0.05
+    assert report[0].allocated_bytes > report[1].allocated_bytes
+    # The parent package and the extension module.
+    assert report[0].new_modules >= 2
+    assert report[1].create_time >= 0.05
+    # The static resolver defers the import until the extension is created.
+    if description_resolver is defaults.DescriptionResolver:
+        assert report.sorted_by("create_time")[0].module_path == slow_create
+
+    content = json.loads(report.to_json())
+    assert content["extensions"][0]["module_path"] == str(slow_import)
+
+    with pytest.raises(ValueError):
+        report.sorted_by("module_path")
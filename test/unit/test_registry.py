@@ -0,0 +1,106 @@
+"""
+test_registry.py validates that the ExtensionRegistry lazily constructs extensions,
+including their dependencies, exactly once.
+"""
+
+import threading
+import time
+
+from collections import Counter
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults, exceptions
+
+
+def create_descriptions(constructed: Counter, dependencies):
+    def create_ctor(extension_id):
+        def ctor():
+            time.sleep(0.01)
+            constructed[extension_id] += 1
+            return f"extension {extension_id}"
+
+        return ctor
+
+    return [
+        defaults.Description(
+            extension_id,
+            create_ctor(extension_id),
+            extension_dependencies,
+            extension_id=extension_id,
+        )
+        for extension_id, extension_dependencies in dependencies.items()
+    ]
+
+
+def create_registry(descriptions):
+    return eggstensibility.ExtensionRegistry(
+        descriptions,
+        defaults.ResolveIdentifier(),
+        defaults.ResolveDependency(),
+        defaults.ExtensionFactory(),
+    )
+
+
+def test_registry_constructs_dependencies_on_first_access():
+    constructed: Counter = Counter()
+    registry = create_registry(
+        create_descriptions(
+            constructed, {"a": [], "b": ["a"], "c": ["b"], "unused": ["a"]}
+        )
+    )
+
+    assert list(registry) == ["a", "b", "c", "unused"]
+    assert not constructed
+
+    assert registry["c"] == "extension c"
+    assert constructed == Counter({"a": 1, "b": 1, "c": 1})
+    assert registry.is_constructed("b")
+    assert not registry.is_constructed("unused")
+
+    assert registry["b"] == "extension b"
+    assert constructed == Counter({"a": 1, "b": 1, "c": 1})
+
+    with pytest.raises(KeyError):
+        registry["missing"]
+
+
+def test_registry_reports_missing_dependencies():
+    constructed: Counter = Counter()
+
+    for dependencies in ({"b": ["a"], "a": []}, {"b": ["missing"]}):
+        with pytest.raises(exceptions.MissingDependencyException) as info:
+            create_registry(create_descriptions(constructed, dependencies))
+
+        assert info.value.missing == {"b": dependencies["b"]}
+
+
+def test_registry_constructs_once_across_threads():
+    constructed: Counter = Counter()
+    registry = create_registry(
+        create_descriptions(constructed, {"a": [], "b": ["a"], "c": ["a", "b"]})
+    )
+
+    threads = [
+        threading.Thread(target=registry.__getitem__, args=(extension_id,))
+        for extension_id in ["c", "b", "a"] * 8
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert constructed == Counter({"a": 1, "b": 1, "c": 1})
+
+
+def test_loader_requires_extension_factory_for_registry():
+    loader = (
+        eggstensibility.construct_builder()
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .build()
+    )
+
+    with pytest.raises(exceptions.IncompleteLoaderConfigurationException):
+        loader.load_extension_registry()
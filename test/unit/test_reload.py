@@ -0,0 +1,135 @@
+"""
+test_reload.py validates that the HotReloader only reloads changed extension modules and
+the modules depending on them, and swaps in a new generation.
+"""
+
+import sys
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+NAMESPACE = "test_reload_external"
+
+EXTENSION = """\
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return "{value}"
+
+
+description = Description(__name__, ctor, {dependencies}, extension_id="{name}")
+"""
+
+
+def create_reloader(namespace: str, *plugin_paths: Path):
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.DescriptionResolver("description", namespace)
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(*plugin_paths)
+        .build()
+        .create_hot_reloader(poll_interval=3600)
+    )
+
+
+def write_extension(root: Path, name: str, value: str, dependencies="[]"):
+    plugin_path = root / name
+    plugin_path.mkdir(exist_ok=True)
+    (plugin_path / "__init__.py").touch()
+    (plugin_path / "extension.py").write_text(
+        EXTENSION.format(name=name, value=value, dependencies=dependencies)
+    )
+    return plugin_path
+
+
+def extension_module(name: str):
+    return sys.modules[f"{NAMESPACE}.{name}.extension"]
+
+
+def test_reloader_reloads_changed_modules_and_dependents(tmp_path: Path):
+    plugin_paths = [
+        write_extension(tmp_path, "b", "b", '["a"]'),
+        write_extension(tmp_path, "a", "a"),
+        write_extension(tmp_path, "c", "c"),
+    ]
+
+    reloader = create_reloader(NAMESPACE, *plugin_paths)
+
+    initial = reloader.generation
+    initial_modules = {name: extension_module(name) for name in "abc"}
+
+    assert [d.extension_id for d in initial.descriptions] == ["a", "c", "b"]
+    assert not reloader.poll()
+
+    write_extension(tmp_path, "a", "a, but reloaded")
+
+    assert reloader.poll()
+    reloaded = reloader.generation
+
+    assert reloaded.number == initial.number + 1
+    # The unaffected description retains its order, the reloaded ones follow it.
+    assert [d.extension_id for d in reloaded.descriptions] == ["c", "a", "b"]
+    assert reloaded.descriptions[1].create_extension() == "a, but reloaded"
+    assert initial.descriptions[0].create_extension() == "a"
+
+    assert extension_module("a") is not initial_modules["a"]
+    assert extension_module("b") is not initial_modules["b"]
+    assert extension_module("c") is initial_modules["c"]
+    assert reloaded.descriptions[0] is initial.descriptions[1]
+
+
+def test_reloader_keeps_generation_on_inconsistent_change(tmp_path: Path):
+    plugin_paths = [
+        write_extension(tmp_path, "a", "a"),
+        write_extension(tmp_path, "c", "c"),
+    ]
+
+    with create_reloader(f"{NAMESPACE}_inconsistent", *plugin_paths) as reloader:
+        initial = reloader.generation
+        write_extension(tmp_path, "a", "a, but reloaded", '["missing"]')
+
+        assert not reloader.poll()
+        assert reloader.generation is initial
+
+        # The failed change is reloaded again, once another module provides the
+        # missing dependency.
+        write_extension(tmp_path, "c", "c").joinpath("extension.py").write_text(
+            EXTENSION.format(name="missing", value="c", dependencies="[]")
+        )
+
+        assert reloader.poll()
+        assert [d.extension_id for d in reloader.generation.descriptions] == [
+            "missing",
+            "a",
+        ]
+        assert reloader.generation.descriptions[1].create_extension() == (
+            "a, but reloaded"
+        )
+
+
+def test_reloader_reloads_changed_submodules(tmp_path: Path):
+    plugin_path = tmp_path / "a"
+    plugin_path.mkdir()
+    (plugin_path / "__init__.py").touch()
+    (plugin_path / "_impl.py").write_text('VALUE = "a"\n')
+    (plugin_path / "extension.py").write_text(
+        EXTENSION.format(name="a", value="a", dependencies="[]").replace(
+            'return "a"', "from ._impl import VALUE\n    return VALUE"
+        )
+    )
+
+    reloader = create_reloader(f"{NAMESPACE}_submodules", plugin_path)
+    assert reloader.generation.descriptions[0].create_extension() == "a"
+
+    (plugin_path / "_impl.py").write_text('VALUE = "a, but reloaded"\n')
+
+    assert reloader.poll()
+    assert reloader.generation.descriptions[0].create_extension() == "a, but reloaded"
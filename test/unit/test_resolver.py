@@ -0,0 +1,47 @@
+"""
+test_resolver.py validates the default module resolvers.
+"""
+
+from pathlib import Path
+
+from sbe.eggstensibility import defaults
+
+
+def create_package(path: Path, *modules: str) -> Path:
+    path.mkdir(parents=True)
+    (path / "__init__.py").touch()
+    for module in modules:
+        (path / module).touch()
+    return path
+
+
+def test_recursive_resolver_discovers_nested_packages(tmp_path: Path):
+    create_package(tmp_path / "b_plugin", "extension.py")
+    create_package(tmp_path / "a_group" / "nested", "extension.py", "other.py")
+    create_package(tmp_path / "a_group" / "nested" / "deeper", "extension.py")
+    create_package(tmp_path / ".hidden", "extension.py")
+    create_package(tmp_path / "__pycache__", "extension.py")
+    create_package(tmp_path / "skipped", "extension.py")
+    (tmp_path / "not_a_package").mkdir()
+    (tmp_path / "not_a_package" / "extension.py").touch()
+
+    resolver = defaults.RecursiveModuleResolver(ignore_patterns=["skip*"])
+    module_paths = list(resolver(tmp_path))
+
+    root = tmp_path.resolve()
+    assert module_paths == [
+        root / "a_group" / "nested" / "extension.py",
+        root / "a_group" / "nested" / "deeper" / "extension.py",
+        root / "b_plugin" / "extension.py",
+    ]
+
+
+def test_recursive_resolver_respects_max_depth_and_pattern(tmp_path: Path):
+    create_package(tmp_path / "plugin", "ext_a.py", "ext_b.py", "extension.py")
+    create_package(tmp_path / "group" / "plugin", "ext_c.py")
+
+    resolver = defaults.RecursiveModuleResolver("ext_*.py", max_depth=1)
+    module_paths = list(resolver(tmp_path))
+
+    root = tmp_path.resolve()
+    assert module_paths == [root / "plugin" / "ext_a.py", root / "plugin" / "ext_b.py"]
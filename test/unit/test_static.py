@@ -0,0 +1,88 @@
+"""
+test_static.py validates that the StaticDescriptionResolver retrieves descriptions
+without executing the extension modules, and falls back to executing modules it cannot
+analyse.
+"""
+
+from pathlib import Path
+
+from sbe import eggstensibility
+from sbe.eggstensibility import defaults
+
+
+MARK_EXECUTED = """\
+from pathlib import Path
+Path(__file__).with_suffix(".executed").touch()
+"""
+
+STATIC_EXTENSION = (
+    MARK_EXECUTED
+    + """
+from sbe.eggstensibility import defaults as d
+
+
+def ctor():
+    return "extension {name}"
+
+
+description = d.Description(__name__, ctor, {dependencies}, extension_id="{name}")
+"""
+)
+
+DYNAMIC_EXTENSION = (
+    MARK_EXECUTED
+    + """
+from sbe.eggstensibility.defaults import Description
+
+
+def ctor():
+    return "extension {name}"
+
+
+description = Description("{name}", ctor, lambda: ["a"], extension_id="{name}")
+"""
+)
+
+
+def is_executed(plugin_path: Path) -> bool:
+    return (plugin_path / "extension.executed").is_file()
+
+
+def test_static_resolver_defers_module_execution(create_plugin):
+    plugin_b = create_plugin(
+        "b",
+        STATIC_EXTENSION.format(name="b", dependencies='["a"]'),
+        init=MARK_EXECUTED,
+    )
+    plugin_c = create_plugin(
+        "c", DYNAMIC_EXTENSION.format(name="c"), init=MARK_EXECUTED
+    )
+    plugin_a = create_plugin(
+        "a",
+        STATIC_EXTENSION.format(name="a", dependencies="None"),
+        init=MARK_EXECUTED,
+    )
+
+    descriptions = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(defaults.DirectoryModuleResolver("extension.py"))
+        .add_description_resolver(
+            defaults.StaticDescriptionResolver("description", "test_static_external")
+        )
+        .configure_identifier_resolver(defaults.ResolveIdentifier())
+        .configure_dependency_resolver(defaults.ResolveDependency())
+        .add_harvest_path(plugin_b, plugin_c, plugin_a)
+        .build()
+        .load_extension_descriptions()
+    )
+
+    assert [d.extension_id for d in descriptions] == ["a", "b", "c"]
+    assert descriptions[0].name == "test_static_external.a.extension"
+    assert not is_executed(plugin_a)
+    assert not is_executed(plugin_b)
+    assert is_executed(plugin_c)
+
+    assert descriptions[1].create_extension() == "extension b"
+    assert is_executed(plugin_b)
+    assert (plugin_b / "__init__.executed").is_file()
+    assert not is_executed(plugin_a)
@@ -0,0 +1,73 @@
+"""
+test_stream.py validates that streamed descriptions are yielded as soon as their
+dependencies have been yielded, and that the unresolved descriptions are reported once
+the stream is exhausted.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import exceptions
+
+
+def create_loader(dependencies):
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(lambda module_paths: [p.name for p in module_paths])
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: dependencies[description])
+        .build()
+    )
+
+
+def test_descriptions_are_yielded_once_their_dependencies_are():
+    loader = create_loader({"a": [], "b": ["a", "c"], "c": ["a"], "d": []})
+    harvested = []
+
+    def harvest_paths():
+        for name in ["b", "a", "c", "d"]:
+            harvested.append(name)
+            yield Path(name)
+
+    stream = loader.stream_extension_descriptions(harvest_paths())
+
+    assert next(stream) == "a"
+    assert harvested == ["b", "a"]
+    assert list(stream) == ["c", "b", "d"]
+
+
+def test_unresolved_descriptions_are_reported_at_the_end():
+    loader = create_loader({"a": [], "b": ["missing", "a"], "c": ["b"]})
+    stream = loader.stream_extension_descriptions(map(Path, ["c", "b", "a"]))
+
+    assert next(stream) == "a"
+    with pytest.raises(exceptions.MissingDependencyException) as info:
+        next(stream)
+    assert info.value.missing == {"b": ["missing"]}
+
+    loader = create_loader({"a": ["b"], "b": ["a"], "c": []})
+    stream = loader.stream_extension_descriptions(map(Path, ["a", "b", "c"]))
+
+    assert next(stream) == "c"
+    with pytest.raises(exceptions.CircularDependencyException) as cycle:
+        next(stream)
+    assert cycle.value.descriptions == ["a", "b"]
+
+
+def test_duplicate_descriptions_are_yielded_once():
+    loader = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(lambda module_paths: [p.name for p in module_paths])
+        .add_description_resolver(lambda module_paths: [p.name for p in module_paths])
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(
+            lambda description: {"b": ["a"]}.get(description, [])
+        )
+        .build()
+    )
+
+    assert list(loader.stream_extension_descriptions(map(Path, "ba"))) == ["a", "b"]
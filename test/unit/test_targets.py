@@ -0,0 +1,66 @@
+"""
+test_targets.py validates that loading specific targets only returns the targets and
+their transitive dependencies.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sbe import eggstensibility
+from sbe.eggstensibility import exceptions
+
+
+DEPENDENCIES = {
+    "a": [],
+    "b": ["a"],
+    "c": ["b"],
+    "d": ["a"],
+    "broken": ["missing"],
+}
+
+
+def create_loader():
+    return (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(lambda module_paths: [p.name for p in module_paths])
+        .configure_identifier_resolver(lambda description: description)
+        .configure_dependency_resolver(lambda description: DEPENDENCIES[description])
+        .add_harvest_path(*(Path(name) for name in ["d", "c", "broken", "b", "a"]))
+        .build()
+    )
+
+
+def test_targets_select_transitive_dependencies():
+    loader = create_loader()
+
+    assert loader.load_extension_descriptions(targets=["c"]) == ["a", "b", "c"]
+    assert loader.load_extension_descriptions(targets=["d", "b"]) == ["a", "d", "b"]
+
+
+def test_targets_report_missing_extensions():
+    loader = create_loader()
+
+    with pytest.raises(exceptions.MissingDependencyException):
+        loader.load_extension_descriptions(targets=["unknown"])
+
+    with pytest.raises(exceptions.MissingDependencyException):
+        loader.load_extension_descriptions(targets=["broken"])
+
+
+def test_targets_select_the_first_description_of_an_identifier():
+    loader = (
+        eggstensibility.construct_builder()
+        .add_module_resolver(lambda path: [path])
+        .add_description_resolver(
+            lambda module_paths: [(p.name, n) for p in module_paths for n in (1, 2)]
+        )
+        .configure_identifier_resolver(lambda description: description[0])
+        .configure_dependency_resolver(lambda description: [])
+        .add_harvest_path(Path("x"))
+        .build()
+    )
+
+    assert loader.load_extension_descriptions() == [("x", 1)]
+    assert loader.load_extension_descriptions(targets=["x"]) == [("x", 1)]